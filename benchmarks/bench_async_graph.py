@@ -0,0 +1,109 @@
+"""
+Concurrency benchmark for the MCP + web-search AgenticRAG graph.
+
+Runs the real LangGraph workflow with a stub chat model (fixed latency per
+call) and stub MCP tools, then measures requests/second as the number of
+concurrent chats grows. With async nodes throughput scales with concurrency;
+``--blocking`` emulates the old sync ``chain.invoke`` behaviour, where every
+LLM call stalls the event loop and throughput stays flat.
+
+    python benchmarks/bench_async_graph.py --latency 0.2 --levels 1 2 4 8 16 32
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the project root and package dir to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from workflow.agentic_workflow_with_mcp_websearch import AgenticRAG
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that answers 'yes' after a fixed delay."""
+
+    latency: float = 0.2
+    blocking: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _result(self) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="yes, stub answer"))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return self._result()
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.blocking:
+            time.sleep(self.latency)  # what a sync invoke inside an async node does
+        else:
+            await asyncio.sleep(self.latency)
+        return self._result()
+
+
+class StubTool:
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+
+    async def ainvoke(self, payload: dict) -> str:
+        await asyncio.sleep(self.latency)
+        return f"Title: Stub product\nPrice: 1\nRating: 5\nReviews:\nresult for {payload['query']}"
+
+
+class StubRetriever:
+    vstore = object()
+
+    def load_retriever(self):
+        return None
+
+
+async def run_level(engine: AgenticRAG, concurrency: int, rounds: int) -> float:
+    async def one():
+        thread_id = uuid.uuid4().hex
+        await engine.run("What is the price of iPhone 16?", thread_id=thread_id)
+        await engine.release_thread(thread_id)
+
+    total = concurrency * rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+async def main(args):
+    llm = StubChatModel(latency=args.latency, blocking=args.blocking)
+    tools = [StubTool("get_product_info", args.tool_latency), StubTool("web_search", args.tool_latency)]
+    engine = AgenticRAG(llm=llm, retriever_obj=StubRetriever(), mcp_tools=tools)
+
+    mode = "blocking (sync invoke)" if args.blocking else "async (ainvoke)"
+    print(f"mode={mode} llm_latency={args.latency}s tool_latency={args.tool_latency}s")
+    print(f"{'concurrency':>12} {'req/s':>10} {'speedup':>10}")
+    baseline = None
+    for level in args.levels:
+        rps = await run_level(engine, level, args.rounds)
+        baseline = baseline or rps
+        print(f"{level:>12} {rps:>10.2f} {rps / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.2, help="stub LLM latency per call (s)")
+    parser.add_argument("--tool-latency", type=float, default=0.05, help="stub MCP tool latency (s)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--blocking", action="store_true", help="emulate sync LLM calls")
+    asyncio.run(main(parser.parse_args()))
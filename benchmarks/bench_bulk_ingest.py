@@ -0,0 +1,134 @@
+"""
+Benchmark: sequential vector store writes vs the pipelined bulk writer.
+
+Uses a stand-in store (LocalVectorStore with an in-memory index) whose
+writes sleep ``--write-latency`` seconds to mimic a remote round trip, and a
+fake embedding model that sleeps ``--embed-latency`` seconds per call behind
+CachedEmbeddings. ``sequential`` reproduces the previous store_in_vector_db
+loop (embed + write one batch at a time). ``pipelined`` runs PipelinedWriter
+at each ``--concurrency`` level, optionally failing ``--failure-rate`` of the
+writes to exercise retries.
+
+    python benchmarks/bench_bulk_ingest.py --docs 5000 --concurrency 1 2 4 8
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.etl.bulk_writer import PipelinedWriter
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+from prod_assistant.utils.embedding_cache import CachedEmbeddings
+
+
+class SlowHashEmbeddings(Embeddings):
+    def __init__(self, latency: float, dim: int = 64):
+        self.latency = latency
+        self.dim = dim
+
+    def _vector(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [digest[i % len(digest)] / 255.0 for i in range(self.dim)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.latency)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class SlowStore(LocalVectorStore):
+    """In-memory LocalVectorStore whose writes cost a simulated round trip."""
+
+    def __init__(self, embedding, latency: float, failure_rate: float = 0.0):
+        super().__init__(embedding)
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    def add_texts(self, texts, metadatas=None, *, ids=None, **kwargs):
+        texts = list(texts)
+        self._embedding.embed_documents(texts)  # what a remote store does before the upload
+        time.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError("simulated transient store error")
+        return super().add_texts(texts, metadatas, ids=ids)
+
+
+def make_batches(docs: int, batch_size: int, run: str):
+    batches = []
+    for start in range(0, docs, batch_size):
+        batch = [
+            Document(page_content=f"{run} review {i}: good battery, decent camera", metadata={"product_id": f"p{i}"})
+            for i in range(start, min(start + batch_size, docs))
+        ]
+        batches.append((batch, [f"p{i}" for i in range(start, start + len(batch))]))
+    return batches
+
+
+def embeddings_for(tmp: str, name: str, latency: float) -> CachedEmbeddings:
+    return CachedEmbeddings(SlowHashEmbeddings(latency), model_name=name, path=os.path.join(tmp, f"{name}.sqlite"))
+
+
+def run_sequential(args, tmp: str) -> float:
+    embeddings = embeddings_for(tmp, "sequential", args.embed_latency)
+    store = SlowStore(embeddings, args.write_latency)
+    start = time.perf_counter()
+    for docs, ids in make_batches(args.docs, args.batch_size, "sequential"):
+        store.add_documents(docs, ids=ids)
+    return time.perf_counter() - start
+
+
+def run_pipelined(args, tmp: str, concurrency: int):
+    name = f"pipelined-{concurrency}"
+    embeddings = embeddings_for(tmp, name, args.embed_latency)
+    store = SlowStore(embeddings, args.write_latency, args.failure_rate)
+    writer = PipelinedWriter(
+        store,
+        embeddings,
+        concurrency=concurrency,
+        max_retries=5,
+        retry_backoff_seconds=0.01,
+        checkpoint_path=os.path.join(tmp, f"{name}.checkpoint.json"),
+    )
+    start = time.perf_counter()
+    written = writer.write(make_batches(args.docs, args.batch_size, name))
+    elapsed = time.perf_counter() - start
+    assert len(store) == args.docs == len(written)
+    return elapsed, writer.retries
+
+
+def main(args):
+    batches = -(-args.docs // args.batch_size)
+    print(f"{args.docs} docs in {batches} batches, embed {args.embed_latency * 1000:.0f} ms/call, "
+          f"write {args.write_latency * 1000:.0f} ms/batch, failure rate {args.failure_rate:.0%}\n")
+    print(f"{'mode':>14} {'seconds':>9} {'docs/s':>9} {'retries':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        elapsed = run_sequential(args, tmp)
+        print(f"{'sequential':>14} {elapsed:>9.2f} {args.docs / elapsed:>9.0f} {'-':>8}")
+        for concurrency in args.concurrency:
+            elapsed, retries = run_pipelined(args, tmp, concurrency)
+            print(f"{f'pipelined x{concurrency}':>14} {elapsed:>9.2f} {args.docs / elapsed:>9.0f} {retries:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=250)
+    parser.add_argument("--embed-latency", type=float, default=0.05)
+    parser.add_argument("--write-latency", type=float, default=0.1)
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    main(parser.parse_args())
@@ -0,0 +1,100 @@
+"""
+Benchmark: full CSV rewrite vs the append-only Parquet catalog.
+
+Simulates ``--runs`` daily scrape runs of ``--rows`` products each (one in
+``--overlap`` products re-scraped from the previous day).
+
+- ``csv``: every run rewrites the whole catalog (save_to_csv with merge), and
+  ingestion re-parses all of it (DataIngestion.iter_csv_documents).
+- ``catalog``: every run appends one partition (CatalogStore.append);
+  ingestion of the last run reads only products scraped since that day, and
+  an analytics query projects a single column.
+
+    python benchmarks/bench_catalog_store.py --runs 30 --rows 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from prod_assistant.etl.catalog_store import CatalogStore
+from prod_assistant.etl.data_ingestion import DataIngestion
+from prod_assistant.etl.data_scrapper import FlipkartScraper
+
+REVIEW = "Battery lasts a full day, camera is sharp in daylight, a little warm while gaming. " * 3
+
+
+def run_rows(run: int, rows: int, overlap: float):
+    first = int(run * rows * (1 - overlap))
+    return [
+        [f"itm{i:012x}", f"Phone model {i}", "4.3", f"{1000 + i:,}", f"₹{15000 + run * 10 + i % 500:,}", REVIEW + str(run)]
+        for i in range(first, first + rows)
+    ]
+
+
+def dir_size(path: str) -> int:
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+class CsvWriter:
+    save_to_csv = FlipkartScraper.save_to_csv
+    output_dir = ""
+
+
+def bench_csv(args, tmp: str):
+    path = os.path.join(tmp, "product_reviews.csv")
+    writer = CsvWriter()
+    start = time.perf_counter()
+    for run in range(args.runs):
+        writer.save_to_csv(run_rows(run, args.rows, args.overlap), path, merge=True)
+    write_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    docs = sum(len(batch) for batch in DataIngestion.iter_csv_documents(path))
+    read_seconds = time.perf_counter() - start
+    return write_seconds, read_seconds, docs, None, os.path.getsize(path)
+
+
+def bench_catalog(args, tmp: str):
+    catalog = CatalogStore(os.path.join(tmp, "catalog"))
+    day0 = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    start = time.perf_counter()
+    for run in range(args.runs):
+        catalog.append(run_rows(run, args.rows, args.overlap), scraped_at=day0 + timedelta(days=run))
+    write_seconds = time.perf_counter() - start
+
+    since = day0 + timedelta(days=args.runs - 1)
+    start = time.perf_counter()
+    docs = sum(len(DataIngestion.documents_from_frame(frame)) for frame in catalog.iter_latest_frames(since))
+    read_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prices = catalog.read(columns=["price"]).num_rows
+    analytics_seconds = time.perf_counter() - start
+    assert prices == args.runs * args.rows
+    return write_seconds, read_seconds, docs, analytics_seconds, dir_size(catalog.root)
+
+
+def main(args):
+    print(f"{args.runs} runs x {args.rows} products, {args.overlap:.0%} re-scraped per run\n")
+    print(f"{'store':>8} {'all writes s':>13} {'ingest read s':>14} {'docs read':>10} {'1-column scan s':>16} {'MB on disk':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, bench in (("csv", bench_csv), ("catalog", bench_catalog)):
+            write_s, read_s, docs, analytics_s, size = bench(args, tmp)
+            analytics = f"{analytics_s:.3f}" if analytics_s is not None else "-"
+            print(f"{name:>8} {write_s:>13.2f} {read_s:>14.3f} {docs:>10} {analytics:>16} {size / 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--overlap", type=float, default=0.2)
+    main(parser.parse_args())
@@ -0,0 +1,121 @@
+"""
+Benchmark: HTTP-first scraping path against the saved product page fixture.
+
+1. Offline check: parses ``flipkart_product_page.html`` with
+   page_parsers.parse_product_page and verifies the server-rendered fields.
+2. Parse cost per page for the HTTP path.
+3. Fetch throughput against a local server replaying the fixture with
+   ``--latency`` ms of simulated server time: a fresh client per page (no
+   connection reuse, one at a time) vs the pooled HttpFetcher.
+
+Chrome is not involved; compare the numbers with the per-phase report from
+FlipkartScraper.timing_report() on a real scrape.
+
+    python benchmarks/bench_http_first.py --pages 50 --latency 150
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+import httpx
+
+from prod_assistant.etl.http_fetcher import DEFAULT_HEADERS, HttpFetcher
+from prod_assistant.etl.page_parsers import parse_product_page
+
+FIXTURE = project_root / "flipkart_product_page.html"
+
+EXPECTED = {
+    "product_id": "itmc2e910b4d0b1c",
+    "title": "Apple iPhone 16 (Pink, 128 GB)",
+    "rating": "4.6",
+    "total_reviews": "6,023",
+    "price": "₹69,900",
+}
+
+
+def check_fixture(html: str):
+    page = parse_product_page(html, review_count=3)
+    for field, expected in EXPECTED.items():
+        assert page[field] == expected, f"{field}: {page[field]!r} != {expected!r}"
+    print("Fixture fields parsed from server-rendered HTML:")
+    for field in EXPECTED:
+        print(f"  {field:<14} {page[field]}")
+    print(f"  {'reviews':<14} {len(page['reviews'])} found\n")
+
+
+def bench_parse(html: str, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse_product_page(html, review_count=3)
+    per_page = (time.perf_counter() - start) / iterations
+    print(f"parse_product_page: {per_page * 1000:.1f} ms/page ({len(html) / 1024:.0f} KB)\n")
+
+
+def serve(html: bytes, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(html)))
+            self.end_headers()
+            self.wfile.write(html)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_fetch(html: str, pages: int, latency: float, connections: int):
+    server = serve(html.encode("utf-8"), latency)
+    urls = [f"http://127.0.0.1:{server.server_port}/p/itm{i:013x}" for i in range(pages)]
+
+    start = time.perf_counter()
+    for url in urls:
+        with httpx.Client(headers=DEFAULT_HEADERS) as client:
+            assert client.get(url).status_code == 200
+    fresh = time.perf_counter() - start
+
+    fetcher = HttpFetcher(max_connections=connections)
+    fetcher.fetch(urls[0])  # open the pool
+    start = time.perf_counter()
+    results = fetcher.fetch_many(urls)
+    pooled = time.perf_counter() - start
+    assert all(results)
+    fetcher.close()
+    server.shutdown()
+
+    print(f"{'mode':>22} {'seconds':>9} {'pages/s':>9}")
+    print(f"{'fresh client, serial':>22} {fresh:>9.2f} {pages / fresh:>9.1f}")
+    print(f"{f'pooled x{connections}':>22} {pooled:>9.2f} {pages / pooled:>9.1f}")
+
+
+def main(args):
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # one INFO line per request otherwise
+    html = FIXTURE.read_text(encoding="utf-8")
+    check_fixture(html)
+    bench_parse(html, args.iterations)
+    bench_fetch(html, args.pages, args.latency / 1000, args.connections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=150, help="simulated server time per page, ms")
+    parser.add_argument("--connections", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,102 @@
+"""
+Benchmark: Assistant-node intent routing, keyword check vs IntentRouter.
+
+Classifies a labelled set of held-out shopping / web / chit-chat queries
+(none of them are training seeds) two ways:
+
+- ``keywords``: the previous check, retrieve if the query contains
+  "price" / "review" / "product", otherwise answer directly with the LLM
+- ``router``: IntentRouter's local classifier; decisions below the
+  confidence threshold are counted as LLM fallbacks
+
+Reports accuracy, microseconds per decision and how many queries would
+still need an LLM call to be routed.
+
+    python benchmarks/bench_intent_router.py --repeats 200
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root and package dir to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
+
+from workflow.intent_router import ANSWER, RETRIEVE, WEB_SEARCH, IntentRouter
+
+LABELLED = [
+    ("What is the price of iPhone 16?", RETRIEVE),
+    ("Can you suggest good budget iPhone under 1,00,000 INR?", RETRIEVE),
+    ("compare iPhone 16 vs 15", RETRIEVE),
+    ("is the boat rockerz 450 good for bass", RETRIEVE),
+    ("which earphones have the best battery", RETRIEVE),
+    ("samsung s24 ultra reviews", RETRIEVE),
+    ("best gaming laptop under 80k", RETRIEVE),
+    ("how good is the pixel 8 camera in low light", RETRIEVE),
+    ("recommend a fitness band with spo2", RETRIEVE),
+    ("which is cheaper, galaxy a55 or nothing phone 2a", RETRIEVE),
+    ("when is the next apple event", WEB_SEARCH),
+    ("latest news on oneplus 13 launch", WEB_SEARCH),
+    ("are there any discounts today on flipkart", WEB_SEARCH),
+    ("what are the upcoming phones this month", WEB_SEARCH),
+    ("any sale happening right now", WEB_SEARCH),
+    ("hey", ANSWER),
+    ("thanks!", ANSWER),
+    ("what can you help me with", ANSWER),
+    ("good night", ANSWER),
+    ("who made you", ANSWER),
+    ("what does ois mean", ANSWER),
+]
+
+
+def keyword_route(query: str) -> str:
+    return RETRIEVE if any(word in query.lower() for word in ["price", "review", "product"]) else ANSWER
+
+
+def bench(name: str, classify, repeats: int, threshold: float = None):
+    correct = fallbacks = 0
+    misses = []
+    for query, label in LABELLED:
+        intent, confidence = classify(query)
+        if threshold is not None and confidence < threshold:
+            fallbacks += 1
+        elif intent == label:
+            correct += 1
+        else:
+            misses.append(f"{query!r} -> {intent}")
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query, _ in LABELLED:
+            classify(query)
+    micros = (time.perf_counter() - start) / (repeats * len(LABELLED)) * 1e6
+
+    decided = len(LABELLED) - fallbacks
+    print(f"{name:>9} {correct}/{decided:<6} {micros:>9.1f} {fallbacks:>9}")
+    for miss in misses:
+        print(f"{'':>12}miss: {miss}")
+
+
+def main(args):
+    start = time.perf_counter()
+    router = IntentRouter(confidence_threshold=args.threshold)
+    print(f"router trained in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    print(f"{'route':>9} {'correct':<8} {'us/query':>9} {'LLM calls':>9}")
+    bench("keywords", lambda q: (keyword_route(q), 1.0), args.repeats)
+
+    def classify(query):
+        decision = router.classify(query)
+        return decision.intent, decision.confidence
+
+    bench("router", classify, args.repeats, threshold=args.threshold)
+    print("\nkeyword 'answer' decisions each cost a full LLM answer even when the query needed product data")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.55)
+    main(parser.parse_args())
@@ -0,0 +1,141 @@
+"""
+Benchmark: MCP tool-call overhead, per-call sessions vs MCPSessionManager.
+
+Starts a stub MCP server (this script with ``--serve``) whose
+``get_product_info`` tool sleeps ``--work-ms`` and returns a fixed string,
+then calls it ``--calls`` times three ways:
+
+- ``per-call``: the previous client path, ``MultiServerMCPClient.get_tools()``
+  tools invoked via ``asyncio.run`` from sync code. Every call gets a new
+  event loop and a new MCP session (a new subprocess for stdio).
+- ``persistent``: ``MCPSessionManager.call`` over one long-lived session
+- ``concurrent``: ``--concurrency`` callers sharing that session through
+  ``acall``, with their requests multiplexed over it
+
+Reports ms per call and the overhead on top of the tool's own work.
+
+    python benchmarks/bench_mcp_sessions.py --transport stdio --calls 50
+    python benchmarks/bench_mcp_sessions.py --transport streamable_http --calls 200
+"""
+import argparse
+import asyncio
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+
+def serve(args):
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("bench", port=args.port, log_level="WARNING")
+
+    @mcp.tool()
+    async def get_product_info(query: str) -> str:
+        """Stub retriever: fixed latency, fixed answer."""
+        await asyncio.sleep(args.work_ms / 1000)
+        return f"Title: Stub product\nPrice: 1\nRating: 5\nReviews:\nresult for {query}"
+
+    mcp.run(transport=args.transport.replace("_", "-"))
+
+
+def connection(args) -> dict:
+    if args.transport == "stdio":
+        return {
+            "transport": "stdio",
+            "command": sys.executable,
+            "args": [__file__, "--serve", "--transport", "stdio", "--work-ms", str(args.work_ms)],
+        }
+    return {"transport": "streamable_http", "url": f"http://127.0.0.1:{args.port}/mcp"}
+
+
+def start_http_server(args) -> subprocess.Popen:
+    import httpx
+
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--transport", "streamable_http",
+         "--port", str(args.port), "--work-ms", str(args.work_ms)],
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/mcp", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("stub MCP server did not start")
+
+
+def report(name: str, seconds: float, calls: int, work_ms: float):
+    per_call = seconds / calls * 1000
+    print(f"{name:>11} {per_call:>9.2f} {max(per_call - work_ms, 0):>12.2f} {calls / seconds:>9.1f}")
+
+
+def bench_per_call(conn: dict, args):
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
+    tools = asyncio.run(MultiServerMCPClient({"bench": conn}).get_tools())
+    tool = next(t for t in tools if t.name == "get_product_info")
+    start = time.perf_counter()
+    for i in range(args.calls):
+        asyncio.run(tool.ainvoke({"query": f"q{i}"}))
+    report("per-call", time.perf_counter() - start, args.calls, args.work_ms)
+
+
+def bench_persistent(conn: dict, args):
+    from prod_assistant.mcp_servers.session_manager import MCPSessionManager
+
+    manager = MCPSessionManager({"bench": conn})
+    tool = next(t for t in manager.get_tools() if t.name == "get_product_info")  # opens the session
+    start = time.perf_counter()
+    for i in range(args.calls):
+        tool.invoke({"query": f"q{i}"})
+    report("persistent", time.perf_counter() - start, args.calls, args.work_ms)
+
+    async def concurrent():
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one(i: int):
+            async with semaphore:
+                return await tool.ainvoke({"query": f"q{i}"})
+
+        await asyncio.gather(*(one(i) for i in range(args.calls)))
+
+    start = time.perf_counter()
+    asyncio.run(concurrent())
+    report("concurrent", time.perf_counter() - start, args.calls, args.work_ms / args.concurrency)
+    print(f"\nsession manager: {manager.stats()}")
+    manager.close()
+
+
+def main(args):
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    server = start_http_server(args) if args.transport == "streamable_http" else None
+    try:
+        conn = connection(args)
+        print(f"{args.transport}, tool work {args.work_ms} ms, {args.calls} calls\n")
+        print(f"{'mode':>11} {'ms/call':>9} {'overhead ms':>12} {'calls/s':>9}")
+        bench_per_call(conn, args)
+        bench_persistent(conn, args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transport", choices=["stdio", "streamable_http"], default="streamable_http")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--work-ms", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    serve(args) if args.serve else main(args)
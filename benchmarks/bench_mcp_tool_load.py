@@ -0,0 +1,118 @@
+"""
+Server-side load benchmark for the product_search_server MCP tools.
+
+Builds two in-process FastMCP servers exposing the same
+``get_product_info`` tool backed by a stub retriever that blocks for
+``--work-ms`` (like a vector-store round trip):
+
+- ``inline``: the previous server, ``retriever.invoke`` called directly
+  inside the ``async def`` tool, so it blocks the server's event loop
+- ``pooled``: the tool body runs through ToolExecutor (bounded thread pool,
+  per-tool concurrency limit and timeout)
+
+``--callers`` concurrent callers each make ``--calls`` tool calls through
+``FastMCP.call_tool``, so transport cost is left out. The benchmark reports
+throughput, latency percentiles and the worst event-loop stall seen by a
+heartbeat task (what a health check or another session would wait).
+
+    python benchmarks/bench_mcp_tool_load.py --callers 50 --work-ms 50
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from mcp.server.fastmcp import FastMCP
+
+from prod_assistant.mcp_servers.tool_executor import ToolExecutor
+
+
+class StubRetriever:
+    def __init__(self, work_ms: float):
+        self.work_ms = work_ms
+
+    def invoke(self, query: str) -> str:
+        time.sleep(self.work_ms / 1000)  # blocking I/O wait
+        return f"Title: Stub product\nPrice: 1\nRating: 5\nReviews:\nresult for {query}"
+
+
+def build_server(mode: str, retriever: StubRetriever, executor: ToolExecutor) -> FastMCP:
+    mcp = FastMCP(f"bench-{mode}", log_level="WARNING")
+
+    if mode == "inline":
+        @mcp.tool()
+        async def get_product_info(query: str) -> str:
+            return retriever.invoke(query)
+    else:
+        @mcp.tool()
+        async def get_product_info(query: str) -> str:
+            return await executor.run("get_product_info", retriever.invoke, query)
+
+    return mcp
+
+
+async def heartbeat(stop: asyncio.Event, interval: float, stalls: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        stalls.append(loop.time() - start - interval)
+
+
+async def load(mcp: FastMCP, args) -> dict:
+    latencies, stalls = [], []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop, 0.005, stalls))
+
+    async def caller(c: int):
+        for i in range(args.calls):
+            start = time.perf_counter()
+            await mcp.call_tool("get_product_info", {"query": f"caller {c} query {i}"})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(c) for c in range(args.callers)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+
+    latencies.sort()
+    return {
+        "calls/s": len(latencies) / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max stall ms": max(stalls, default=0.0) * 1000,
+    }
+
+
+def main(args):
+    retriever = StubRetriever(args.work_ms)
+    executor = ToolExecutor(
+        max_workers=args.pool,
+        limits={"get_product_info": {"max_concurrency": args.limit, "timeout_seconds": 120}},
+    )
+    print(f"{args.callers} callers x {args.calls} calls, tool work {args.work_ms} ms, "
+          f"pool {args.pool}, limit {args.limit}\n")
+    print(f"{'server':>7} {'calls/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'max stall ms':>13}")
+    for mode in ("inline", "pooled"):
+        result = asyncio.run(load(build_server(mode, retriever, executor), args))
+        print(f"{mode:>7} " + " ".join(f"{result[k]:>{w}.1f}" for k, w in
+                                        (("calls/s", 9), ("p50 ms", 9), ("p95 ms", 9), ("max stall ms", 13))))
+    print(f"\nexecutor: {executor.stats()}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--callers", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--work-ms", type=float, default=50.0)
+    parser.add_argument("--pool", type=int, default=16)
+    parser.add_argument("--limit", type=int, default=8)
+    main(parser.parse_args())
@@ -0,0 +1,140 @@
+"""
+Benchmark: budget / rating queries with and without the metadata pre-filter.
+
+Builds an in-memory LocalVectorStore of ``--docs`` synthetic products whose
+metadata goes through DataIngestion.documents_from_frame (so it carries the
+parsed price_value / rating_value / review_count), then runs budget queries
+through the MMR retriever two ways:
+
+- ``unfiltered``: the previous retriever; constraints are left to the LLM
+- ``pre-filter``: MetadataFilteredRetriever, which turns "under 30k" /
+  "rated 4+" into a vector-store filter before scoring
+
+Reports how many of the returned products actually satisfy the constraint
+and the per-query retrieval latency, then times the
+vectorised numeric mask against per-row filter evaluation.
+
+    python benchmarks/bench_metadata_filter.py --docs 20000
+"""
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.etl.data_ingestion import DataIngestion
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+from prod_assistant.retriever.metadata_filter import MetadataFilteredRetriever, parse_query_filter
+
+QUERIES = [
+    "Can you suggest a good budget phone under 30,000 INR?",
+    "best phone between 20k and 40k rated 4.3+",
+    "laptop below ₹55,000 with rating above 4",
+    "headphones under 5000 rs",
+]
+CATEGORIES = ["phone", "laptop", "headphones", "tv", "smartwatch"]
+
+
+class BagOfWordsEmbeddings(Embeddings):
+    """Deterministic hashed bag-of-words vectors, so topic words drive similarity."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def _vector(self, text: str) -> List[float]:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in text.lower().split():
+            vector[int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % self.dim] += 1.0
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text)
+
+
+def build_store(docs: int, seed: int = 0) -> LocalVectorStore:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(docs):
+        category = rng.choice(CATEGORIES)
+        price = rng.randrange(800, 150_000, 100)
+        rows.append({
+            "product_id": f"itm{i:012x}",
+            "product_title": f"{category.title()} model {i}",
+            "rating": f"{rng.uniform(3.0, 4.9):.1f}",
+            "total_reviews": f"{rng.randrange(10, 200_000):,}",
+            "price": f"₹{price:,}",
+            "top_reviews": f"good {category} budget value battery camera sound",
+        })
+    documents = DataIngestion.documents_from_frame(pd.DataFrame(rows))
+    store = LocalVectorStore(BagOfWordsEmbeddings())
+    store.add_documents(documents, ids=[DataIngestion.document_id(d) for d in documents])
+    return store
+
+
+def satisfies(metadata: dict, filter: dict) -> bool:
+    return all(LocalVectorStore._value_matches(metadata.get(key), condition) for key, condition in filter.items())
+
+
+def bench_retrieval(store: LocalVectorStore, args):
+    search_kwargs = {"k": args.k, "fetch_k": 20, "lambda_mult": 0.7}
+    retrievers = {
+        "unfiltered": store.as_retriever(search_type="mmr", search_kwargs=search_kwargs),
+        "pre-filter": MetadataFilteredRetriever(vectorstore=store, search_type="mmr", search_kwargs=search_kwargs),
+    }
+    print(f"{'retriever':>11} {'in budget':>10} {'ms/query':>9}")
+    for name, retriever in retrievers.items():
+        matching = total = 0
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            for query in QUERIES:
+                filter = parse_query_filter(query)
+                for doc in retriever.invoke(query):
+                    total += 1
+                    matching += satisfies(doc.metadata, filter)
+        elapsed = (time.perf_counter() - start) / (args.repeats * len(QUERIES))
+        print(f"{name:>11} {matching / total:>10.0%} {elapsed * 1000:>9.2f}")
+
+
+def bench_mask(store: LocalVectorStore, args):
+    filter = parse_query_filter(QUERIES[1])
+    store._filter_mask(filter)  # build the cached columns
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        mask = store._filter_mask(filter)
+    vectorised = (time.perf_counter() - start) / args.repeats
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        rows = [r for r, m in enumerate(store._metadatas) if satisfies(m, filter)]
+    per_row = (time.perf_counter() - start) / args.repeats
+    assert list(np.flatnonzero(mask)) == rows
+    print(f"\nfilter over {len(store)} rows: numeric mask {vectorised * 1000:.2f} ms, per-row {per_row * 1000:.2f} ms")
+
+
+def main(args):
+    start = time.perf_counter()
+    store = build_store(args.docs)
+    print(f"{args.docs} products indexed in {time.perf_counter() - start:.1f}s\n")
+    bench_retrieval(store, args)
+    bench_mask(store, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,167 @@
+"""
+Benchmark: LLM-only document grading vs the RelevanceGrader fast path.
+
+Indexes ``--docs`` synthetic products in a LocalVectorStore (hashed
+bag-of-words embeddings, so returned docs carry a cosine
+``relevance_score``), retrieves for a mix of in-catalog and out-of-catalog
+queries and formats the hits the way the workflows do. Each context is then
+graded two ways:
+
+- ``llm``: the previous grader; every context costs one LLM call. A stub
+  grader with ``--llm-latency`` answers with the true label.
+- ``fast path``: RelevanceGrader decides clear hits and misses locally;
+  only the ambiguous band reaches the stub LLM.
+
+Reports how many grades were decided locally, whether those decisions match
+the true label, and the mean grading latency.
+
+    python benchmarks/bench_relevance_grader.py --llm-latency 0.4
+"""
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root and package dir to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+from workflow.relevance import GENERATOR, REWRITER, RelevanceGrader
+
+BRANDS = {
+    "phone": ["samsung galaxy", "apple iphone", "oneplus", "redmi note", "google pixel"],
+    "laptop": ["hp pavilion", "dell inspiron", "lenovo ideapad", "asus vivobook", "apple macbook"],
+    "headphones": ["boat rockerz", "sony wh", "jbl tune", "sennheiser hd", "noise buds"],
+}
+FEATURES = ["battery", "camera", "display", "sound", "bass", "performance", "build", "gaming"]
+RELEVANT = [
+    "samsung galaxy phone with good camera",
+    "apple iphone battery life",
+    "lenovo ideapad laptop for gaming performance",
+    "sony wh headphones bass quality",
+    "oneplus phone display reviews",
+    "dell inspiron laptop build quality",
+]
+IRRELEVANT = [
+    "front load washing machine",
+    "air fryer for a family of four",
+    "king size mattress offers",
+    "refrigerator energy rating",
+    "kids cycle with gears",
+    "microwave oven convection",
+]
+
+
+class BagOfWordsEmbeddings(Embeddings):
+    """Deterministic hashed bag-of-words vectors, so topic words drive similarity."""
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def _vector(self, text: str) -> List[float]:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in text.lower().split():
+            vector[int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % self.dim] += 1.0
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text)
+
+
+def build_store(docs: int, seed: int = 0) -> LocalVectorStore:
+    rng = random.Random(seed)
+    documents = []
+    for i in range(docs):
+        category = rng.choice(list(BRANDS))
+        brand = rng.choice(BRANDS[category])
+        features = rng.sample(FEATURES, 3)
+        documents.append(Document(
+            page_content=f"{brand} {category} great {features[0]} decent {features[1]} average {features[2]}",
+            metadata={"product_title": f"{brand} {category} {i}", "price": f"₹{rng.randrange(999, 99999)}",
+                      "rating": f"{rng.uniform(3, 5):.1f}"},
+        ))
+    store = LocalVectorStore(BagOfWordsEmbeddings())
+    store.add_documents(documents)
+    return store
+
+
+def format_docs(docs) -> str:
+    """Same layout as the workflows' _format_docs."""
+    if not docs:
+        return "No relevant documents found."
+    chunks = []
+    for d in docs:
+        meta = d.metadata or {}
+        chunks.append(
+            f"Title: {meta.get('product_title', 'N/A')}\n"
+            f"Price: {meta.get('price', 'N/A')}\n"
+            f"Rating: {meta.get('rating', 'N/A')}\n"
+            + (f"Relevance: {meta['relevance_score']}\n" if meta.get("relevance_score") is not None else "")
+            + f"Reviews:\n{d.page_content.strip()}"
+        )
+    return "\n\n---\n\n".join(chunks)
+
+
+def main(args):
+    store = build_store(args.docs)
+    cases = []
+    for query in RELEVANT + IRRELEVANT:
+        docs = store.similarity_search(query, k=args.k)
+        cases.append((query, format_docs(docs), GENERATOR if query in RELEVANT else REWRITER))
+
+    grader = RelevanceGrader(accept_threshold=args.accept, reject_threshold=args.reject)
+    print(f"{len(cases)} queries, stub LLM grader {args.llm_latency}s, band ({args.reject}, {args.accept})\n")
+    print(f"{'query':<45} {'label':>9} {'score':>6} {'sim':>6} {'lex':>5} {'route':>9}")
+    for query, context, label in cases:
+        decision = grader.score(query, context)
+        sim = f"{decision.similarity:.2f}" if decision.similarity is not None else "-"
+        print(f"{query:<45} {label:>9} {decision.score:>6.2f} {sim:>6} {decision.lexical:>5.2f} "
+              f"{decision.route or 'llm':>9}")
+
+    def stub_llm(label):
+        def grade():
+            time.sleep(args.llm_latency)
+            return label
+        return grade
+
+    start = time.perf_counter()
+    for _, _, label in cases:
+        stub_llm(label)()
+    llm_only = (time.perf_counter() - start) / len(cases)
+
+    local = correct = 0
+    start = time.perf_counter()
+    for query, context, label in cases:
+        decision = grader.score(query, context)
+        route = grader.grade(query, context, stub_llm(label))
+        if decision.route is not None:
+            local += 1
+            correct += route == label
+    fast = (time.perf_counter() - start) / len(cases)
+
+    print(f"\n{'grader':>10} {'local':>7} {'local correct':>14} {'mean ms':>9}")
+    print(f"{'llm':>10} {0:>7} {'-':>14} {llm_only * 1000:>9.1f}")
+    print(f"{'fast path':>10} {local:>7} {f'{correct}/{local}':>14} {fast * 1000:>9.1f}")
+    print(f"\ngrader stats: {grader.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.4)
+    parser.add_argument("--accept", type=float, default=0.70)
+    parser.add_argument("--reject", type=float, default=0.30)
+    main(parser.parse_args())
@@ -0,0 +1,113 @@
+"""
+Benchmark: the Rewriter loop with and without a RequestBudget.
+
+Runs the real agentic_rag_workflow graph with a stub chat model whose
+grader never says "yes" (the worst case: the retrieved docs never look
+relevant) and a stub retriever. The local relevance fast path is switched
+off, so every grade is an LLM call, as before it existed.
+
+- ``unbounded``: no limits, the previous behaviour. The loop keeps
+  rewriting until LangGraph's recursion limit raises.
+- ``budget``: the config defaults (or the flags below). The graph stops
+  looping and answers from the docs it has.
+
+Reports wall time, LLM calls, tokens and how each request ended.
+
+    python benchmarks/bench_request_budget.py --latency 0.2
+"""
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the project root and package dir to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
+
+from langchain_core.documents import Document
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.errors import GraphRecursionError
+
+from workflow.agentic_rag_workflow import AgenticRAG
+from workflow.budget import RequestBudget
+
+QUERY = "What is the price of iPhone 16?"
+
+
+class StubChatModel(BaseChatModel):
+    """Fixed latency; grades "no", rewrites the query, answers everything else."""
+
+    latency: float = 0.2
+    tokens_per_call: int = 400
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        text = messages[-1].content
+        if "You are a grader" in text:
+            answer = "no"
+        elif "Rewrite" in text:
+            answer = "price of the apple iphone 16 128gb"
+        else:
+            answer = "The iPhone 16 costs about ₹79,900."
+        usage = {"input_tokens": self.tokens_per_call - 20, "output_tokens": 20, "total_tokens": self.tokens_per_call}
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer, usage_metadata=usage))])
+
+
+class StubRetriever:
+    vstore = object()
+
+    def load_retriever(self):
+        return self
+
+    def invoke(self, query: str):
+        return [Document(
+            page_content="Good phone, battery could be better.",
+            metadata={"product_title": "Apple iPhone 16 (Black, 128 GB)", "price": "₹79,900", "rating": "4.6",
+                      "relevance_score": 0.55},
+        )]
+
+
+def run(engine: AgenticRAG, name: str, budget: RequestBudget):
+    start = time.perf_counter()
+    try:
+        answer = engine.run(QUERY, thread_id=uuid.uuid4().hex, budget=budget)
+        outcome = "best-effort" if answer.startswith("I couldn't") else "generated"
+    except GraphRecursionError:
+        outcome = "GraphRecursionError"
+    elapsed = time.perf_counter() - start
+    print(f"{name:>10} {elapsed:>8.2f} {budget.llm_calls:>9} {budget.tokens:>7} {budget.rewrites:>8}  {outcome}")
+
+
+def main(args):
+    engine = AgenticRAG(llm=StubChatModel(latency=args.latency), retriever_obj=StubRetriever())
+    engine.relevance_grader.enabled = False
+
+    print(f"stub LLM {args.latency}s/call, grader always 'no'\n")
+    print(f"{'budget':>10} {'wall s':>8} {'LLM calls':>9} {'tokens':>7} {'rewrites':>8}  outcome")
+    run(engine, "unbounded", RequestBudget(max_rewrites=None, max_llm_calls=None, max_tokens=None, deadline_seconds=None))
+
+    budget = RequestBudget.from_config()
+    for key in ("max_rewrites", "max_llm_calls", "max_tokens", "deadline_seconds"):
+        if getattr(args, key) is not None:
+            setattr(budget, key, getattr(args, key))
+    run(engine, "budget", budget)
+    print(f"\nlimits: rewrites={budget.max_rewrites} llm_calls={budget.max_llm_calls} "
+          f"tokens={budget.max_tokens} deadline={budget.deadline_seconds}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.2, help="stub LLM latency per call (s)")
+    parser.add_argument("--max-rewrites", dest="max_rewrites", type=int)
+    parser.add_argument("--max-llm-calls", dest="max_llm_calls", type=int)
+    parser.add_argument("--max-tokens", dest="max_tokens", type=int)
+    parser.add_argument("--deadline", dest="deadline_seconds", type=float)
+    main(parser.parse_args())
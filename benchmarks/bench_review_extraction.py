@@ -0,0 +1,151 @@
+"""
+Micro-benchmark: review extraction per product page, before and after.
+
+``legacy`` is the previous get_top_reviews extraction (four fallback
+"Methods", each re-walking a BeautifulSoup html.parser tree and calling
+get_text on every div). ``lxml`` is review_extractor.ReviewExtractor: one
+lxml parse, one precompiled XPath sweep, compiled regexes and skip-phrase
+alternations. Both run on the saved ``flipkart_product_page.html``.
+
+    python benchmarks/bench_review_extraction.py --iterations 30 --count 3
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+
+from prod_assistant.etl.review_extractor import ReviewExtractor
+
+FIXTURE = project_root / "flipkart_product_page.html"
+
+LEGACY_CONTAINER_SELECTORS = ["div.ZmyHeo", "div.t-ZTKy", "div._11pzQk", "div.qwjRop", "div._6K-7Co", "div.cPHDOP"]
+
+
+def legacy_extract_reviews(html: str, count: int = 2) -> List[str]:
+    """The previous get_top_reviews extraction: four BeautifulSoup passes over html.parser."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    reviews = []
+    seen = set()
+
+    # Method 1: Look for review containers with the current Flipkart structure (2024-2025)
+    # Reviews are typically in divs with specific class patterns
+    for selector in LEGACY_CONTAINER_SELECTORS:
+        if len(reviews) >= count:
+            break
+        try:
+            elements = soup.select(selector)
+            for elem in elements:
+                text = elem.get_text(separator=" ", strip=True)
+                if text and len(text) > 50 and text not in seen:
+                    # Filter out non-review content
+                    if not any(skip in text.lower() for skip in ['add to cart', 'buy now', 'flipkart', 'seller', 'delivery']):
+                        reviews.append(text[:500])  # Limit review length
+                        seen.add(text)
+                if len(reviews) >= count:
+                    break
+        except Exception:
+            continue
+
+    # Method 2: Look for reviews by finding rating stars followed by review text
+    if len(reviews) < count:
+        # Find all rating divs and get adjacent review text
+        rating_divs = soup.find_all("div", class_=re.compile(r"XQDdHH|_3LWZlK|MKiFS6"))
+        for rating_div in rating_divs:
+            if len(reviews) >= count:
+                break
+            # Look for review text in parent or sibling elements
+            parent = rating_div.find_parent("div", class_=re.compile(r"col|x_CUu6|EKxdNe"))
+            if parent:
+                # Find text content that looks like a review
+                for child in parent.find_all("div"):
+                    text = child.get_text(separator=" ", strip=True)
+                    if text and len(text) > 50 and text not in seen:
+                        if not any(skip in text.lower() for skip in ['add to cart', 'buy now', 'flipkart', 'seller', 'delivery', 'helpful', 'report']):
+                            reviews.append(text[:500])
+                            seen.add(text)
+                            break
+
+    # Method 3: Find reviews by looking for the "READ MORE" pattern (reviews often have this)
+    if len(reviews) < count:
+        # Look for parent containers of "Read more" links which often contain reviews
+        read_more_elements = soup.find_all(string=re.compile(r"READ MORE|Read More|read more", re.IGNORECASE))
+        for elem in read_more_elements:
+            if len(reviews) >= count:
+                break
+            parent = elem.find_parent("div")
+            if parent:
+                grandparent = parent.find_parent("div")
+                if grandparent:
+                    text = grandparent.get_text(separator=" ", strip=True)
+                    text = re.sub(r"READ MORE.*", "", text, flags=re.IGNORECASE).strip()
+                    if text and len(text) > 50 and text not in seen:
+                        reviews.append(text[:500])
+                        seen.add(text)
+
+    # Method 4: Generic approach - look for longer text blocks in review section
+    if len(reviews) < count:
+        # Find the ratings section first
+        ratings_section = soup.find("div", string=re.compile(r"Ratings?\s*&?\s*Reviews?", re.IGNORECASE))
+        if ratings_section:
+            # Get parent container and search for review text
+            section_parent = ratings_section.find_parent("div", class_=re.compile(r"col|MDzIYy"))
+            if section_parent:
+                all_divs = section_parent.find_all("div")
+                for div in all_divs:
+                    if len(reviews) >= count:
+                        break
+                    text = div.get_text(separator=" ", strip=True)
+                    # Look for text that appears to be a review (moderate length, not UI text)
+                    if (text and 50 < len(text) < 1000 and text not in seen
+                        and not any(skip in text.lower() for skip in
+                            ['add to cart', 'buy now', 'flipkart', 'delivery by', 'rate product',
+                             'ratings &', 'all reviews', 'helpful', 'report abuse'])):
+                        reviews.append(text[:500])
+                        seen.add(text)
+
+    return reviews
+
+
+def timed(fn, iterations: int):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = fn()
+    return (time.perf_counter() - start) / iterations, result
+
+
+def main(args):
+    html = FIXTURE.read_text(encoding="utf-8")
+    extractor = ReviewExtractor()
+    print(f"Fixture: {FIXTURE.name} ({len(html) / 1024:.0f} KB), count={args.count}\n")
+
+    legacy_s, legacy_reviews = timed(lambda: legacy_extract_reviews(html, args.count), args.iterations)
+    lxml_s, lxml_reviews = timed(lambda: extractor.extract(html, args.count), args.iterations)
+    root = extractor.parse(html)
+    sweep_s, _ = timed(lambda: extractor.extract(root, args.count), args.iterations)
+
+    print(f"{'mode':>20} {'ms/page':>9} {'speedup':>8}")
+    print(f"{'legacy (bs4)':>20} {legacy_s * 1000:>9.1f} {1.0:>7.1f}x")
+    print(f"{'lxml':>20} {lxml_s * 1000:>9.1f} {legacy_s / lxml_s:>7.1f}x")
+    print(f"{'lxml, pre-parsed':>20} {sweep_s * 1000:>9.1f} {legacy_s / sweep_s:>7.1f}x")
+
+    for name, reviews in (("legacy", legacy_reviews), ("lxml", lxml_reviews)):
+        print(f"\n{name} reviews:")
+        for review in reviews:
+            print(f"  - {review[:100]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--count", type=int, default=3)
+    main(parser.parse_args())
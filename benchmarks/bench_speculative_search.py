@@ -0,0 +1,153 @@
+"""
+Benchmark: serial vs speculative web search in the MCP + web-search graph.
+
+Runs the real AgenticRAG graph with a stub chat model and stub MCP tools
+whose latencies are drawn from a log-normal distribution around the
+given medians (so p95 reflects the tail). A ``--miss-rate`` share of queries
+is graded "no" by the stub grader, which sends them down the web-search
+path:
+
+- ``serial``: Retriever -> Grader -> Rewriter -> WebSearch -> Generator
+- ``speculative``: web_search starts with get_product_info; a rejected
+  grade goes straight to WebSearch, which awaits the in-flight result;
+  an accepted grade cancels it
+
+Reports p50 / p95 end-to-end latency for hits and misses, plus the
+speculation counters.
+
+    python benchmarks/bench_speculative_search.py --queries 200 --miss-rate 0.4
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the project root and package dir to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from workflow.agentic_workflow_with_mcp_websearch import AgenticRAG
+
+MISS_MARKER = "zqx"  # queries containing this are graded irrelevant
+
+
+def jitter(rng: random.Random, median: float, sigma: float) -> float:
+    return median * rng.lognormvariate(0, sigma)
+
+
+class StubChatModel(BaseChatModel):
+    """Grades "no" for miss queries, answers everything else; log-normal latency."""
+
+    latency: float = 0.3
+    sigma: float = 0.5
+    rng: random.Random = random.Random(0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(jitter(self.rng, self.latency, self.sigma))
+        text = messages[-1].content
+        answer = "yes"
+        if "You are a grader" in text and MISS_MARKER in text:
+            answer = "no"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer))])
+
+
+class StubTool:
+    def __init__(self, name: str, latency: float, sigma: float, rng: random.Random):
+        self.name = name
+        self.latency = latency
+        self.sigma = sigma
+        self.rng = rng
+
+    async def ainvoke(self, payload: dict) -> str:
+        await asyncio.sleep(jitter(self.rng, self.latency, self.sigma))
+        return f"Title: Stub product\nPrice: 1\nRating: 5\nReviews:\n{self.name} result for {payload['query']}"
+
+
+class StubRetriever:
+    vstore = object()
+
+    def load_retriever(self):
+        return None
+
+
+def percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+async def run_mode(speculative: bool, args) -> AgenticRAG:
+    rng = random.Random(args.seed)
+    tools = [
+        StubTool("get_product_info", args.tool_latency, args.sigma, rng),
+        StubTool("web_search", args.web_latency, args.sigma, rng),
+    ]
+    engine = AgenticRAG(
+        llm=StubChatModel(latency=args.latency, sigma=args.sigma, rng=rng),
+        retriever_obj=StubRetriever(),
+        mcp_tools=tools,
+        speculative_search=speculative,
+        latency_budget=args.budget,
+    )
+    # Misses must reach the stub LLM grader, so keep the local relevance fast path out of it
+    engine.relevance_grader.enabled = False
+    latencies = {"hit": [], "miss": []}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int):
+        kind = "miss" if rng.random() < args.miss_rate else "hit"
+        query = f"what is the price of phone {i}" + (f" {MISS_MARKER}" if kind == "miss" else "")
+        thread_id = uuid.uuid4().hex
+        async with semaphore:
+            start = time.perf_counter()
+            await engine.run(query, thread_id=thread_id)
+            latencies[kind].append(time.perf_counter() - start)
+        await engine.release_thread(thread_id)
+
+    await asyncio.gather(*(one(i) for i in range(args.queries)))
+
+    name = "speculative" if speculative else "serial"
+    for kind in ("hit", "miss"):
+        values = latencies[kind]
+        if values:
+            print(f"{name:>12} {kind:>5} {len(values):>6} {statistics.median(values) * 1000:>9.0f} "
+                  f"{percentile(values, 0.95):>9.0f}")
+    return engine
+
+
+async def main(args):
+    print(f"llm {args.latency}s, product tool {args.tool_latency}s, web tool {args.web_latency}s "
+          f"(log-normal sigma {args.sigma}), miss rate {args.miss_rate:.0%}, budget {args.budget}s\n")
+    print(f"{'mode':>12} {'kind':>5} {'n':>6} {'p50 ms':>9} {'p95 ms':>9}")
+    await run_mode(False, args)
+    engine = await run_mode(True, args)
+    print(f"\nspeculation: {engine.speculation_stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--miss-rate", type=float, default=0.4)
+    parser.add_argument("--latency", type=float, default=0.3, help="median stub LLM latency (s)")
+    parser.add_argument("--tool-latency", type=float, default=0.1, help="median get_product_info latency (s)")
+    parser.add_argument("--web-latency", type=float, default=0.6, help="median web_search latency (s)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal latency spread")
+    parser.add_argument("--budget", type=float, default=8.0, help="speculative latency budget (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
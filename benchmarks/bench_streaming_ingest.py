@@ -0,0 +1,130 @@
+"""
+Benchmark: CSV round trip vs streaming scrape -> vector store ingestion.
+
+A stand-in scraper yields ``--products`` rows, one every ``--scrape-latency``
+seconds (roughly one product page per row), into a LocalVectorStore whose
+writes sleep ``--write-latency`` seconds.
+
+- ``csv round trip`` reproduces the UI flow: scrape everything, save the
+  CSV, then read it back through DataIngestion.iter_csv_documents and write
+  it with PipelinedWriter.
+- ``streaming`` runs StreamingIngestion, which upserts micro-batches while
+  the scrape is still going.
+
+Reports time to the first searchable product and total wall time.
+
+    python benchmarks/bench_streaming_ingest.py --products 40 --scrape-latency 0.25
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.etl.bulk_writer import PipelinedWriter
+from prod_assistant.etl.data_ingestion import DataIngestion
+from prod_assistant.etl.data_scrapper import FlipkartScraper
+from prod_assistant.etl.streaming_pipeline import StreamingIngestion
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+
+
+class HashEmbeddings(Embeddings):
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+
+    def _vector(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [digest[i % len(digest)] / 255.0 for i in range(self.dim)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text)
+
+
+class SlowStore(LocalVectorStore):
+    def __init__(self, embedding, latency: float):
+        super().__init__(embedding)
+        self.latency = latency
+
+    def add_texts(self, texts, metadatas=None, *, ids=None, **kwargs):
+        time.sleep(self.latency)
+        return super().add_texts(list(texts), metadatas, ids=ids)
+
+
+class FakeScraper:
+    """Yields product rows at a fixed rate, like FlipkartScraper.scrape_many."""
+
+    save_to_csv = FlipkartScraper.save_to_csv
+
+    def __init__(self, output_dir: str, latency: float):
+        self.output_dir = output_dir
+        self.latency = latency
+
+    def scrape_many(self, queries, max_products=1, review_count=2):
+        for query in queries:
+            for i in range(max_products):
+                time.sleep(self.latency)
+                yield query, [f"itm{query}{i:04d}", f"{query} product {i}", "4.3", "1,024", "₹19,999",
+                              f"Solid {query} number {i}, battery lasts all day || Good value"]
+
+
+def run_csv_round_trip(args, tmp: str):
+    scraper = FakeScraper(tmp, args.scrape_latency)
+    store = SlowStore(HashEmbeddings(), args.write_latency)
+    first = []
+    start = time.perf_counter()
+    rows = [row for _, row in scraper.scrape_many(["phone"], args.products)]
+    csv_path = os.path.join(tmp, "round_trip.csv")
+    scraper.save_to_csv(rows, csv_path)
+    writer = PipelinedWriter(store, concurrency=args.concurrency,
+                             on_written=lambda docs, ids: first or first.append(time.perf_counter() - start))
+    writer.write((docs, None) for docs in DataIngestion.iter_csv_documents(csv_path, chunksize=args.batch_size))
+    return first[0], time.perf_counter() - start, len(store)
+
+
+def run_streaming(args, tmp: str):
+    store = SlowStore(HashEmbeddings(), args.write_latency)
+    pipeline = StreamingIngestion(
+        scraper=FakeScraper(tmp, args.scrape_latency),
+        vstore=store,
+        csv_path=os.path.join(tmp, "streaming.csv"),
+        queue_size=args.queue_size,
+        batch_size=args.batch_size,
+        max_batch_wait_seconds=args.max_batch_wait,
+    )
+    stats = pipeline.run(["phone"], max_products=args.products)
+    return stats.first_searchable_seconds, stats.total_seconds, len(store)
+
+
+def main(args):
+    print(f"{args.products} products, scrape {args.scrape_latency * 1000:.0f} ms/product, "
+          f"write {args.write_latency * 1000:.0f} ms/batch, batch size {args.batch_size}\n")
+    print(f"{'mode':>16} {'first searchable s':>19} {'total s':>9} {'stored':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, run in (("csv round trip", run_csv_round_trip), ("streaming", run_streaming)):
+            first, total, stored = run(args, tmp)
+            assert stored == args.products
+            print(f"{name:>16} {first:>19.2f} {total:>9.2f} {stored:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=40)
+    parser.add_argument("--scrape-latency", type=float, default=0.25)
+    parser.add_argument("--write-latency", type=float, default=0.2)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-batch-wait", type=float, default=1.0)
+    parser.add_argument("--queue-size", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=4)
+    main(parser.parse_args())
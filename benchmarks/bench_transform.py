@@ -0,0 +1,105 @@
+"""
+Benchmark: CSV -> Document transform, legacy vs streaming.
+
+``legacy`` reproduces the previous DataIngestion behaviour (read the whole
+CSV, iterrows() into dicts, iterrows-style NaN checks into Documents).
+``streaming`` uses DataIngestion.iter_csv_documents, consuming one chunk at a
+time the way store_in_vector_db does. Each mode runs in its own subprocess so
+peak RSS is measured independently.
+
+    python benchmarks/bench_transform.py --rows 1000000
+"""
+import argparse
+import csv
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to the Python path for direct script execution
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+
+def generate_csv(path: str, rows: int):
+    review = "Great phone, battery lasts all day and the camera is excellent. " * 3
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"])
+        for i in range(rows):
+            missing = i % 7 == 0
+            writer.writerow([
+                f"itm{i:013x}",
+                f"Product {i} (Black, 128 GB)",
+                "N/A" if missing else f"{3 + (i % 20) / 10:.1f}",
+                "N/A" if missing else f"{(i * 37) % 200000:,}",
+                "N/A" if missing else f"₹{(i * 91) % 150000:,}",
+                "" if missing else review,
+            ])
+
+
+def run_legacy(path: str) -> int:
+    import pandas as pd
+    from langchain_core.documents import Document
+
+    df = pd.read_csv(path)
+    product_list = []
+    for _, row in df.iterrows():
+        product_list.append({k: row[k] for k in ["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"]})
+    documents = []
+    for entry in product_list:
+        metadata = {
+            "product_id": entry["product_id"] if pd.notna(entry["product_id"]) else "",
+            "product_title": entry["product_title"] if pd.notna(entry["product_title"]) else "",
+            "rating": str(entry["rating"]) if pd.notna(entry["rating"]) else "N/A",
+            "total_reviews": str(entry["total_reviews"]) if pd.notna(entry["total_reviews"]) else "N/A",
+            "price": str(entry["price"]) if pd.notna(entry["price"]) else "N/A",
+        }
+        page_content = entry["top_reviews"] if pd.notna(entry["top_reviews"]) else ""
+        documents.append(Document(page_content=page_content, metadata=metadata))
+    return len(documents)
+
+
+def run_streaming(path: str, chunksize: int) -> int:
+    from prod_assistant.etl.data_ingestion import DataIngestion
+
+    count = 0
+    for batch in DataIngestion.iter_csv_documents(path, chunksize=chunksize):
+        count += len(batch)  # the batch is dropped here, as after a vector store write
+    return count
+
+
+def child(mode: str, path: str, chunksize: int):
+    start = time.perf_counter()
+    count = run_legacy(path) if mode == "legacy" else run_streaming(path, chunksize)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f"{mode:>10} {count:>10} {elapsed:>10.2f} {peak_mb:>12.1f}")
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.csv")
+        print(f"Generating {args.rows:,} rows...")
+        generate_csv(path, args.rows)
+        print(f"CSV size: {os.path.getsize(path) / 1e6:.1f} MB\n")
+        print(f"{'mode':>10} {'docs':>10} {'seconds':>10} {'peak RSS MB':>12}")
+        for mode in args.modes:
+            subprocess.run([sys.executable, __file__, "--child", mode, "--path", path, "--chunksize", str(args.chunksize)], check=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=10_000)
+    parser.add_argument("--modes", nargs="+", default=["legacy", "streaming"], choices=["legacy", "streaming"])
+    parser.add_argument("--child", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.path, args.chunksize)
+    else:
+        main(args)
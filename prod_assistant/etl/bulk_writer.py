@@ -0,0 +1,204 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from langchain_core.documents import Document
+
+from prod_assistant.exception.custom_exception import ProductAssistantException
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.embedding_cache import CachedEmbeddings
+
+Batch = Tuple[List[Document], Optional[List[str]]]
+BatchSource = Union[Iterable[Batch], AsyncIterable[Batch]]
+_DONE = object()
+
+
+class PipelinedWriter:
+    """
+    Pipelined, resumable bulk upsert into a LangChain vector store.
+
+    Three stages connected by bounded queues (so a slow store applies
+    backpressure all the way back to CSV reading):
+
+    1. read   - pulls (documents, ids) batches from the source iterator
+                (or async iterator, for sources such as a live scrape)
+    2. embed  - ``concurrency`` workers embed upcoming batches through the
+                CachedEmbeddings wrapper while earlier ones are being
+                written, so the store's own embedding call is a cache hit
+    3. write  - ``concurrency`` workers call ``add_documents`` with per-batch
+                retries and exponential backoff
+
+    Finished batches are recorded in a checkpoint file; a re-run after a
+    failure skips them, and the checkpoint is removed once a run completes.
+    ``on_written(docs, ids)`` is called on the event loop after each batch
+    is accepted by the store.
+    """
+
+    def __init__(
+        self,
+        vstore,
+        embeddings=None,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+        checkpoint_path: Optional[str] = None,
+        on_written: Optional[Callable[[List[Document], List[str]], None]] = None,
+    ):
+        self.vstore = vstore
+        self.embeddings = embeddings
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.checkpoint_path = checkpoint_path
+        self.on_written = on_written
+        # Pre-embedding only pays off when the store's embedding calls hit the same cache
+        self.pre_embed = isinstance(embeddings, CachedEmbeddings)
+
+        self.batches_written = 0
+        self.batches_skipped = 0
+        self.retries = 0
+        self.failed_batches: List[str] = []
+        self._last_error: Optional[BaseException] = None
+
+    # ---------- Checkpoint ----------
+    @staticmethod
+    def batch_key(docs: List[Document], ids: Optional[List[str]]) -> str:
+        digest = hashlib.sha256()
+        for i, doc in enumerate(docs):
+            digest.update((ids[i] if ids else "").encode("utf-8"))
+            digest.update(doc.page_content.encode("utf-8"))
+            digest.update(json.dumps(doc.metadata, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_checkpoint(self) -> Set[str]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return set(json.load(f).get("completed", []))
+
+    def _save_checkpoint(self, completed: Set[str]):
+        if not self.checkpoint_path:
+            return
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": sorted(completed)}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    # ---------- Stages ----------
+    @staticmethod
+    async def _aiter(batches: BatchSource) -> AsyncIterator[Batch]:
+        if hasattr(batches, "__aiter__"):
+            async for batch in batches:
+                yield batch
+            return
+        batches = iter(batches)
+        while True:
+            # The source may be parsing CSV chunks; keep that off the event loop
+            batch = await asyncio.to_thread(next, batches, _DONE)
+            if batch is _DONE:
+                return
+            yield batch
+
+    async def _read(self, batches: BatchSource, out: asyncio.Queue, completed: Set[str]):
+        async for batch in self._aiter(batches):
+            docs, ids = batch
+            key = self.batch_key(docs, ids)
+            if key in completed:
+                self.batches_skipped += 1
+                continue
+            await out.put((key, docs, ids))
+        for _ in range(self.concurrency):
+            await out.put(_DONE)
+
+    async def _embed(self, inp: asyncio.Queue, out: asyncio.Queue):
+        while (item := await inp.get()) is not _DONE:
+            if self.pre_embed:
+                _, docs, _ = item
+                try:
+                    await asyncio.to_thread(self.embeddings.embed_documents, [d.page_content for d in docs])
+                except Exception as e:
+                    # The writer embeds (and retries) on its own; this was only a head start
+                    log.warning("Pre-embedding failed, deferring to writer", error=str(e))
+            await out.put(item)
+
+    async def _embed_stage(self, inp: asyncio.Queue, out: asyncio.Queue):
+        await asyncio.gather(*(self._embed(inp, out) for _ in range(self.concurrency)))
+        for _ in range(self.concurrency):
+            await out.put(_DONE)
+
+    async def _write_batch(self, docs: List[Document], ids: Optional[List[str]]) -> List[str]:
+        attempt = 0
+        while True:
+            try:
+                if ids:
+                    return await asyncio.to_thread(self.vstore.add_documents, docs, ids=ids)
+                return await asyncio.to_thread(self.vstore.add_documents, docs)
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                self.retries += 1
+                delay = self.retry_backoff_seconds * (2 ** (attempt - 1)) * (1 + random.random() * 0.1)
+                log.warning("Vector store write failed, retrying", attempt=attempt, delay=round(delay, 2), error=str(e))
+                await asyncio.sleep(delay)
+
+    async def _write(self, inp: asyncio.Queue, completed: Set[str], written_ids: List[str], lock: asyncio.Lock):
+        while (item := await inp.get()) is not _DONE:
+            key, docs, ids = item
+            try:
+                result = await self._write_batch(docs, ids)
+            except Exception as e:
+                log.error("Vector store batch failed after retries", batch=key[:12], size=len(docs), error=str(e))
+                self.failed_batches.append(key)
+                self._last_error = e
+                continue
+            async with lock:
+                written_ids.extend(result)
+                completed.add(key)
+                self.batches_written += 1
+                await asyncio.to_thread(self._save_checkpoint, set(completed))
+            if self.on_written is not None:
+                self.on_written(docs, result)
+
+    # ---------- Public API ----------
+    async def awrite(self, batches: BatchSource) -> List[str]:
+        completed = self._load_checkpoint()
+        if completed:
+            log.info("Resuming ingestion from checkpoint", completed_batches=len(completed))
+
+        to_embed: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        to_write: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        written_ids: List[str] = []
+        lock = asyncio.Lock()
+
+        await asyncio.gather(
+            self._read(batches, to_embed, completed),
+            self._embed_stage(to_embed, to_write),
+            *(self._write(to_write, completed, written_ids, lock) for _ in range(self.concurrency)),
+        )
+
+        log.info(
+            "Pipelined write finished",
+            written=self.batches_written,
+            skipped=self.batches_skipped,
+            failed=len(self.failed_batches),
+            retries=self.retries,
+        )
+        if self.failed_batches:
+            raise ProductAssistantException(
+                f"{len(self.failed_batches)} batch(es) failed; re-run ingestion to resume from the checkpoint",
+                self._last_error,
+            )
+        self.clear_checkpoint()
+        return written_ids
+
+    def write(self, batches: Iterable[Batch]) -> List[str]:
+        return asyncio.run(self.awrite(batches))
@@ -0,0 +1,207 @@
+import os
+import uuid
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+CATALOG_COLUMNS = ["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"]
+SCRAPED_AT_TYPE = pa.timestamp("ms", tz="UTC")
+FILE_SCHEMA = pa.schema([(column, pa.string()) for column in CATALOG_COLUMNS] + [("scraped_at", SCRAPED_AT_TYPE)])
+PARTITION_SCHEMA = pa.schema([("scrape_date", pa.string())])
+DATASET_SCHEMA = pa.unify_schemas([FILE_SCHEMA, PARTITION_SCHEMA])
+
+Since = Union[datetime, date, str, float, int, None]
+
+
+def as_utc(value: Since) -> Optional[datetime]:
+    """Normalise a datetime, date, ISO string or epoch seconds to an aware UTC datetime."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class CatalogStore:
+    """
+    Append-only Parquet catalog of scraped products.
+
+    Every scrape run appends one new file under a Hive-style partition
+    (``<root>/scrape_date=YYYY-MM-DD/part-*.parquet``); existing files are
+    never rewritten. Reads go through a ``pyarrow.dataset`` over a
+    memory-mapped local filesystem, so ``since`` filters prune whole
+    partitions by ``scrape_date`` and row groups by their ``scraped_at``
+    statistics, and ``columns`` projection only decodes the columns asked for.
+
+    Products re-scraped on later runs appear once per run;
+    ``iter_latest_frames`` streams the newest version of each product in
+    bounded chunks, which is what ingestion consumes.
+    """
+
+    def __init__(self, root: str = os.path.join("data", "catalog"), compression: str = "zstd"):
+        self.root = os.path.abspath(root)
+        self.compression = compression
+        self._fs = fs.LocalFileSystem(use_mmap=True)
+
+    @classmethod
+    def from_config(cls) -> "CatalogStore":
+        catalog_config = load_config().get("catalog", {})
+        return cls(
+            root=catalog_config.get("path", os.path.join("data", "catalog")),
+            compression=catalog_config.get("compression", "zstd"),
+        )
+
+    # ---------- Write ----------
+    def append(self, rows: Iterable[Sequence], scraped_at: Since = None) -> Optional[str]:
+        """Write scraper rows (CSV column order) as a new Parquet file; returns its path."""
+        rows = list(rows)
+        if not rows:
+            return None
+        scraped_at = as_utc(scraped_at) or datetime.now(timezone.utc)
+
+        arrays = [
+            pa.array([None if row[i] is None else str(row[i]) for row in rows], pa.string())
+            for i in range(len(CATALOG_COLUMNS))
+        ]
+        arrays.append(pa.array([scraped_at] * len(rows), SCRAPED_AT_TYPE))
+        table = pa.Table.from_arrays(arrays, schema=FILE_SCHEMA)
+
+        partition = os.path.join(self.root, f"scrape_date={scraped_at.date().isoformat()}")
+        os.makedirs(partition, exist_ok=True)
+        name = f"part-{scraped_at:%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet"
+        # Dot-prefixed files are ignored by dataset discovery, so readers never see a partial file
+        tmp_path = os.path.join(partition, f".{name}.tmp")
+        pq.write_table(table, tmp_path, compression=self.compression)
+        path = os.path.join(partition, name)
+        os.replace(tmp_path, path)
+        log.info("Catalog partition appended", path=path, rows=len(rows))
+        return path
+
+    # ---------- Read ----------
+    def dataset(self) -> ds.Dataset:
+        os.makedirs(self.root, exist_ok=True)
+        return ds.dataset(
+            self.root,
+            schema=DATASET_SCHEMA,
+            format="parquet",
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            filesystem=self._fs,
+        )
+
+    @staticmethod
+    def _filter(since: Since) -> Optional[ds.Expression]:
+        since = as_utc(since)
+        if since is None:
+            return None
+        # The partition predicate prunes directories; the timestamp one is exact within a day
+        return (ds.field("scrape_date") >= since.date().isoformat()) & (
+            ds.field("scraped_at") >= pa.scalar(since, SCRAPED_AT_TYPE)
+        )
+
+    def read(self, since: Since = None, columns: Optional[List[str]] = None) -> pa.Table:
+        """Rows scraped at or after ``since`` (all versions), projected to ``columns``."""
+        return self.dataset().to_table(columns=columns, filter=self._filter(since))
+
+    def iter_batches(self, since: Since = None, columns: Optional[List[str]] = None, batch_size: int = 10_000) -> Iterator[pa.RecordBatch]:
+        yield from self.dataset().to_batches(columns=columns, filter=self._filter(since), batch_size=batch_size)
+
+    def count(self, since: Since = None) -> int:
+        return self.dataset().count_rows(filter=self._filter(since))
+
+    def partitions(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(p.split("=", 1)[1] for p in os.listdir(self.root) if p.startswith("scrape_date="))
+
+    @staticmethod
+    def _keys(batch: pa.RecordBatch) -> pa.Array:
+        """Product key per row, like DataIngestion.document_id (product_id, else title)."""
+        product_id = pc.utf8_trim_whitespace(pc.fill_null(batch.column("product_id"), ""))
+        title_key = pc.binary_join_element_wise("title:", pc.fill_null(batch.column("product_title"), ""), "")
+        return pc.if_else(pc.is_in(product_id, pa.array(["", "N/A"])), title_key, product_id)
+
+    def _latest_positions(self, fragments: List[ds.Fragment], schema: pa.Schema, filter) -> Dict[int, np.ndarray]:
+        """
+        Key-only pass: row positions (within each fragment's filtered scan)
+        of the newest version of every product. Only the key columns and
+        ``scraped_at`` are decoded.
+        """
+        parts = []
+        for index, fragment in enumerate(fragments):
+            position = 0
+            for batch in fragment.to_batches(schema=schema, columns=["product_id", "product_title", "scraped_at"], filter=filter):
+                parts.append(pd.DataFrame({
+                    "key": self._keys(batch).to_numpy(zero_copy_only=False),
+                    "scraped_at": batch.column("scraped_at").cast(pa.int64()).to_numpy(zero_copy_only=False),
+                    "fragment": index,
+                    "position": np.arange(position, position + batch.num_rows),
+                }))
+                position += batch.num_rows
+        if not parts:
+            return {}
+        keys = pd.concat(parts, ignore_index=True)
+        # Stable sort in scan order: among equal timestamps the later file wins
+        winners = keys.sort_values("scraped_at", kind="stable").drop_duplicates("key", keep="last")
+        return {
+            int(fragment): np.sort(group["position"].to_numpy())
+            for fragment, group in winners.groupby("fragment")
+        }
+
+    def iter_latest_frames(
+        self, since: Since = None, chunksize: int = 10_000, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Newest version of every product scraped at or after ``since``, keyed
+        like DataIngestion.document_id (product_id, else title), in frames of
+        at most ``chunksize`` rows. A key-only pass picks the winning rows;
+        the second pass streams just those rows, fragment by fragment, so
+        peak memory is bounded by ``chunksize`` plus the key columns.
+        """
+        columns = list(columns or CATALOG_COLUMNS)
+        dataset = self.dataset()
+        filter = self._filter(since)
+        fragments = list(dataset.get_fragments(filter=filter))
+        positions = self._latest_positions(fragments, dataset.schema, filter)
+
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        for index, fragment in enumerate(fragments):
+            wanted = positions.get(index)
+            if wanted is None:
+                continue
+            offset = 0
+            for batch in fragment.to_batches(schema=dataset.schema, columns=columns, filter=filter):
+                lo, hi = np.searchsorted(wanted, [offset, offset + batch.num_rows])
+                if hi > lo:
+                    pending.append(batch.take(pa.array(wanted[lo:hi] - offset)))
+                    pending_rows += int(hi - lo)
+                offset += batch.num_rows
+                while pending_rows >= chunksize:
+                    table = pa.Table.from_batches(pending)
+                    yield table.slice(0, chunksize).to_pandas()
+                    pending = table.slice(chunksize).to_batches()
+                    pending_rows -= chunksize
+        if pending_rows:
+            yield pa.Table.from_batches(pending).to_pandas()
+
+    def latest(self, since: Since = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """All of ``iter_latest_frames`` as one frame (small catalogs, tests)."""
+        columns = list(columns or CATALOG_COLUMNS)
+        frames = list(self.iter_latest_frames(since, columns=columns))
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
@@ -1,27 +1,65 @@
 import os
+import json
+import uuid
+import hashlib
 import pandas as pd
 from dotenv import load_dotenv
-from typing import List
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
 from langchain_core.documents import Document
-from langchain_astradb import AstraDBVectorStore
 from prod_assistant.utils.model_loader import ModelLoader
 from prod_assistant.utils.config_loader import load_config
+from prod_assistant.utils.vector_store_loader import load_vector_store, required_env_vars
+from prod_assistant.utils.semantic_cache import mark_catalog_updated
+from prod_assistant.utils.normalize import parse_count, parse_price, parse_rating
+from prod_assistant.etl.bulk_writer import PipelinedWriter
+from prod_assistant.etl.catalog_store import CatalogStore, Since
+
+# Namespace for deterministic vector-store document ids derived from product_id
+PRODUCT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://www.flipkart.com/product")
+
+EXPECTED_COLUMNS = {'product_id','product_title', 'rating', 'total_reviews','price', 'top_reviews'}
+METADATA_COLUMNS = ["product_id", "product_title", "rating", "total_reviews", "price"]
 
 class DataIngestion:
     """
-    Class to handle data transformation and ingestion into AstraDB vector store.
+    Class to handle data transformation and ingestion into the configured vector store
+    (AstraDB or the local in-process index).
     """
 
-    def __init__(self):
+    def __init__(self, source: str = None, since: Since = None):
         """
-        Initialize environment variables, embedding model, and set CSV file path.
+        Initialize environment variables, embedding model, and the data source:
+        ``csv`` (data/product_reviews.csv) or ``catalog`` (the Parquet
+        CatalogStore, optionally only products scraped at or after ``since``).
         """
         print("Initializing DataIngestion pipeline...")
         self.model_loader=ModelLoader()
-        self._load_env_variables()
-        self.csv_path = self._get_csv_path()
-        self.product_data = self._load_csv()
         self.config=load_config()
+        self._load_env_variables()
+        ingestion_config = self.config.get("ingestion", {})
+        self.source = source or ingestion_config.get("source", "csv")
+        self.since = since
+        if self.source == "catalog":
+            self.catalog = CatalogStore.from_config()
+            # Next to (not inside) the dataset directory, which must hold only Parquet files
+            state_path = self.catalog.root
+        elif self.source == "csv":
+            if since is not None:
+                raise ValueError("'since' filtering needs ingestion source 'catalog'")
+            self.csv_path = self._get_csv_path()
+            self._load_csv()
+            state_path = os.path.splitext(self.csv_path)[0]
+        else:
+            raise ValueError(f"Unknown ingestion source: {self.source}")
+        self.incremental = ingestion_config.get("incremental", True)
+        self.chunksize = ingestion_config.get("chunksize", 10_000)
+        self.batch_size = ingestion_config.get("batch_size", 500)
+        self.write_concurrency = ingestion_config.get("write_concurrency", 4)
+        self.max_retries = ingestion_config.get("max_retries", 3)
+        self.retry_backoff_seconds = ingestion_config.get("retry_backoff_seconds", 1.0)
+        self.manifest_path = state_path + ".manifest.json"
+        self.checkpoint_path = state_path + ".checkpoint.json"
 
     def _load_env_variables(self):
         """
@@ -29,7 +67,7 @@ class DataIngestion:
         """
         load_dotenv()
         
-        required_vars = ["GOOGLE_API_KEY", "ASTRA_DB_API_ENDPOINT", "ASTRA_DB_APPLICATION_TOKEN", "ASTRA_DB_KEYSPACE"]
+        required_vars = required_env_vars(self.config)
         
         missing_vars = [var for var in required_vars if os.getenv(var) is None]
         if missing_vars:
@@ -56,73 +94,199 @@ class DataIngestion:
 
     def _load_csv(self):
         """
-        Load product data from CSV.
+        Validate the CSV header. Rows are streamed in chunks by
+        ``iter_csv_documents`` rather than loaded into memory up front.
+        """
+        columns = pd.read_csv(self.csv_path, nrows=0).columns
+        if not EXPECTED_COLUMNS.issubset(set(columns)):
+            raise ValueError(f"CSV must contain columns: {EXPECTED_COLUMNS}")
+        return self.csv_path
+
+    @staticmethod
+    def numeric_metadata(metadata: dict) -> dict:
+        """
+        Parsed numeric fields stored alongside the scraped strings, so the
+        retriever can pre-filter by price range and rating in the vector
+        store ("₹69,900" -> 69900.0, "1,90,019" -> 190019). Unparseable
+        values are None and never match a range filter.
+        """
+        return {
+            "price_value": parse_price(metadata.get("price")),
+            "rating_value": parse_rating(metadata.get("rating")),
+            "review_count": parse_count(metadata.get("total_reviews")),
+        }
+
+    @classmethod
+    def documents_from_frame(cls, frame: pd.DataFrame) -> List[Document]:
+        """
+        Convert a DataFrame chunk into Documents, filling NaN column-wise
+        (ids/titles -> "", numeric-ish fields -> "N/A", reviews -> "") and
+        adding the parsed numeric metadata.
         """
-        df = pd.read_csv(self.csv_path)
-        expected_columns = {'product_id','product_title', 'rating', 'total_reviews','price', 'top_reviews'}
+        filled = frame[METADATA_COLUMNS].fillna(
+            {"product_id": "", "product_title": "", "rating": "N/A", "total_reviews": "N/A", "price": "N/A"}
+        )
+        metadatas = filled.to_dict("records")
+        for metadata in metadatas:
+            metadata.update(cls.numeric_metadata(metadata))
+        contents = frame["top_reviews"].fillna("").tolist()
+        return [Document(page_content=c, metadata=m) for c, m in zip(contents, metadatas)]
 
-        if not expected_columns.issubset(set(df.columns)):
-            raise ValueError(f"CSV must contain columns: {expected_columns}")
+    @classmethod
+    def documents_from_rows(cls, rows: Iterable[List[str]]) -> List[Document]:
+        """
+        Convert scraper rows (CSV column order) into Documents with the same
+        fill rules as the CSV path, so both produce identical content hashes.
+        """
+        columns = ["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"]
+        return cls.documents_from_frame(pd.DataFrame(list(rows), columns=columns, dtype=object))
 
-        return df
+    @classmethod
+    def iter_csv_documents(cls, csv_path: str, chunksize: int = 10_000) -> Iterator[List[Document]]:
+        """
+        Stream the CSV in chunks and yield one list of Documents per chunk,
+        so peak memory is bounded by ``chunksize`` instead of the catalog size.
+        All columns are read as strings so values are kept as scraped.
+        """
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=str, usecols=list(EXPECTED_COLUMNS)):
+            yield cls.documents_from_frame(chunk)
+
+    def iter_documents(self) -> Iterator[Document]:
+        if self.source == "catalog":
+            # Latest version per product; partitions older than `since` are never read
+            for frame in self.catalog.iter_latest_frames(self.since, self.chunksize):
+                yield from self.documents_from_frame(frame)
+            return
+        for batch in self.iter_csv_documents(self.csv_path, self.chunksize):
+            yield from batch
 
     def transform_data(self):
         """
         Transform product data into list of LangChain Document objects.
+        Prefer ``iter_documents`` for large catalogs.
         """
-        product_list = []
-
-        for _, row in self.product_data.iterrows():
-            product_entry = {
-                    "product_id": row["product_id"],
-                    "product_title": row["product_title"],
-                    "rating": row["rating"],
-                    "total_reviews": row["total_reviews"],
-                    "price": row["price"],
-                    "top_reviews": row["top_reviews"]
-                }
-            product_list.append(product_entry)
-
-        documents = []
-        for entry in product_list:
-            # Convert NaN values to None for JSON serialization
-            metadata = {
-                    "product_id": entry["product_id"] if pd.notna(entry["product_id"]) else "",
-                    "product_title": entry["product_title"] if pd.notna(entry["product_title"]) else "",
-                    "rating": str(entry["rating"]) if pd.notna(entry["rating"]) else "N/A",
-                    "total_reviews": str(entry["total_reviews"]) if pd.notna(entry["total_reviews"]) else "N/A",
-                    "price": str(entry["price"]) if pd.notna(entry["price"]) else "N/A"
-            }
-            page_content = entry["top_reviews"] if pd.notna(entry["top_reviews"]) else ""
-            doc = Document(page_content=page_content, metadata=metadata)
-            documents.append(doc)
-
+        documents = list(self.iter_documents())
         print(f"Transformed {len(documents)} documents.")
         return documents
 
-    def store_in_vector_db(self, documents: List[Document]):
+    @staticmethod
+    def document_id(doc: Document) -> str:
         """
-        Store documents into AstraDB vector store.
+        Deterministic vector-store id for a product document, so re-ingesting
+        the same product overwrites it instead of adding a duplicate.
         """
-        collection_name=self.config["astra_db"]["collection_name"]
-        vstore = AstraDBVectorStore(
-            embedding= self.model_loader.load_embeddings(),
-            collection_name=collection_name,
-            api_endpoint=self.db_api_endpoint,
-            token=self.db_application_token,
-            namespace=self.db_keyspace,
+        product_id = str(doc.metadata.get("product_id") or "").strip()
+        if not product_id or product_id == "N/A":
+            product_id = "title:" + str(doc.metadata.get("product_title", ""))
+        return str(uuid.uuid5(PRODUCT_ID_NAMESPACE, product_id))
+
+    @staticmethod
+    def content_hash(doc: Document) -> str:
+        payload = json.dumps({"content": doc.page_content, "metadata": doc.metadata}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _plan_batch(self, batch: List[Document], previous: Dict[str, str], manifest: Dict[str, str]):
+        """
+        Compare a batch with the previous content-hash manifest and record its
+        hashes in ``manifest``. Returns (docs_to_upsert, ids_to_upsert).
+        """
+        current: Dict[str, Document] = {}
+        for doc in batch:
+            current[self.document_id(doc)] = doc  # last row wins for duplicate products
+
+        docs, ids = [], []
+        for doc_id, doc in current.items():
+            digest = self.content_hash(doc)
+            if manifest.get(doc_id, previous.get(doc_id)) != digest:
+                docs.append(doc)
+                ids.append(doc_id)
+            manifest[doc_id] = digest
+        return docs, ids
+
+    def _batched(self, documents: Iterable[Document]) -> Iterator[List[Document]]:
+        iterator = iter(documents)
+        while batch := list(islice(iterator, self.batch_size)):
+            yield batch
+
+    def _writer(self, vstore, embeddings) -> PipelinedWriter:
+        return PipelinedWriter(
+            vstore,
+            embeddings,
+            concurrency=self.write_concurrency,
+            max_retries=self.max_retries,
+            retry_backoff_seconds=self.retry_backoff_seconds,
+            checkpoint_path=self.checkpoint_path,
         )
 
-        inserted_ids = vstore.add_documents(documents)
-        print(f"Successfully inserted {len(inserted_ids)} documents into AstraDB.")
+    def store_in_vector_db(self, documents: Iterable[Document]):
+        """
+        Store documents into the configured vector store.
+
+        Documents are consumed lazily and written in batches of
+        ``ingestion.batch_size`` through a PipelinedWriter: the next batch is
+        embedded while ``ingestion.write_concurrency`` writers upload earlier
+        ones, failed batches are retried with backoff, and an interrupted run
+        resumes from its checkpoint. In incremental mode
+        (``ingestion.incremental``) only new or changed products are embedded
+        and upserted under deterministic ids, products missing from the CSV
+        are deleted, and unchanged ones cost nothing. A ``since``-filtered
+        catalog read is partial, so it never deletes.
+        """
+        embeddings = self.model_loader.load_embeddings()
+        vstore = load_vector_store(self.config, embeddings)
+        store_name = type(vstore).__name__
+        writer = self._writer(vstore, embeddings)
+
+        if not self.incremental:
+            inserted_ids = writer.write((batch, None) for batch in self._batched(documents))
+            print(f"Successfully inserted {len(inserted_ids)} documents into {store_name}.")
+            # Cached chat answers may now be stale
+            mark_catalog_updated()
+            return vstore, inserted_ids
+
+        previous = self._load_manifest()
+        # A partial read keeps every product it did not see
+        manifest: Dict[str, str] = dict(previous) if self.since is not None else {}
+
+        def planned_batches():
+            for batch in self._batched(documents):
+                docs, ids = self._plan_batch(batch, previous, manifest)
+                if docs:
+                    yield docs, ids
+
+        inserted_ids = writer.write(planned_batches())
+
+        delete_ids = [doc_id for doc_id in previous if doc_id not in manifest]
+        if delete_ids:
+            vstore.delete(ids=delete_ids)
+        # Only record progress once the store accepted the writes
+        self._save_manifest(manifest)
+
+        print(f"Incremental ingestion: {len(inserted_ids)} new/changed, {len(delete_ids)} removed, "
+              f"{len(manifest) - len(inserted_ids)} unchanged.")
+        if inserted_ids or delete_ids:
+            print(f"Successfully upserted {len(inserted_ids)} documents into {store_name}.")
+            # Cached chat answers may now be stale
+            mark_catalog_updated()
         return vstore, inserted_ids
 
     def run_pipeline(self):
         """
         Run the full data ingestion pipeline: transform data and store into vector DB.
         """
-        documents = self.transform_data()
-        vstore, _ = self.store_in_vector_db(documents)
+        vstore, _ = self.store_in_vector_db(self.iter_documents())
 
         #Optionally do a quick search
         query = "Can you tell me the low budget iphone?"
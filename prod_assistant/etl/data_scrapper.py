@@ -1,200 +1,341 @@
 import csv
 import time
-import re
 import os
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Tuple
 from selenium.webdriver.common.by import By 
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from prod_assistant.etl.driver_pool import ChromeDriverPool, launch_chrome_driver
+from prod_assistant.etl.rate_limiter import DomainRateLimiter
+from prod_assistant.etl.page_readiness import (
+    PhaseTimer,
+    scroll_until_reviews,
+    wait_for_any_selector,
+    wait_for_document_ready,
+    wait_for_dom_quiet,
+    wait_for_network_idle,
+)
+from prod_assistant.etl.page_parsers import (
+    PRICE_SELECTORS,
+    PRODUCT_LINK_SELECTOR,
+    RATING_SELECTORS,
+    REVIEW_CONTAINER_SELECTORS,
+    REVIEW_COUNT_RE,
+    REVIEW_COUNT_SELECTORS,
+    SEARCH_RESULT_SELECTOR,
+    TITLE_SELECTORS,
+    extract_reviews,
+    parse_product_page,
+    parse_search_results,
+    product_id_from_url,
+)
+from prod_assistant.etl.http_fetcher import HttpFetcher
+from prod_assistant.etl.page_cache import PageCache
+from prod_assistant.etl.catalog_store import CatalogStore
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+POPUP_CLOSE_XPATH = "//button[contains(text(), '✕')]"
+
+# Returned by _review_for in changed-only mode when the product page has not moved
+UNCHANGED = object()
+NO_REVIEWS = "No reviews found"
+
+# Chrome renders are cached under their own key, so the HTTP entry for the
+# same URL keeps its body, validators and content hash for changed-only mode
+RENDERED_PREFIX = "rendered:"
+
+def search_url_for(query):
+    return f"https://www.flipkart.com/search?q={query.replace(' ', '+')}"
+
+def rendered_key(url):
+    return RENDERED_PREFIX + url
 
 def get_chrome_driver(options=None, max_retries=3):
-    """Initialize Chrome driver with retry logic using webdriver-manager."""
-    chrome_options = Options()
-    
-    # Add essential options for stability
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
-    for attempt in range(max_retries):
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"Chrome driver initialization failed (attempt {attempt + 1}/{max_retries}): {e}")
-                print("Retrying in 5 seconds...")
-                time.sleep(5)
-            else:
-                raise Exception(f"Failed to initialize Chrome driver after {max_retries} attempts: {e}")
+    """
+    Initialize a standalone Chrome driver with retry logic using webdriver-manager.
+    Prefer ``ChromeDriverPool.shared().lease()``, which reuses warm drivers.
+    """
+    return launch_chrome_driver(max_retries)
 
 class FlipkartScraper:
-    def __init__(self, output_dir="data"):
+    def __init__(self, output_dir="data", driver_pool=None, max_workers=None, requests_per_second=None, fetch_mode=None, http_fetcher=None, page_cache=None, changed_only=None):
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
+        # Drivers are shared by search and review pages instead of launched per product
+        self.driver_pool = driver_pool or ChromeDriverPool.shared()
+
+        scraper_config = load_config().get("scraper", {})
+        # Page loads in flight at once; effectively also capped by the driver pool size
+        self.max_workers = max(1, max_workers or scraper_config.get("max_workers", 4))
+        self.rate_limiter = DomainRateLimiter(
+            requests_per_second if requests_per_second is not None else scraper_config.get("requests_per_second", 2.0),
+            burst=scraper_config.get("rate_limit_burst", 2),
+        )
+
+        # Page readiness is detected from the page itself instead of fixed sleeps
+        self.page_timeout = scraper_config.get("page_timeout", 15)
+        self.settle_timeout = scraper_config.get("settle_timeout", 5)
+        self.dom_quiet_ms = scraper_config.get("dom_quiet_ms", 300)
+        self.network_idle_ms = scraper_config.get("network_idle_ms", 500)
+        self.timings = PhaseTimer()
+
+        # "http_first" parses server-rendered HTML and only opens Chrome when content is missing
+        self.fetch_mode = fetch_mode or scraper_config.get("fetch_mode", "http_first")
+        if self.fetch_mode not in ("http_first", "browser"):
+            raise ValueError(f"Unsupported scraper fetch_mode: {self.fetch_mode}")
+        self.http = (http_fetcher or HttpFetcher.shared()) if self.fetch_mode == "http_first" else None
+        # Counters are bumped from the search / review worker threads
+        self._counter_lock = threading.Lock()
+        self.http_pages = 0
+        self.browser_fallbacks = 0
+
+        # Pages are served from the on-disk cache within their TTL; stale ones are revalidated
+        self.page_cache = page_cache if page_cache is not None else PageCache.from_config()
+        # Skip products whose page content hash has not moved since they were last scraped
+        self.changed_only = changed_only if changed_only is not None else scraper_config.get("changed_only", False)
+        if self.changed_only and self.page_cache is None:
+            raise ValueError("changed_only mode requires scraper.page_cache to be enabled")
+        self.unchanged_skipped = 0
+
+    def _count(self, counter):
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _record_timings(self, url, timer):
+        self.timings.merge(timer)
+        log.info("Scrape page timings", url=url, total=round(timer.total, 3), **timer.as_dict())
+
+    def timing_report(self):
+        """Accumulated time per scrape phase across all pages scraped so far."""
+        report = self.timings.report()
+        report += f"\n\nserved without Chrome: {self.http_pages}, Chrome fallbacks: {self.browser_fallbacks}"
+        if self.page_cache is not None:
+            report += f"\npage cache: {self.page_cache.stats()}"
+        if self.changed_only:
+            report += f"\nunchanged products skipped: {self.unchanged_skipped}"
+        return report
+
+    @staticmethod
+    def _close_popup(driver):
+        # find_elements returns immediately when there is no login popup
+        for button in driver.find_elements(By.XPATH, POPUP_CLOSE_XPATH):
+            try:
+                button.click()
+            except Exception:
+                pass  # Already closed
+
+    def _fetch_html(self, url):
+        """
+        Fetch a page over HTTP without a browser, revalidating any cached
+        copy with its ETag / Last-Modified; None when unavailable.
+        """
+        cached = self.page_cache.get(url) if self.page_cache is not None else None
+        timer = PhaseTimer()
+        with timer.phase("rate_limit"):
+            self.rate_limiter.wait(url)
+        with timer.phase("http_fetch"):
+            result = self.http.fetch_page(url, cached.etag if cached else None, cached.last_modified if cached else None)
+        self._record_timings(url, timer)
+
+        if result is None:
+            return None
+        if result.not_modified and cached is not None:
+            self.page_cache.touch(url)
+            return cached.html
+        if self.page_cache is not None:
+            self.page_cache.put(url, result.text, result.etag, result.last_modified)
+        return result.text
+
+    def _page_html(self, url):
+        """A fresh cached copy, else an HTTP fetch in http_first mode; None means only Chrome can load it."""
+        if self.page_cache is not None:
+            cached = self.page_cache.get_fresh(url)
+            if cached is not None:
+                return cached.html
+        return self._fetch_html(url) if self.http is not None else None
+
+    def _rendered_html(self, url):
+        """A fresh cached Chrome render of ``url``, or None."""
+        if self.page_cache is None:
+            return None
+        cached = self.page_cache.get_fresh(rendered_key(url))
+        return cached.html if cached is not None else None
+
+    def _reviews_from_html(self, html, count):
+        start = time.perf_counter()
+        page = parse_product_page(html, count)
+        self.timings.add("html_parse", time.perf_counter() - start)
+        # No title means a challenge/interstitial page rather than the product
+        return page["reviews"] if page["title"] else []
 
     def get_top_reviews(self, product_url, count=2):
         """Get the top reviews for a product with updated selectors."""
-        driver = get_chrome_driver()
-
         if not product_url.startswith("http"):
-            driver.quit()
-            return "No reviews found"
+            return NO_REVIEWS
+
+        html = self._page_html(product_url)
+        if html:
+            reviews = self._reviews_from_html(html, count)
+            if reviews:
+                self._count("http_pages")
+                return " || ".join(reviews[:count])
+            rendered = self._rendered_html(product_url)
+            reviews = self._reviews_from_html(rendered, count) if rendered else []
+            if reviews:
+                return " || ".join(reviews[:count])
+            self._count("browser_fallbacks")
+            log.info("Reviews not in cached/server-rendered HTML, falling back to Chrome", url=product_url)
 
         try:
-            driver.get(product_url)
-            time.sleep(5)  # Increased initial wait for page load
-            
-            # Try to close popup if it appears
-            try:
-                driver.find_element(By.XPATH, "//button[contains(text(), '✕')]").click()
-                time.sleep(1)
-            except Exception:
-                pass  # No popup or already closed
-
-            # Scroll down to load reviews section - use JavaScript for more reliable scrolling
-            for i in range(8):
-                driver.execute_script(f"window.scrollTo(0, {(i+1) * 800});")
-                time.sleep(1)
-            
-            # Scroll to bottom to ensure all dynamic content is loaded
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            
-            # Scroll back up a bit to the reviews section
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.6);")
-            time.sleep(2)
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            
-            reviews = []
-            seen = set()
-            
-            # Method 1: Look for review containers with the current Flipkart structure (2024-2025)
-            # Reviews are typically in divs with specific class patterns
-            review_container_selectors = [
-                "div.ZmyHeo",      # Review text in some layouts
-                "div.t-ZTKy",      # Review text container
-                "div._11pzQk",     # Review content wrapper
-                "div.qwjRop",      # Older review container
-                "div._6K-7Co",     # Alternative container
-                "div.cPHDOP",      # Another review text class
-            ]
-            
-            for selector in review_container_selectors:
-                if len(reviews) >= count:
-                    break
-                try:
-                    elements = soup.select(selector)
-                    for elem in elements:
-                        text = elem.get_text(separator=" ", strip=True)
-                        if text and len(text) > 50 and text not in seen:
-                            # Filter out non-review content
-                            if not any(skip in text.lower() for skip in ['add to cart', 'buy now', 'flipkart', 'seller', 'delivery']):
-                                reviews.append(text[:500])  # Limit review length
-                                seen.add(text)
-                        if len(reviews) >= count:
-                            break
-                except Exception:
-                    continue
-            
-            # Method 2: Look for reviews by finding rating stars followed by review text
-            if len(reviews) < count:
-                # Find all rating divs and get adjacent review text
-                rating_divs = soup.find_all("div", class_=re.compile(r"XQDdHH|_3LWZlK|MKiFS6"))
-                for rating_div in rating_divs:
-                    if len(reviews) >= count:
-                        break
-                    # Look for review text in parent or sibling elements
-                    parent = rating_div.find_parent("div", class_=re.compile(r"col|x_CUu6|EKxdNe"))
-                    if parent:
-                        # Find text content that looks like a review
-                        for child in parent.find_all("div"):
-                            text = child.get_text(separator=" ", strip=True)
-                            if text and len(text) > 50 and text not in seen:
-                                if not any(skip in text.lower() for skip in ['add to cart', 'buy now', 'flipkart', 'seller', 'delivery', 'helpful', 'report']):
-                                    reviews.append(text[:500])
-                                    seen.add(text)
-                                    break
-            
-            # Method 3: Find reviews by looking for the "READ MORE" pattern (reviews often have this)
-            if len(reviews) < count:
-                # Look for parent containers of "Read more" links which often contain reviews
-                read_more_elements = soup.find_all(string=re.compile(r"READ MORE|Read More|read more", re.IGNORECASE))
-                for elem in read_more_elements:
-                    if len(reviews) >= count:
-                        break
-                    parent = elem.find_parent("div")
-                    if parent:
-                        grandparent = parent.find_parent("div")
-                        if grandparent:
-                            text = grandparent.get_text(separator=" ", strip=True)
-                            text = re.sub(r"READ MORE.*", "", text, flags=re.IGNORECASE).strip()
-                            if text and len(text) > 50 and text not in seen:
-                                reviews.append(text[:500])
-                                seen.add(text)
-            
-            # Method 4: Generic approach - look for longer text blocks in review section
-            if len(reviews) < count:
-                # Find the ratings section first
-                ratings_section = soup.find("div", string=re.compile(r"Ratings?\s*&?\s*Reviews?", re.IGNORECASE))
-                if ratings_section:
-                    # Get parent container and search for review text
-                    section_parent = ratings_section.find_parent("div", class_=re.compile(r"col|MDzIYy"))
-                    if section_parent:
-                        all_divs = section_parent.find_all("div")
-                        for div in all_divs:
-                            if len(reviews) >= count:
-                                break
-                            text = div.get_text(separator=" ", strip=True)
-                            # Look for text that appears to be a review (moderate length, not UI text)
-                            if (text and 50 < len(text) < 1000 and text not in seen
-                                and not any(skip in text.lower() for skip in 
-                                    ['add to cart', 'buy now', 'flipkart', 'delivery by', 'rate product', 
-                                     'ratings &', 'all reviews', 'helpful', 'report abuse'])):
-                                reviews.append(text[:500])
-                                seen.add(text)
-            
+            with self.driver_pool.lease() as driver:
+                reviews = self._scrape_reviews(driver, product_url, count)
             print(f"Total reviews found: {len(reviews)}")
-            
         except Exception as e:
             print(f"Error occurred while scraping reviews: {e}")
             reviews = []
-        finally:
-            driver.quit()
 
-        return " || ".join(reviews[:count]) if reviews else "No reviews found"
+        return " || ".join(reviews[:count]) if reviews else NO_REVIEWS
+
+    def _scrape_reviews(self, driver, product_url, count):
+        """Load a product page on a leased driver and extract up to ``count`` reviews."""
+        timer = PhaseTimer()
+        with timer.phase("rate_limit"):
+            self.rate_limiter.wait(product_url)
+        with timer.phase("load"):
+            driver.get(product_url)
+            wait_for_document_ready(driver, self.page_timeout)
+        with timer.phase("network_idle"):
+            wait_for_network_idle(driver, self.network_idle_ms, self.settle_timeout)
+        with timer.phase("popup"):
+            self._close_popup(driver)
+
+        # Scroll only until enough reviews have rendered, letting lazy content settle per step
+        rendered = scroll_until_reviews(
+            driver, REVIEW_CONTAINER_SELECTORS, count, quiet_ms=self.dom_quiet_ms, step_timeout=self.settle_timeout, timer=timer
+        )
+        if not rendered:
+            with timer.phase("review_wait"):
+                wait_for_any_selector(driver, REVIEW_CONTAINER_SELECTORS, self.settle_timeout)
+
+        parse_start = time.perf_counter()
+        html = driver.page_source
+        reviews = extract_reviews(html, count)
+        if reviews and self.page_cache is not None:
+            self.page_cache.put(rendered_key(product_url), html)
+        timer.add("parse", time.perf_counter() - parse_start)
+        self._record_timings(product_url, timer)
+        return reviews
     
     def scrape_flipkart_products(self, query, max_products=1, review_count=2):
         """Scrape Flipkart products based on a search query."""
-        driver = get_chrome_driver()
-        search_url = f"https://www.flipkart.com/search?q={query.replace(' ', '+')}"
-        driver.get(search_url)
-        time.sleep(4)
+        return list(self.iter_products(self.search_listings(query, max_products), review_count))
+
+    def search_listings(self, query, max_products=1) -> List[Tuple]:
+        """Listing fields plus product link for the top ``max_products`` search results."""
+        search_url = search_url_for(query)
+        html = self._page_html(search_url)
+        if html:
+            listings = parse_search_results(html, max_products)
+            if listings:
+                self._count("http_pages")
+                return listings
+            rendered = self._rendered_html(search_url)
+            listings = parse_search_results(rendered, max_products) if rendered else []
+            if listings:
+                return listings
+            self._count("browser_fallbacks")
+            log.info("Search results not in cached/server-rendered HTML, falling back to Chrome", query=query)
 
+        # Release the search page's driver before fetching reviews so the pool can reuse it
         try:
-            driver.find_element(By.XPATH, "//button[contains(text(), '✕')]").click()
-        except Exception:
-            pass  # No popup
+            with self.driver_pool.lease() as driver:
+                return self._scrape_search_results(driver, query, max_products)
+        except Exception as e:
+            print(f"Error occurred while searching for '{query}': {e}")
+            return []
+
+    def _review_for(self, product_link, review_count):
+        if "flipkart.com" not in product_link:
+            return "Invalid product URL"
+        if self.changed_only:
+            # Decide from the content hash before any parsing; unknown pages are always scraped
+            if self._page_html(product_link) is not None and not self.page_cache.get(product_link).changed_since_scrape:
+                self._count("unchanged_skipped")
+                return UNCHANGED
+        reviews = self.get_top_reviews(product_link, count=review_count)
+        # Record the HTTP body's hash only once a row was actually produced from it
+        if self.page_cache is not None and reviews != NO_REVIEWS:
+            self.page_cache.mark_scraped(product_link)
+        return reviews
 
-        time.sleep(2)
-        products = []
+    def iter_products(self, listings: Iterable[Tuple], review_count=2) -> Iterator[List]:
+        """
+        Fetch reviews for ``listings`` on up to ``max_workers`` threads and
+        yield finished product rows in listing order as soon as each is ready.
+        """
+        listings = list(listings)
+        if not listings:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(listings)), thread_name_prefix="reviews") as executor:
+            futures = [executor.submit(self._review_for, listing[-1], review_count) for listing in listings]
+            for (product_id, title, rating, total_reviews, price, _), future in zip(listings, futures):
+                top_reviews = future.result()
+                if top_reviews is UNCHANGED:
+                    print(f"\nUnchanged since last scrape: {title}")
+                    continue
+                print(f"\nScraped reviews for: {title}")
+                yield [product_id, title, rating, total_reviews, price, top_reviews]
 
-        items = driver.find_elements(By.CSS_SELECTOR, "div[data-id]")[:max_products]
+    def scrape_many(self, queries: Iterable[str], max_products=1, review_count=2) -> Iterator[Tuple[str, List]]:
+        """
+        Scrape several search queries concurrently. Search pages and review
+        pages share the driver pool and rate limiter; ``(query, product_row)``
+        pairs are yielded in query order, then listing order.
+        """
+        queries = list(queries)
+        if not queries:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries)), thread_name_prefix="search") as searches, \
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="reviews") as reviews:
+            search_futures = [searches.submit(self.search_listings, q, max_products) for q in queries]
+            # Queue each query's review pages as soon as its search finishes
+            pending = []
+            for query, search in zip(queries, search_futures):
+                for listing in search.result():
+                    pending.append((query, listing, reviews.submit(self._review_for, listing[-1], review_count)))
+            for query, (product_id, title, rating, total_reviews, price, _), future in pending:
+                top_reviews = future.result()
+                if top_reviews is not UNCHANGED:
+                    yield query, [product_id, title, rating, total_reviews, price, top_reviews]
+
+    def _scrape_search_results(self, driver, query, max_products):
+        """Collect listing fields and product links from a search results page."""
+        search_url = search_url_for(query)
+        timer = PhaseTimer()
+        with timer.phase("rate_limit"):
+            self.rate_limiter.wait(search_url)
+        with timer.phase("load"):
+            driver.get(search_url)
+            wait_for_any_selector(driver, [SEARCH_RESULT_SELECTOR], self.page_timeout)
+        with timer.phase("popup"):
+            self._close_popup(driver)
+        with timer.phase("settle"):
+            wait_for_dom_quiet(driver, self.dom_quiet_ms, self.settle_timeout)
+        self._record_timings(search_url, timer)
+        if self.page_cache is not None:
+            self.page_cache.put(rendered_key(search_url), driver.page_source)
+
+        listings = []
+
+        items = driver.find_elements(By.CSS_SELECTOR, SEARCH_RESULT_SELECTOR)[:max_products]
         for item in items:
             try:
                 # Updated selectors for title (try multiple)
                 title = None
-                for selector in ["div.RG5Slk", "div.KzDlHZ", "a.wjcEIp", "div._4rR01T", "div.s1Q9rs", "a.IRpwTa"]:
+                for selector in TITLE_SELECTORS:
                     try:
                         title = item.find_element(By.CSS_SELECTOR, selector).text.strip()
                         if title:
@@ -208,7 +349,7 @@ class FlipkartScraper:
 
                 # Updated selectors for price
                 price = "N/A"
-                for selector in ["div.Nx9bqj", "div._30jeq3", "div._1_WHN1", "div.hl05eU", "div._2rQ-NK"]:
+                for selector in PRICE_SELECTORS:
                     try:
                         price = item.find_element(By.CSS_SELECTOR, selector).text.strip()
                         if price:
@@ -218,7 +359,7 @@ class FlipkartScraper:
 
                 # Updated selectors for rating
                 rating = "N/A"
-                for selector in ["div.XQDdHH", "div._3LWZlK", "span.Y1HWO0", "div.CjyrHS"]:
+                for selector in RATING_SELECTORS:
                     try:
                         rating = item.find_element(By.CSS_SELECTOR, selector).text.strip()
                         if rating:
@@ -228,10 +369,10 @@ class FlipkartScraper:
 
                 # Updated selectors for reviews count
                 total_reviews = "N/A"
-                for selector in ["span.Wphh3N", "span._2_R_DZ", "span.Qx6dsP", "span._13vcmD"]:
+                for selector in REVIEW_COUNT_SELECTORS:
                     try:
                         reviews_text = item.find_element(By.CSS_SELECTOR, selector).text.strip()
-                        match = re.search(r"[\d,]+(?=\s+Reviews?)", reviews_text, re.IGNORECASE)
+                        match = REVIEW_COUNT_RE.search(reviews_text)
                         if match:
                             total_reviews = match.group(0)
                             break
@@ -239,24 +380,24 @@ class FlipkartScraper:
                         continue
 
                 # Get product link
-                link_el = item.find_element(By.CSS_SELECTOR, "a[href*='/p/']")
+                link_el = item.find_element(By.CSS_SELECTOR, PRODUCT_LINK_SELECTOR)
                 href = link_el.get_attribute("href")
                 product_link = href if href.startswith("http") else "https://www.flipkart.com" + href
-                match = re.findall(r"/p/(itm[0-9A-Za-z]+)", href)
-                product_id = match[0] if match else "N/A"
+                product_id = product_id_from_url(href)
             except Exception as e:
                 print(f"Error occurred while processing item: {e}")
                 continue
 
-            print(f"\nScraping reviews for: {title}")
-            top_reviews = self.get_top_reviews(product_link, count=review_count) if "flipkart.com" in product_link else "Invalid product URL"
-            products.append([product_id, title, rating, total_reviews, price, top_reviews])
+            listings.append((product_id, title, rating, total_reviews, price, product_link))
 
-        driver.quit()
-        return products
+        return listings
     
-    def save_to_csv(self, data, filename="product_reviews.csv"):
-        """Save the scraped product reviews to a CSV file."""
+    def save_to_csv(self, data, filename="product_reviews.csv", merge=False):
+        """
+        Save the scraped product reviews to a CSV file. With ``merge``, rows
+        replace existing rows with the same product_id and everything else in
+        the file is kept (used by changed-only scrapes, which omit unchanged products).
+        """
         if os.path.isabs(filename):
             path = filename
         elif os.path.dirname(filename):
@@ -265,13 +406,27 @@ class FlipkartScraper:
         else:
             path = os.path.join(self.output_dir, filename)
 
+        header = ["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"]
+        if merge and os.path.exists(path):
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = {row[0]: row for row in list(csv.reader(f))[1:] if row}
+            rows.update((row[0], row) for row in data)
+            data = list(rows.values())
+
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(["product_id", "product_title", "rating", "total_reviews", "price", "top_reviews"])
+            writer.writerow(header)
             writer.writerows(data)
         
         print(f"\nData saved to: {path}")
 
+    def save_to_catalog(self, data, catalog=None):
+        """Append the scraped rows to the Parquet catalog as a new partition file."""
+        catalog = catalog or CatalogStore.from_config()
+        path = catalog.append(data)
+        print(f"\nData appended to catalog: {path}")
+        return path
+
 
 # Example usage
 if __name__ == "__main__":
@@ -283,6 +438,7 @@ if __name__ == "__main__":
     products = scraper.scrape_flipkart_products(query, max_products=2, review_count=3)
     
     # Save to CSV
+    print(scraper.timing_report())
     if products:
         scraper.save_to_csv(products, "flipkart_products.csv")
         print(f"\nScraped {len(products)} products successfully!")
@@ -0,0 +1,198 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+@lru_cache(maxsize=1)
+def chrome_driver_path() -> str:
+    """Resolve (and download if needed) the chromedriver binary once per process."""
+    path = ChromeDriverManager().install()
+    log.info("Chrome driver resolved", path=path)
+    return path
+
+
+def chrome_options() -> Options:
+    chrome_options = Options()
+
+    # Add essential options for stability
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    return chrome_options
+
+
+def launch_chrome_driver(max_retries: int = 3, retry_seconds: float = 5):
+    """Start a new Chrome instance with retry logic."""
+    for attempt in range(max_retries):
+        try:
+            return webdriver.Chrome(service=Service(chrome_driver_path()), options=chrome_options())
+        except Exception as e:
+            if attempt < max_retries - 1:
+                print(f"Chrome driver initialization failed (attempt {attempt + 1}/{max_retries}): {e}")
+                print(f"Retrying in {retry_seconds} seconds...")
+                time.sleep(retry_seconds)
+            else:
+                raise Exception(f"Failed to initialize Chrome driver after {max_retries} attempts: {e}")
+
+
+class ChromeDriverPool:
+    """
+    Bounded pool of warm Chrome drivers.
+
+    At most ``size`` drivers exist at once; ``lease()`` blocks (up to
+    ``acquire_timeout``) until one is free. Idle drivers are health-checked
+    before being handed out, and a driver is quit and replaced after
+    ``max_pages_per_driver`` leases so long scrapes don't accumulate leaked
+    memory. Use ``ChromeDriverPool.shared()`` for the process-wide pool
+    configured under ``scraper`` in config.yaml.
+    """
+
+    _shared: Optional["ChromeDriverPool"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, size: int = 2, max_pages_per_driver: int = 25, acquire_timeout: float = 120, launch_retries: int = 3):
+        self.size = max(1, size)
+        self.max_pages_per_driver = max_pages_per_driver
+        self.acquire_timeout = acquire_timeout
+        self.launch_retries = launch_retries
+
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._pages: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.launched = 0
+        self.recycled = 0
+        self.unhealthy = 0
+
+    @classmethod
+    def shared(cls) -> "ChromeDriverPool":
+        with cls._shared_lock:
+            if cls._shared is None:
+                scraper_config = load_config().get("scraper", {})
+                cls._shared = cls(
+                    size=scraper_config.get("driver_pool_size", 2),
+                    max_pages_per_driver=scraper_config.get("max_pages_per_driver", 25),
+                    acquire_timeout=scraper_config.get("driver_acquire_timeout", 120),
+                )
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    # ---------- Driver lifecycle ----------
+    @staticmethod
+    def _healthy(driver) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._healthy(driver):
+                return driver
+            self.unhealthy += 1
+            log.warning("Discarding unhealthy Chrome driver")
+            self._quit(driver)
+
+        driver = launch_chrome_driver(self.launch_retries)
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self.launched += 1
+        return driver
+
+    def _checkin(self, driver, failed: bool):
+        with self._lock:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+
+        if self._closed or pages >= self.max_pages_per_driver:
+            self.recycled += 1
+            self._quit(driver)
+            return
+        if failed and not self._healthy(driver):
+            self.unhealthy += 1
+            self._quit(driver)
+            return
+        try:
+            # Stop the previous page's scripts and timers while the driver sits idle
+            driver.get("about:blank")
+        except Exception:
+            self._quit(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def lease(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver for one page (or a short sequence of pages)."""
+        if self._closed:
+            raise RuntimeError("ChromeDriverPool is closed")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No Chrome driver available within {self.acquire_timeout}s")
+        try:
+            driver = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            try:
+                self._checkin(driver, failed)
+            finally:
+                self._slots.release()
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "launched": self.launched,
+            "recycled": self.recycled,
+            "unhealthy": self.unhealthy,
+        }
@@ -0,0 +1,157 @@
+import asyncio
+import atexit
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+import httpx
+
+from prod_assistant.etl.driver_pool import USER_AGENT
+from prod_assistant.etl.rate_limiter import DomainRateLimiter
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-IN,en;q=0.9",
+}
+
+
+@dataclass
+class FetchResult:
+    status: int
+    text: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class HttpFetcher:
+    """
+    Pooled async HTTP client for server-rendered pages.
+
+    One ``httpx.AsyncClient`` (keep-alive connection pool) lives on a
+    dedicated event-loop thread, so synchronous scraper threads can share it
+    through ``fetch`` / ``fetch_many`` while async callers use ``afetch`` /
+    ``afetch_many`` on that loop. Non-200 responses and network errors
+    return None, which callers treat as "fall back to the browser".
+    ``fetch_page`` sends ETag / Last-Modified validators so an unchanged page
+    costs a 304 instead of a full download. ``transport`` replaces the
+    network layer (e.g. ``httpx.MockTransport`` for offline tests).
+    """
+
+    _shared: Optional["HttpFetcher"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        timeout: float = 15,
+        rate_limiter: Optional[DomainRateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.requests = 0
+        self.failures = 0
+
+    @classmethod
+    def shared(cls) -> "HttpFetcher":
+        with cls._shared_lock:
+            if cls._shared is None:
+                scraper_config = load_config().get("scraper", {})
+                cls._shared = cls(
+                    max_connections=scraper_config.get("http_max_connections", 20),
+                    timeout=scraper_config.get("http_timeout", 15),
+                )
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    # ---------- Event loop ----------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="http-fetcher", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _client_for_loop(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                transport=self.transport,
+            )
+        return self._client
+
+    # ---------- Async API ----------
+    async def afetch_page(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> Optional[FetchResult]:
+        if self.rate_limiter is not None:
+            await asyncio.sleep(self.rate_limiter.reserve(url))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        self.requests += 1
+        try:
+            response = await self._client_for_loop().get(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.failures += 1
+            log.warning("HTTP fetch failed", url=url, error=str(e))
+            return None
+        if response.status_code == 304 and headers:
+            return FetchResult(304, etag=etag, last_modified=last_modified)
+        if response.status_code != 200:
+            self.failures += 1
+            log.warning("HTTP fetch returned non-200", url=url, status=response.status_code)
+            return None
+        return FetchResult(200, response.text, response.headers.get("etag"), response.headers.get("last-modified"))
+
+    async def afetch(self, url: str) -> Optional[str]:
+        result = await self.afetch_page(url)
+        return result.text if result is not None else None
+
+    async def afetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        semaphore = asyncio.Semaphore(self.max_connections)
+
+        async def fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.afetch(url)
+
+        return list(await asyncio.gather(*(fetch(u) for u in urls)))
+
+    # ---------- Sync facade ----------
+    def fetch(self, url: str) -> Optional[str]:
+        return asyncio.run_coroutine_threadsafe(self.afetch(url), self._ensure_loop()).result()
+
+    def fetch_page(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> Optional[FetchResult]:
+        return asyncio.run_coroutine_threadsafe(self.afetch_page(url, etag, last_modified), self._ensure_loop()).result()
+
+    def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        return asyncio.run_coroutine_threadsafe(self.afetch_many(list(urls)), self._ensure_loop()).result()
+
+    def close(self):
+        if self._loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._client = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+# Scripts, styles and comments carry per-request nonces/tokens that change on every load
+VOLATILE_RE = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def content_hash(html: str) -> str:
+    """Hash of the page's visible markup, stable across loads of an unchanged page."""
+    stable = WHITESPACE_RE.sub(" ", VOLATILE_RE.sub("", html))
+    return hashlib.sha256(stable.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    url: str
+    html: str
+    content_hash: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    scraped_hash: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def changed_since_scrape(self) -> bool:
+        return self.content_hash != self.scraped_hash
+
+
+class PageCache:
+    """
+    On-disk cache of scraped pages keyed by URL.
+
+    Pages are stored zlib-compressed in SQLite with their fetch time, HTTP
+    validators (ETag / Last-Modified, for conditional re-fetches) and a
+    content hash over the page's stable markup. ``scraped_hash`` records the
+    hash at the last time a product row was produced from the page, which is
+    what the scraper's changed-only mode compares against.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 86400, search_ttl_seconds: float = 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.search_ttl_seconds = search_ttl_seconds
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY, body BLOB NOT NULL, content_hash TEXT NOT NULL, fetched_at REAL NOT NULL,"
+            " etag TEXT, last_modified TEXT, scraped_hash TEXT)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @classmethod
+    def from_config(cls) -> Optional["PageCache"]:
+        cache_config = load_config().get("scraper", {}).get("page_cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        return cls(
+            path=cache_config.get("path", os.path.join("data", "page_cache.sqlite")),
+            ttl_seconds=cache_config.get("ttl_seconds", 86400),
+            search_ttl_seconds=cache_config.get("search_ttl_seconds", 3600),
+        )
+
+    def ttl_for(self, url: str) -> float:
+        return self.search_ttl_seconds if "/search?" in url else self.ttl_seconds
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """The cached page regardless of age (stale entries still carry validators)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, content_hash, fetched_at, etag, last_modified, scraped_hash FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, digest, fetched_at, etag, last_modified, scraped_hash = row
+        return CachedPage(url, zlib.decompress(body).decode("utf-8"), digest, fetched_at, etag, last_modified, scraped_hash)
+
+    def get_fresh(self, url: str) -> Optional[CachedPage]:
+        page = self.get(url)
+        if page is not None and page.age < self.ttl_for(url):
+            self.hits += 1
+            return page
+        self.misses += 1
+        return None
+
+    def put(self, url: str, html: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedPage:
+        digest = content_hash(html)
+        now = time.time()
+        body = zlib.compress(html.encode("utf-8"), 6)
+        with self._lock:
+            # Keep scraped_hash so changed-only mode can compare against the last scrape
+            self._conn.execute(
+                "INSERT INTO pages (url, body, content_hash, fetched_at, etag, last_modified) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET body = excluded.body, content_hash = excluded.content_hash, "
+                "fetched_at = excluded.fetched_at, etag = excluded.etag, last_modified = excluded.last_modified",
+                (url, body, digest, now, etag, last_modified),
+            )
+            self._conn.commit()
+            scraped = self._conn.execute("SELECT scraped_hash FROM pages WHERE url = ?", (url,)).fetchone()[0]
+        return CachedPage(url, html, digest, now, etag, last_modified, scraped)
+
+    def touch(self, url: str) -> Optional[CachedPage]:
+        """Mark a stale entry fresh again after a 304 Not Modified."""
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        self.revalidated += 1
+        return self.get(url)
+
+    def mark_scraped(self, url: str):
+        with self._lock:
+            self._conn.execute("UPDATE pages SET scraped_hash = content_hash WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def prune(self, max_age_seconds: float) -> int:
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - max_age_seconds,)).rowcount
+            self._conn.commit()
+        log.info("Page cache pruned", deleted=deleted)
+        return deleted
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "revalidated": self.revalidated,
+        }
@@ -0,0 +1,124 @@
+import re
+from typing import List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from prod_assistant.etl.review_extractor import (
+    REVIEW_CONTAINER_SELECTORS,
+    ReviewExtractor,
+    css_xpath,
+    extract_reviews,
+)
+
+# Search result cards and the fields inside them (tried in order)
+SEARCH_RESULT_SELECTOR = "div[data-id]"
+TITLE_SELECTORS = ["div.RG5Slk", "div.KzDlHZ", "a.wjcEIp", "div._4rR01T", "div.s1Q9rs", "a.IRpwTa"]
+PRICE_SELECTORS = ["div.Nx9bqj", "div._30jeq3", "div._1_WHN1", "div.hl05eU", "div._2rQ-NK"]
+RATING_SELECTORS = ["div.XQDdHH", "div._3LWZlK", "span.Y1HWO0", "div.CjyrHS"]
+REVIEW_COUNT_SELECTORS = ["span.Wphh3N", "span._2_R_DZ", "span.Qx6dsP", "span._13vcmD"]
+PRODUCT_LINK_SELECTOR = "a[href*='/p/']"
+
+# Product page fields
+PRODUCT_TITLE_SELECTORS = ["h1 span.LMizgS", "h1 span.VU-ZEz", "h1 span.B_NuCI", "h1"]
+PRODUCT_PRICE_SELECTORS = ["div.hZ3P6w", "div.Nx9bqj", "div._30jeq3"]
+PRODUCT_RATING_SELECTORS = ["div.MKiFS6", "div.XQDdHH", "div._3LWZlK"]
+
+REVIEW_COUNT_RE = re.compile(r"[\d,]+(?=\s+Reviews?)", re.IGNORECASE)
+PRODUCT_ID_RE = re.compile(r"/p/(itm[0-9A-Za-z]+)")
+FLIPKART_BASE_URL = "https://www.flipkart.com"
+
+
+def product_id_from_url(url: str) -> str:
+    match = PRODUCT_ID_RE.findall(url or "")
+    return match[0] if match else "N/A"
+
+
+def _first_text(node, selectors: List[str]) -> Optional[str]:
+    for selector in selectors:
+        element = node.select_one(selector)
+        if element is not None:
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text
+    return None
+
+
+def parse_search_results(html: str, max_products: int = 1) -> List[Tuple]:
+    """
+    Parse a server-rendered search results page into listing tuples
+    ``(product_id, title, rating, total_reviews, price, product_link)``,
+    the same shape FlipkartScraper builds from the live DOM.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    listings = []
+    for item in soup.select(SEARCH_RESULT_SELECTOR):
+        if len(listings) >= max_products:
+            break
+        title = _first_text(item, TITLE_SELECTORS)
+        link = item.select_one(PRODUCT_LINK_SELECTOR)
+        if not title or link is None or not link.get("href"):
+            continue
+        href = link["href"]
+        product_link = href if href.startswith("http") else FLIPKART_BASE_URL + href
+
+        total_reviews = "N/A"
+        for selector in REVIEW_COUNT_SELECTORS:
+            element = item.select_one(selector)
+            match = REVIEW_COUNT_RE.search(element.get_text(" ", strip=True)) if element is not None else None
+            if match:
+                total_reviews = match.group(0)
+                break
+
+        listings.append((
+            product_id_from_url(href),
+            title,
+            _first_text(item, RATING_SELECTORS) or "N/A",
+            total_reviews,
+            _first_text(item, PRICE_SELECTORS) or "N/A",
+            product_link,
+        ))
+    return listings
+
+
+def _compile_first(selectors: List[str]) -> List[etree.XPath]:
+    # Union in selector-priority order is not guaranteed, so keep one XPath per selector
+    return [etree.XPath(css_xpath(selector)) for selector in selectors]
+
+
+_PRODUCT_TITLE_XPATHS = _compile_first(PRODUCT_TITLE_SELECTORS)
+_PRODUCT_PRICE_XPATHS = _compile_first(PRODUCT_PRICE_SELECTORS)
+_PRODUCT_RATING_XPATHS = _compile_first(PRODUCT_RATING_SELECTORS)
+_CANONICAL_XPATH = etree.XPath("//link[@rel='canonical']/@href")
+_REVIEW_COUNT_TEXT_XPATH = etree.XPath("//text()[contains(., 'Review')]")
+
+
+def _first_tree_text(root, xpaths) -> Optional[str]:
+    for xpath in xpaths:
+        for element in xpath(root):
+            text = ReviewExtractor.text(element)
+            if text:
+                return text
+    return None
+
+
+def parse_product_page(html: str, review_count: int = 2) -> dict:
+    """
+    Parse a server-rendered product page. ``title`` is None when the page
+    is not a product page (e.g. a bot challenge), and ``reviews`` is empty
+    when reviews are only rendered client-side. The page is parsed once with
+    lxml and shared by the field lookups and the review extractor.
+    """
+    root = ReviewExtractor.parse(html)
+    canonical = _CANONICAL_XPATH(root)
+    total_reviews = next(
+        (m.group(0) for m in map(REVIEW_COUNT_RE.search, _REVIEW_COUNT_TEXT_XPATH(root)) if m), "N/A"
+    )
+    return {
+        "product_id": product_id_from_url(canonical[0] if canonical else ""),
+        "title": _first_tree_text(root, _PRODUCT_TITLE_XPATHS),
+        "rating": _first_tree_text(root, _PRODUCT_RATING_XPATHS) or "N/A",
+        "total_reviews": total_reviews,
+        "price": _first_tree_text(root, _PRODUCT_PRICE_XPATHS) or "N/A",
+        "reviews": extract_reviews(root, review_count),
+    }
@@ -0,0 +1,182 @@
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Iterable, Iterator, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Resolves once no DOM mutation has been seen for `quietMs`, or after `timeoutMs`.
+_DOM_QUIET_JS = """
+const [quietMs, timeoutMs, done] = arguments;
+const start = performance.now();
+let last = performance.now();
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    const now = performance.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(now - last >= quietMs);
+    } else {
+        setTimeout(check, Math.min(50, quietMs));
+    }
+})();
+"""
+
+# Resolves once no new resource timing entry has appeared for `idleMs`, or after `timeoutMs`.
+_NETWORK_IDLE_JS = """
+const [idleMs, timeoutMs, done] = arguments;
+const start = performance.now();
+const count = () => performance.getEntriesByType('resource').length;
+let seen = count();
+let last = performance.now();
+(function check() {
+    const now = performance.now();
+    const current = count();
+    if (current !== seen) { seen = current; last = now; }
+    if (now - last >= idleMs || now - start >= timeoutMs) {
+        done(now - last >= idleMs);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+# Counts rendered review blocks: known containers plus "READ MORE" truncation markers.
+_COUNT_REVIEWS_JS = """
+const [selectors, minLength] = arguments;
+let n = 0;
+for (const el of document.querySelectorAll(selectors.join(','))) {
+    if ((el.innerText || '').trim().length > minLength) n++;
+}
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+while (walker.nextNode()) {
+    if (/read more/i.test(walker.currentNode.nodeValue)) n++;
+}
+return n;
+"""
+
+
+class PhaseTimer:
+    """
+    Wall-clock timing per named scrape phase.
+
+    ``with timer.phase("load"): ...`` accumulates elapsed seconds under
+    ``"load"``; ``merge`` folds a page's timer into a scraper-wide total so
+    ``report()`` shows where scrape time goes across many pages.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float, count: int = 1):
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    def merge(self, other: "PhaseTimer"):
+        for name, seconds in other.seconds.items():
+            self.add(name, seconds, other.counts[name])
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: round(seconds, 3) for name, seconds in self.seconds.items()}
+
+    def report(self) -> str:
+        lines = [f"{'phase':<16} {'calls':>6} {'total s':>9} {'avg s':>8}"]
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            calls = self.counts[name]
+            lines.append(f"{name:<16} {calls:>6} {seconds:>9.2f} {seconds / calls:>8.2f}")
+        lines.append(f"{'total':<16} {'':>6} {self.total:>9.2f}")
+        return "\n".join(lines)
+
+
+def wait_for_document_ready(driver, timeout: float = 15) -> bool:
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_any_selector(driver, selectors: Iterable[str], timeout: float = 10) -> bool:
+    """Wait until at least one element matches any of the CSS ``selectors``."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(selectors)))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def _run_async(driver, script: str, *args, timeout: float) -> bool:
+    driver.set_script_timeout(timeout + 1)
+    try:
+        return bool(driver.execute_async_script(script, *args))
+    except TimeoutException:
+        return False
+
+
+def wait_for_dom_quiet(driver, quiet_ms: int = 300, timeout: float = 5) -> bool:
+    """Wait until the DOM has stopped mutating for ``quiet_ms``."""
+    return _run_async(driver, _DOM_QUIET_JS, quiet_ms, timeout * 1000, timeout=timeout)
+
+
+def wait_for_network_idle(driver, idle_ms: int = 500, timeout: float = 5) -> bool:
+    """Wait until no new network resource has been fetched for ``idle_ms``."""
+    return _run_async(driver, _NETWORK_IDLE_JS, idle_ms, timeout * 1000, timeout=timeout)
+
+
+def count_rendered_reviews(driver, selectors: Iterable[str], min_length: int = 50) -> int:
+    return int(driver.execute_script(_COUNT_REVIEWS_JS, list(selectors), min_length) or 0)
+
+
+def scroll_until_reviews(
+    driver,
+    selectors: Iterable[str],
+    target: int,
+    step_px: int = 800,
+    max_steps: int = 12,
+    quiet_ms: int = 300,
+    step_timeout: float = 3,
+    timer: Optional[PhaseTimer] = None,
+) -> int:
+    """
+    Scroll in ``step_px`` increments, letting lazy-loaded content settle
+    after each step, and stop as soon as ``target`` reviews have rendered or
+    the bottom of the page is reached. Returns the last review count.
+    """
+    selectors = list(selectors)
+    timer = timer or PhaseTimer()
+    rendered = count_rendered_reviews(driver, selectors)
+    for _ in range(max_steps):
+        if rendered >= target:
+            break
+        with timer.phase("scroll"):
+            driver.execute_script("window.scrollBy(0, arguments[0]);", step_px)
+        with timer.phase("settle"):
+            wait_for_dom_quiet(driver, quiet_ms, step_timeout)
+        rendered = count_rendered_reviews(driver, selectors)
+        # Checked after settling, since lazy-loaded sections grow the page
+        if driver.execute_script("return window.innerHeight + window.scrollY >= document.body.scrollHeight - 2;"):
+            break
+    return rendered
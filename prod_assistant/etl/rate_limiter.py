@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class DomainRateLimiter:
+    """
+    Thread-safe per-domain pacing for scraper page loads.
+
+    Each ``wait(url)`` reserves the next free slot for the URL's domain,
+    spacing requests at least ``1 / requests_per_second`` apart, and sleeps
+    outside the lock until that slot arrives (async callers use ``reserve``
+    and ``asyncio.sleep`` instead). Up to ``burst`` requests may
+    start back to back after an idle period. ``requests_per_second <= 0``
+    disables limiting.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0, burst: int = 1):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.burst = max(1, burst)
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """Claim the next slot for ``url``'s domain; returns the seconds until it starts."""
+        if not self.interval:
+            return 0.0
+        domain = urlparse(url).netloc or url
+        with self._lock:
+            now = time.monotonic()
+            # An idle domain earns back up to ``burst`` immediate slots
+            slot = max(self._next_slot.get(domain, 0.0), now - (self.burst - 1) * self.interval)
+            self._next_slot[domain] = slot + self.interval
+        return max(slot - now, 0.0)
+
+    def wait(self, url: str) -> float:
+        """Block until ``url`` may be requested; returns the seconds waited."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,156 @@
+import re
+from typing import Iterable, List, Optional, Union
+
+from lxml import etree, html as lxml_html
+
+# Review text containers across current and older Flipkart layouts
+REVIEW_CONTAINER_SELECTORS = [
+    "div.ZmyHeo",      # Review text in some layouts
+    "div.t-ZTKy",      # Review text container
+    "div._11pzQk",     # Review content wrapper
+    "div.qwjRop",      # Older review container
+    "div._6K-7Co",     # Alternative container
+    "div.cPHDOP",      # Another review text class
+]
+
+# UI text that disqualifies a block, per heuristic (matched as substrings of the lowercased text)
+CONTAINER_SKIP = frozenset({"add to cart", "buy now", "flipkart", "seller", "delivery"})
+ADJACENT_SKIP = CONTAINER_SKIP | {"helpful", "report"}
+SECTION_SKIP = frozenset({
+    "add to cart", "buy now", "flipkart", "delivery by", "rate product",
+    "ratings &", "all reviews", "helpful", "report abuse",
+})
+
+WHITESPACE_RE = re.compile(r"\s+")
+READ_MORE_TAIL_RE = re.compile(r"read more.*", re.IGNORECASE | re.DOTALL)
+RATINGS_HEADING_RE = re.compile(r"Ratings?\s*&?\s*Reviews?", re.IGNORECASE)
+
+
+def _skip_re(phrases: Iterable[str]) -> "re.Pattern":
+    # One alternation scans the text once instead of one `in` check per phrase
+    return re.compile("|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)))
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def css_xpath(selector: str) -> str:
+    """
+    Translate the simple CSS used by the scraper (``tag``, ``tag.class`` and
+    descendant combinators) to XPath, so lxml needs no cssselect dependency.
+    """
+    steps = []
+    for part in selector.split():
+        tag, _, cls = part.partition(".")
+        steps.append(f"{tag or '*'}[{_has_class(cls)}]" if cls else (tag or "*"))
+    return "//" + "//".join(steps)
+
+
+_LOWER = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_CONTAINER_CLASSES = [s.partition(".")[2] for s in REVIEW_CONTAINER_SELECTORS]
+
+# Known review containers and "READ MORE"-truncated review blocks, in document order
+PRIMARY_XPATH = etree.XPath(
+    "//div[" + " or ".join(_has_class(c) for c in _CONTAINER_CLASSES) + "]"
+    # Review truncation markers are spans; description/spec "Read More" toggles are divs or buttons
+    f" | //span/text()[contains({_LOWER}, 'read more')]/ancestor::div[2]"
+)
+# Fallback: the card around a star-rating badge
+RATING_CARD_XPATH = etree.XPath(
+    "//div[contains(@class, 'XQDdHH') or contains(@class, '_3LWZlK') or contains(@class, 'MKiFS6')]"
+    "/ancestor::div[contains(@class, 'col') or contains(@class, 'x_CUu6') or contains(@class, 'EKxdNe')][1]"
+)
+# Fallback: the "Ratings & Reviews" section heading
+RATINGS_HEADING_XPATH = etree.XPath("//div[not(*)][contains(., 'Rating') and contains(., 'Review')]")
+SECTION_XPATH = etree.XPath("ancestor::div[contains(@class, 'col') or contains(@class, 'MDzIYy')][1]")
+DESCENDANT_DIVS_XPATH = etree.XPath(".//div")
+
+
+class ReviewExtractor:
+    """
+    Single-parse review extractor on lxml.
+
+    The page is parsed once into an lxml tree, and one precompiled XPath
+    sweep returns every known review container and "READ MORE" review block
+    in document order. The two structural fallbacks (text near rating badges,
+    then the "Ratings & Reviews" section) run only when that sweep finds
+    fewer than ``count`` reviews. Text is normalised with compiled regexes,
+    and UI chrome is rejected by one compiled alternation per skip-phrase set.
+    """
+
+    def __init__(self, min_length: int = 50, marked_min_length: int = 10, max_length: int = 500):
+        self.min_length = min_length
+        # A "READ MORE" marker is strong evidence of a review, so short ones are kept
+        self.marked_min_length = marked_min_length
+        self.max_length = max_length
+        self._container_skip = _skip_re(CONTAINER_SKIP)
+        self._adjacent_skip = _skip_re(ADJACENT_SKIP)
+        self._section_skip = _skip_re(SECTION_SKIP)
+
+    @staticmethod
+    def parse(html: Union[str, bytes]):
+        return lxml_html.fromstring(html)
+
+    @staticmethod
+    def text(element) -> str:
+        return WHITESPACE_RE.sub(" ", " ".join(element.itertext())).strip()
+
+    def extract(self, page: Union[str, bytes, "etree._Element"], count: int = 2) -> List[str]:
+        root = self.parse(page) if isinstance(page, (str, bytes)) else page
+        reviews: List[str] = []
+        seen = set()
+
+        def accept(text: str, min_length: int, skip: Optional["re.Pattern"], max_length: Optional[int] = None) -> bool:
+            if len(text) <= min_length or text in seen or (max_length and len(text) >= max_length):
+                return False
+            if skip is not None and skip.search(text.lower()):
+                return False
+            reviews.append(text[: self.max_length])
+            seen.add(text)
+            return True
+
+        containers, marked = [], []
+        for element in PRIMARY_XPATH(root):
+            classes = element.get("class", "").split()
+            if any(c in classes for c in _CONTAINER_CLASSES):
+                containers.append(element)
+            else:
+                marked.append(element)
+
+        for element in containers:
+            if len(reviews) >= count:
+                return reviews
+            accept(self.text(element), self.min_length, self._container_skip)
+
+        for element in marked:
+            if len(reviews) >= count:
+                return reviews
+            accept(READ_MORE_TAIL_RE.sub("", self.text(element)).strip(), self.marked_min_length, None)
+
+        if len(reviews) < count:
+            for card in RATING_CARD_XPATH(root):
+                if len(reviews) >= count:
+                    return reviews
+                for child in DESCENDANT_DIVS_XPATH(card):
+                    if accept(self.text(child), self.min_length, self._adjacent_skip):
+                        break
+
+        if len(reviews) < count:
+            heading = next((h for h in RATINGS_HEADING_XPATH(root) if RATINGS_HEADING_RE.search(h.text or "")), None)
+            section = SECTION_XPATH(heading) if heading is not None else []
+            if section:
+                for div in DESCENDANT_DIVS_XPATH(section[0]):
+                    if len(reviews) >= count:
+                        break
+                    accept(self.text(div), self.min_length, self._section_skip, max_length=1000)
+
+        return reviews[:count]
+
+
+_default_extractor = ReviewExtractor()
+
+
+def extract_reviews(page, count: int = 2) -> List[str]:
+    """Extract up to ``count`` review texts from product page HTML (or a parsed lxml tree)."""
+    return _default_extractor.extract(page, count)
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+from langchain_core.documents import Document
+
+from prod_assistant.etl.bulk_writer import PipelinedWriter
+from prod_assistant.etl.catalog_store import CatalogStore
+from prod_assistant.etl.data_ingestion import DataIngestion
+from prod_assistant.etl.data_scrapper import FlipkartScraper
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+from prod_assistant.utils.model_loader import ModelLoader
+from prod_assistant.utils.semantic_cache import mark_catalog_updated
+from prod_assistant.utils.vector_store_loader import load_vector_store, required_env_vars
+
+_DONE = object()
+
+
+@dataclass
+class StreamStats:
+    rows_scraped: int = 0
+    docs_written: int = 0
+    docs_unchanged: int = 0
+    batches_written: int = 0
+    first_row_seconds: Optional[float] = None
+    first_searchable_seconds: Optional[float] = None
+    total_seconds: Optional[float] = None
+    started_at: float = field(default_factory=time.perf_counter, repr=False)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def as_dict(self) -> dict:
+        return {
+            "rows_scraped": self.rows_scraped,
+            "docs_written": self.docs_written,
+            "docs_unchanged": self.docs_unchanged,
+            "batches_written": self.batches_written,
+            "first_row_seconds": round(self.first_row_seconds, 2) if self.first_row_seconds is not None else None,
+            "first_searchable_seconds": (
+                round(self.first_searchable_seconds, 2) if self.first_searchable_seconds is not None else None
+            ),
+            "total_seconds": round(self.total_seconds, 2) if self.total_seconds is not None else None,
+        }
+
+
+class StreamingIngestion:
+    """
+    Streaming scrape -> transform -> vector store pipeline.
+
+    ``FlipkartScraper.scrape_many`` runs on a worker thread and hands each
+    product row to a bounded asyncio queue; when the queue is full the
+    scraper thread blocks, so a slow store throttles scraping instead of the
+    catalog piling up in memory. Rows are grouped into micro-batches (flushed
+    at ``batch_size`` rows or ``max_batch_wait_seconds`` after the first one),
+    converted with the DataIngestion transform and deterministic ids, and
+    upserted through a PipelinedWriter. Products become searchable after the
+    first flush instead of after the whole scrape plus a CSV round trip.
+
+    The CSV (or, with ``catalog``, a Parquet CatalogStore partition) is an
+    optional sink written once the scrape ends. When a sink is enabled, the
+    ingestion manifest next to it is kept in step, so products whose content
+    has not changed are skipped and a later ``DataIngestion`` incremental run
+    treats the streamed rows as unchanged.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[FlipkartScraper] = None,
+        vstore=None,
+        embeddings=None,
+        csv_path: Optional[str] = os.path.join("data", "product_reviews.csv"),
+        merge_csv: bool = False,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_batch_wait_seconds: Optional[float] = None,
+        catalog: Optional[CatalogStore] = None,
+    ):
+        self.config = load_config()
+        ingestion_config = self.config.get("ingestion", {})
+        streaming_config = ingestion_config.get("streaming", {})
+
+        self.scraper = scraper or FlipkartScraper()
+        if vstore is None:
+            self._load_env_variables()
+            embeddings = embeddings or ModelLoader().load_embeddings()
+            vstore = load_vector_store(self.config, embeddings)
+        self.vstore = vstore
+        self.embeddings = embeddings
+
+        self.csv_path = csv_path
+        self.merge_csv = merge_csv
+        self.catalog = catalog
+        if catalog is not None:
+            self.csv_path = None
+            self.manifest_path = catalog.root + ".manifest.json"
+        else:
+            self.manifest_path = os.path.splitext(csv_path)[0] + ".manifest.json" if csv_path else None
+        self.queue_size = queue_size or streaming_config.get("queue_size", 32)
+        self.batch_size = batch_size or streaming_config.get("batch_size", 8)
+        self.max_batch_wait_seconds = (
+            max_batch_wait_seconds if max_batch_wait_seconds is not None
+            else streaming_config.get("max_batch_wait_seconds", 1.0)
+        )
+        self.write_concurrency = ingestion_config.get("write_concurrency", 4)
+        self.max_retries = ingestion_config.get("max_retries", 3)
+        self.retry_backoff_seconds = ingestion_config.get("retry_backoff_seconds", 1.0)
+
+    def _load_env_variables(self):
+        load_dotenv()
+        missing_vars = [var for var in required_env_vars(self.config) if os.getenv(var) is None]
+        if missing_vars:
+            raise EnvironmentError(f"Missing environment variables: {missing_vars}")
+
+    # ---------- Manifest (shared with DataIngestion's incremental mode) ----------
+    def _load_manifest(self) -> Dict[str, str]:
+        if not self.manifest_path or not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        if not self.manifest_path:
+            return
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    # ---------- Stages ----------
+    def _produce(self, queries: List[str], max_products: int, review_count: int, queue: asyncio.Queue, loop, stop):
+        """Scraper thread: blocks on the bounded queue, which is the backpressure."""
+        try:
+            for _, row in self.scraper.scrape_many(queries, max_products=max_products, review_count=review_count):
+                if stop.is_set():
+                    break
+                asyncio.run_coroutine_threadsafe(queue.put(row), loop).result()
+        finally:
+            asyncio.run_coroutine_threadsafe(queue.put(_DONE), loop).result()
+
+    async def _micro_batches(self, queue: asyncio.Queue) -> AsyncIterator[List[List]]:
+        loop = asyncio.get_running_loop()
+        while (row := await queue.get()) is not _DONE:
+            pending = [row]
+            deadline = loop.time() + self.max_batch_wait_seconds
+            while len(pending) < self.batch_size:
+                try:
+                    row = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+                if row is _DONE:
+                    yield pending
+                    return
+                pending.append(row)
+            yield pending
+
+    def _plan(
+        self, rows: List[List], seen: Set[str], previous: Dict[str, str], stats: StreamStats
+    ) -> Tuple[List[List], List[Document], List[str]]:
+        """Dedupe rows across the run and drop products unchanged since the manifest."""
+        kept_rows, docs, ids = [], [], []
+        for row, doc in zip(rows, DataIngestion.documents_from_rows(rows)):
+            doc_id = DataIngestion.document_id(doc)
+            if doc_id in seen:
+                continue  # first row wins for a product returned by several queries
+            seen.add(doc_id)
+            kept_rows.append(row)
+            if previous.get(doc_id) == DataIngestion.content_hash(doc):
+                stats.docs_unchanged += 1
+                continue
+            docs.append(doc)
+            ids.append(doc_id)
+        return kept_rows, docs, ids
+
+    # ---------- Public API ----------
+    async def arun(
+        self,
+        queries: Iterable[str],
+        max_products: int = 1,
+        review_count: int = 2,
+        on_row: Optional[Callable[[List], None]] = None,
+        on_written: Optional[Callable[[List[Document]], None]] = None,
+    ) -> StreamStats:
+        """
+        Scrape ``queries`` and upsert products as they arrive. ``on_row`` and
+        ``on_written`` run on the calling event loop (the Streamlit script
+        thread when called through ``run``).
+        """
+        stats = StreamStats()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        previous = self._load_manifest()
+        manifest = dict(previous)
+        seen: Set[str] = set()
+        rows: List[List] = []
+
+        def written(docs: List[Document], ids: List[str]):
+            stats.docs_written += len(docs)
+            stats.batches_written += 1
+            if stats.first_searchable_seconds is None:
+                stats.first_searchable_seconds = stats.elapsed()
+                log.info("First streamed products searchable", seconds=round(stats.first_searchable_seconds, 2))
+            for doc in docs:
+                manifest[DataIngestion.document_id(doc)] = DataIngestion.content_hash(doc)
+            # Cached chat answers may now be stale
+            mark_catalog_updated()
+            if on_written is not None:
+                on_written(docs)
+
+        async def batches():
+            async for batch_rows in self._micro_batches(queue):
+                for row in batch_rows:
+                    stats.rows_scraped += 1
+                    if stats.first_row_seconds is None:
+                        stats.first_row_seconds = stats.elapsed()
+                    if on_row is not None:
+                        on_row(row)
+                kept_rows, docs, ids = self._plan(batch_rows, seen, previous, stats)
+                rows.extend(kept_rows)
+                if docs:
+                    yield docs, ids
+
+        writer = PipelinedWriter(
+            self.vstore,
+            self.embeddings,
+            concurrency=self.write_concurrency,
+            max_retries=self.max_retries,
+            retry_backoff_seconds=self.retry_backoff_seconds,
+            on_written=written,
+        )
+        stop = threading.Event()
+        producer = asyncio.ensure_future(
+            asyncio.to_thread(self._produce, list(queries), max_products, review_count, queue, loop, stop)
+        )
+
+        async def write():
+            try:
+                return await writer.awrite(batches())
+            finally:
+                # If writing stopped early, drain the queue so the scraper thread can exit
+                stop.set()
+                while not producer.done():
+                    while not queue.empty():
+                        queue.get_nowait()
+                    await asyncio.sleep(0.05)
+
+        results = await asyncio.gather(producer, write(), return_exceptions=True)
+
+        # Keep whatever was scraped even if some writes failed; DataIngestion can re-ingest the CSV
+        if self.catalog is not None and rows:
+            self.scraper.save_to_catalog(rows, self.catalog)
+            self._save_manifest(manifest)
+        elif self.csv_path and rows:
+            self.scraper.save_to_csv(rows, self.csv_path, merge=self.merge_csv)
+            self._save_manifest(manifest)
+        stats.total_seconds = stats.elapsed()
+        log.info("Streaming ingestion finished", **stats.as_dict())
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return stats
+
+    def run(self, queries: Iterable[str], max_products: int = 1, review_count: int = 2, on_row=None, on_written=None) -> StreamStats:
+        return asyncio.run(self.arun(queries, max_products, review_count, on_row, on_written))
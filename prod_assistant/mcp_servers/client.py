@@ -1,19 +1,13 @@
 import asyncio
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from prod_assistant.mcp_servers.session_manager import MCPSessionManager
 
 async def main():
-    client = MultiServerMCPClient({
-        "hybrid_search": {   # server name
-            "command": "python",
-            "args": [
-                r"D:\complete_content_new\llmops-batch\ecomm-prod-assistant\prod_assistant\mcp_servers\product_search_server.py"
-            ],  # absolute path
-            "transport": "stdio",
-        }
-    })
+    # One persistent session per server (see mcp_client.servers in config.yaml);
+    # every tool call below reuses it instead of reconnecting
+    sessions = MCPSessionManager.shared()
 
     # Discover tools
-    tools = await client.get_tools()
+    tools = await sessions.aget_tools("hybrid_search")
     print("Available tools:", [t.name for t in tools])
 
     # Pick tools by name
@@ -33,5 +27,7 @@ async def main():
         web_result = await web_tool.ainvoke({"query": query})
         print("Web Search Result:\n", web_result)
 
+    print("\nSession stats:", sessions.stats())
+
 if __name__ == "__main__":
     asyncio.run(main())
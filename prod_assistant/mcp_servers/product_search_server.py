@@ -1,6 +1,8 @@
+import sys
 from mcp.server.fastmcp import FastMCP
 from retriever.retrieval import Retriever  
 from langchain_community.tools import DuckDuckGoSearchRun
+from mcp_servers.tool_executor import ToolExecutor
 
 # Initialize MCP server
 mcp = FastMCP("hybrid_search")
@@ -12,6 +14,9 @@ retriever = retriever_obj.load_retriever()
 # LangChain DuckDuckGo tool
 duckduckgo = DuckDuckGoSearchRun()
 
+# Blocking tool bodies run here, off the server's event loop (config: mcp_server)
+executor = ToolExecutor.from_config()
+
 # ---------- Helpers ----------
 def format_docs(docs) -> str:
     """Format retriever docs into readable context."""
@@ -24,7 +29,8 @@ def format_docs(docs) -> str:
             f"Title: {meta.get('product_title', 'N/A')}\n"
             f"Price: {meta.get('price', 'N/A')}\n"
             f"Rating: {meta.get('rating', 'N/A')}\n"
-            f"Reviews:\n{d.page_content.strip()}"
+            + (f"Relevance: {meta['relevance_score']}\n" if meta.get("relevance_score") is not None else "")
+            + f"Reviews:\n{d.page_content.strip()}"
         )
         formatted_chunks.append(formatted)
     return "\n\n---\n\n".join(formatted_chunks)
@@ -34,7 +40,7 @@ def format_docs(docs) -> str:
 async def get_product_info(query: str) -> str:
     """Retrieve product information for a given query from local retriever."""
     try:
-        docs = retriever.invoke(query)
+        docs = await executor.run("get_product_info", retriever.invoke, query)
         context = format_docs(docs)
         if not context.strip():
             return "No local results found."
@@ -46,11 +52,12 @@ async def get_product_info(query: str) -> str:
 async def web_search(query: str) -> str:
     """Search the web using DuckDuckGo if retriever has no results."""
     try:
-        return duckduckgo.run(query)
+        return await executor.run("web_search", duckduckgo.run, query)
     except Exception as e:
         return f"Error during web search: {str(e)}"
 
 # ---------- Run Server ----------
 if __name__ == "__main__":
-    #mcp.run(transport="stdio")
-    mcp.run(transport="streamable-http")
+    # stdio when spawned by a client session (mcp_client.servers.product_retriever)
+    transport = sys.argv[sys.argv.index("--transport") + 1] if "--transport" in sys.argv else "streamable-http"
+    mcp.run(transport=transport)
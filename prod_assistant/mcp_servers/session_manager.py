@@ -0,0 +1,259 @@
+import asyncio
+import atexit
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from langchain_core.tools import ToolException
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+DEFAULT_SERVERS = {
+    "hybrid_search": {"transport": "streamable_http", "url": "http://localhost:8000/mcp"},
+}
+
+
+@dataclass
+class _ServerSession:
+    """One live MCP session and the tools loaded over it."""
+
+    tools: Dict[str, Any] = field(default_factory=dict)
+    alive: bool = False
+    closed: Optional[asyncio.Event] = None
+    task: Optional[asyncio.Task] = None
+
+
+class SessionTool:
+    """
+    Named handle on an MCP tool. ``invoke`` / ``ainvoke`` go through the
+    manager's persistent session, so the handle stays valid across
+    reconnects.
+    """
+
+    def __init__(self, manager: "MCPSessionManager", server: str, name: str, description: str = ""):
+        self.manager = manager
+        self.server = server
+        self.name = name
+        self.description = description
+
+    async def ainvoke(self, payload: dict) -> Any:
+        return await self.manager.acall(self.name, payload, server=self.server)
+
+    def invoke(self, payload: dict) -> Any:
+        return self.manager.call(self.name, payload, server=self.server)
+
+    def __repr__(self) -> str:
+        return f"SessionTool({self.server}/{self.name})"
+
+
+class MCPSessionManager:
+    """
+    Long-lived MCP client sessions shared by every AgenticRAG in the process.
+
+    ``MultiServerMCPClient.get_tools()`` returns tools that open a new
+    session per call: an HTTP handshake plus ``initialize``, or a whole
+    subprocess for stdio servers. Here each configured server gets one
+    session, opened on first use and held open by a task on a dedicated
+    event-loop thread. Concurrent tool calls are multiplexed over it (MCP
+    requests carry their own ids). A call that fails at the transport level
+    drops the session, reconnects with backoff and retries up to
+    ``max_retries`` times. Sync callers use ``call`` / ``get_tools``; async
+    callers on any loop use ``acall`` / ``aget_tools``, and cancelling them
+    cancels the in-flight call.
+    """
+
+    _shared: Optional["MCPSessionManager"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        connections: Optional[Dict[str, dict]] = None,
+        call_timeout: float = 30,
+        connect_timeout: float = 30,
+        max_retries: int = 1,
+        reconnect_backoff: float = 0.5,
+    ):
+        self.connections = dict(connections or DEFAULT_SERVERS)
+        self.default_server = next(iter(self.connections))
+        self.call_timeout = call_timeout
+        self.connect_timeout = connect_timeout
+        self.max_retries = max_retries
+        self.reconnect_backoff = reconnect_backoff
+        self.client = MultiServerMCPClient(self.connections)
+
+        self._servers: Dict[str, _ServerSession] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.calls = 0
+        self.failures = 0
+        self.sessions_opened = 0
+        self.reconnects = 0
+
+    @classmethod
+    def shared(cls) -> "MCPSessionManager":
+        with cls._shared_lock:
+            if cls._shared is None:
+                config = load_config().get("mcp_client", {})
+                cls._shared = cls(
+                    connections=config.get("servers"),
+                    call_timeout=config.get("call_timeout_seconds", 30),
+                    connect_timeout=config.get("connect_timeout_seconds", 30),
+                    max_retries=config.get("max_retries", 1),
+                    reconnect_backoff=config.get("reconnect_backoff_seconds", 0.5),
+                )
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    # ---------- Event loop ----------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="mcp-sessions", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    # ---------- Sessions (manager loop only) ----------
+    async def _hold(self, server: str, state: _ServerSession, ready: asyncio.Future):
+        # The transport's task groups must be entered and exited by the same
+        # task, so one task owns the session for its whole lifetime.
+        try:
+            async with self.client.session(server) as session:
+                tools = await load_mcp_tools(session)
+                state.tools = {tool.name: tool for tool in tools}
+                state.alive = True
+                ready.set_result(None)
+                await state.closed.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                log.warning("MCP session closed with error", server=server, error=str(e))
+        finally:
+            state.alive = False
+
+    async def _session(self, server: str) -> _ServerSession:
+        state = self._servers.get(server)
+        if state is not None and state.alive:
+            return state
+        if server not in self.connections:
+            raise KeyError(f"Unknown MCP server: {server}")
+
+        async with self._connect_locks.setdefault(server, asyncio.Lock()):
+            state = self._servers.get(server)
+            if state is not None and state.alive:
+                return state
+            state = _ServerSession(closed=asyncio.Event())
+            ready = asyncio.get_running_loop().create_future()
+            state.task = asyncio.create_task(self._hold(server, state, ready), name=f"mcp-session-{server}")
+            try:
+                await asyncio.wait_for(asyncio.shield(ready), self.connect_timeout)
+            except BaseException:
+                state.task.cancel()
+                raise
+            self._servers[server] = state
+            self.sessions_opened += 1
+            log.info("MCP session opened", server=server, tools=sorted(state.tools))
+            return state
+
+    async def _drop(self, server: str, state: _ServerSession):
+        if self._servers.get(server) is state:
+            del self._servers[server]
+        state.alive = False
+        state.closed.set()
+
+    async def _invoke(self, state: _ServerSession, tool, arguments: dict) -> Any:
+        # A dead transport does not fail pending requests, so race the call
+        # against the session task instead of waiting out call_timeout
+        call = asyncio.ensure_future(tool.ainvoke(arguments))
+        try:
+            done, _ = await asyncio.wait(
+                {call, state.task}, timeout=self.call_timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if call in done:
+                return call.result()
+            if state.task in done:
+                raise ConnectionError("MCP session closed during the call")
+            raise asyncio.TimeoutError(f"MCP tool call exceeded {self.call_timeout}s")
+        finally:
+            call.cancel()
+
+    async def _call(self, tool_name: str, arguments: dict, server: str) -> Any:
+        attempt = 0
+        while True:
+            state = None
+            try:
+                state = await self._session(server)
+                tool = state.tools.get(tool_name)
+                if tool is None:
+                    raise KeyError(f"Tool {tool_name!r} not found on MCP server {server!r}")
+                self.calls += 1
+                return await self._invoke(state, tool, arguments)
+            except (ToolException, LookupError, asyncio.TimeoutError):
+                # Tool-level errors and timeouts leave the session usable
+                self.failures += 1
+                raise
+            except Exception as e:
+                self.failures += 1
+                if attempt >= self.max_retries:
+                    raise
+                log.warning("MCP call failed, reconnecting", server=server, tool=tool_name, attempt=attempt + 1, error=str(e))
+                if state is not None:
+                    await self._drop(server, state)
+                self.reconnects += 1
+                await asyncio.sleep(self.reconnect_backoff * (2 ** attempt))
+                attempt += 1
+
+    async def _list_tools(self, server: str) -> List[SessionTool]:
+        state = await self._session(server)
+        return [SessionTool(self, server, tool.name, tool.description) for tool in state.tools.values()]
+
+    async def _close(self):
+        for server, state in list(self._servers.items()):
+            await self._drop(server, state)
+            if state.task is not None:
+                await asyncio.gather(state.task, return_exceptions=True)
+
+    # ---------- Public API ----------
+    async def acall(self, tool_name: str, arguments: dict, server: Optional[str] = None) -> Any:
+        """Call a tool from any event loop; the call itself runs on the manager loop."""
+        return await asyncio.wrap_future(self._submit(self._call(tool_name, arguments, server or self.default_server)))
+
+    def call(self, tool_name: str, arguments: dict, server: Optional[str] = None) -> Any:
+        """Blocking tool call for sync callers (sync LangGraph nodes, scripts)."""
+        return self._submit(self._call(tool_name, arguments, server or self.default_server)).result()
+
+    async def aget_tools(self, server: Optional[str] = None) -> List[SessionTool]:
+        return await asyncio.wrap_future(self._submit(self._list_tools(server or self.default_server)))
+
+    def get_tools(self, server: Optional[str] = None) -> List[SessionTool]:
+        return self._submit(self._list_tools(server or self.default_server)).result()
+
+    def stats(self) -> dict:
+        return {
+            "sessions_open": sum(state.alive for state in self._servers.values()),
+            "sessions_opened": self.sessions_opened,
+            "reconnects": self.reconnects,
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+    def close(self):
+        if self._loop is None:
+            return
+        try:
+            self._submit(self._close()).result(timeout=10)
+        except Exception as e:
+            log.warning("MCP sessions did not close cleanly", error=str(e))
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
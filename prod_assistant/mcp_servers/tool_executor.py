@@ -0,0 +1,121 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.config_loader import load_config
+
+
+class ToolExecutor:
+    """
+    Runs the blocking bodies of MCP tools (``retriever.invoke``,
+    ``duckduckgo.run``) on a bounded thread pool so they never stall the
+    server's event loop. Each tool has its own concurrency limit
+    (an ``asyncio.Semaphore``) and a timeout that covers both waiting for a
+    slot and running. A worker thread cannot be interrupted, so a call that
+    times out keeps its slot until the thread actually finishes; the limit
+    therefore bounds real concurrent work, not just waiting callers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        limits: Optional[Dict[str, dict]] = None,
+        default_concurrency: int = 8,
+        default_timeout: float = 30,
+    ):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self.limits = limits or {}
+        self.default_concurrency = default_concurrency
+        self.default_timeout = default_timeout
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_config(cls) -> "ToolExecutor":
+        config = load_config().get("mcp_server", {})
+        return cls(
+            max_workers=config.get("thread_pool_size", 16),
+            limits=config.get("tools"),
+            default_concurrency=config.get("default_max_concurrency", 8),
+            default_timeout=config.get("default_timeout_seconds", 30),
+        )
+
+    def _limit(self, tool: str) -> Tuple[int, float]:
+        limit = self.limits.get(tool, {})
+        return (
+            limit.get("max_concurrency", self.default_concurrency),
+            limit.get("timeout_seconds", self.default_timeout),
+        )
+
+    def _count(self, tool: str, key: str):
+        counters = self.counters.setdefault(tool, {"calls": 0, "timeouts": 0, "errors": 0})
+        counters[key] += 1
+
+    @staticmethod
+    async def _acquire(semaphore: asyncio.Semaphore, timeout: float) -> bool:
+        """
+        Take a permit within ``timeout``; False on timeout. ``wait_for`` around
+        ``acquire()`` can raise TimeoutError after the acquire succeeded and
+        leak the permit; here a permit won as the timeout fires is returned.
+        """
+        if sys.version_info >= (3, 11):
+            acquired = False
+            try:
+                async with asyncio.timeout(timeout):
+                    await semaphore.acquire()
+                    acquired = True
+            except TimeoutError:
+                if acquired:
+                    semaphore.release()
+                return False
+            return True
+
+        # Python 3.10 has no asyncio.timeout: acquire in a task and hand back a late permit
+        acquire = asyncio.ensure_future(semaphore.acquire())
+
+        def release_late_permit(task: asyncio.Future):
+            if not task.cancelled() and task.exception() is None:
+                semaphore.release()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(acquire), timeout)
+            return True
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            acquire.cancel()
+            acquire.add_done_callback(release_late_permit)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+
+    async def run(self, tool: str, fn: Callable, *args) -> Any:
+        """Run ``fn(*args)`` on the pool under ``tool``'s concurrency limit and timeout."""
+        max_concurrency, timeout = self._limit(tool)
+        semaphore = self._semaphores.setdefault(tool, asyncio.Semaphore(max_concurrency))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._count(tool, "calls")
+
+        if not await self._acquire(semaphore, timeout):
+            self._count(tool, "timeouts")
+            log.warning("MCP tool timed out waiting for a slot", tool=tool, timeout=timeout)
+            raise asyncio.TimeoutError(f"{tool} timed out after {timeout}s waiting for a free slot")
+
+        future = loop.run_in_executor(self.pool, fn, *args)
+        future.add_done_callback(lambda _: semaphore.release())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            self._count(tool, "timeouts")
+            log.warning("MCP tool timed out", tool=tool, timeout=timeout)
+            raise asyncio.TimeoutError(f"{tool} timed out after {timeout}s")
+        except Exception:
+            self._count(tool, "errors")
+            raise
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {tool: dict(counters) for tool, counters in self.counters.items()}
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -5,6 +5,9 @@ import string
 
 class PromptType(str, Enum):
     PRODUCT_BOT = "product_bot"
+    DOC_RELEVANCE = "doc_relevance"
+    DOC_RELEVANCE_BATCH = "doc_relevance_batch"
+    QUERY_INTENT = "query_intent"
     # REVIEW_BOT = "review_bot"
     # COMPARISON_BOT = "comparison_bot"
 
@@ -44,5 +47,48 @@ PROMPT_REGISTRY: Dict[PromptType, PromptTemplate] = {
         YOUR ANSWER:
         """,
         description="Handles ecommerce QnA & product recommendation flows"
-    )
+    ),
+    PromptType.DOC_RELEVANCE: PromptTemplate(
+        """
+        Given the following question and context, return YES if the context is relevant to the question and NO if it isn't.
+
+        > Question: {question}
+        > Context:
+        >>>
+        {context}
+        >>>
+        > Relevant (YES / NO):
+        """,
+        description="Per-document relevance filter used by retriever compression"
+    ),
+    PromptType.DOC_RELEVANCE_BATCH: PromptTemplate(
+        """
+        You are filtering retrieved product documents for a shopping assistant.
+        For the question below, decide which numbered documents are relevant.
+        Reply with the relevant document numbers separated by commas (for example: 1, 3),
+        or NONE if no document is relevant. Do not add any other text.
+
+        QUESTION: {question}
+
+        DOCUMENTS:
+        {documents}
+
+        RELEVANT DOCUMENT NUMBERS:
+        """,
+        description="Grades all retrieved documents in a single LLM call"
+    ),
+    PromptType.QUERY_INTENT: PromptTemplate(
+        """
+        Classify the user's message for an ecommerce shopping assistant into exactly one label:
+        retrieve   - needs the product catalog: prices, reviews, ratings, comparisons, recommendations
+        web_search - needs fresh information from the web: news, launches, release dates, live offers
+        answer     - greetings, chit-chat or general questions answerable without product data
+        Reply with the label only.
+
+        MESSAGE: {question}
+
+        LABEL:
+        """,
+        description="LLM fallback for the local query-intent classifier"
+    ),
 }
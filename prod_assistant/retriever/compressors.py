@@ -0,0 +1,166 @@
+import asyncio
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor, Document
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+
+from prompt_library.prompts import PROMPT_REGISTRY, PromptType
+
+RELEVANCE_SCORE_KEY = "relevance_score"
+# Leading "1, 3" / "[1], [3]" list of a batched grading reply; anything after it is ignored
+INDEX_LIST_RE = re.compile(r"^\s*\[?\d+\]?(?:\s*,\s*\[?\d+\]?)*")
+
+
+class ScoredLLMFilter(BaseDocumentCompressor, ABC):
+    """
+    Base for LLM relevance filters with a cheap embedding pre-filter.
+
+    Each document gets a cosine score against the query (stored in
+    ``metadata["relevance_score"]``). Scores at or above ``accept_threshold``
+    are kept and scores at or below ``reject_threshold`` are dropped without
+    asking the LLM; only the ambiguous band in between is graded by
+    ``_grade`` / ``_agrade``.
+    """
+
+    llm: Any
+    embeddings: Any = None
+    accept_threshold: float = 0.80
+    reject_threshold: float = 0.45
+
+    # ---------- Pre-filter ----------
+    @staticmethod
+    def _scores(query_vector: List[float], doc_vectors: List[List[float]]) -> List[float]:
+        query = np.asarray(query_vector, dtype=np.float32)
+        docs = np.asarray(doc_vectors, dtype=np.float32)
+        query /= np.linalg.norm(query) + 1e-12
+        docs /= np.linalg.norm(docs, axis=1, keepdims=True) + 1e-12
+        return (docs @ query).tolist()
+
+    def _split(self, documents: Sequence[Document], scores: Optional[List[float]]):
+        keep, ambiguous = [], []
+        for i, doc in enumerate(documents):
+            score = scores[i] if scores is not None else doc.metadata.get(RELEVANCE_SCORE_KEY)
+            if score is None:
+                ambiguous.append((i, doc))
+                continue
+            doc = Document(page_content=doc.page_content, metadata={**doc.metadata, RELEVANCE_SCORE_KEY: round(score, 4)}, id=doc.id)
+            if score >= self.accept_threshold:
+                keep.append((i, doc))
+            elif score > self.reject_threshold:
+                ambiguous.append((i, doc))
+        return keep, ambiguous
+
+    def _needs_scores(self, documents: Sequence[Document]) -> bool:
+        return self.embeddings is not None and any(RELEVANCE_SCORE_KEY not in d.metadata for d in documents)
+
+    def _prefilter(self, documents: Sequence[Document], query: str):
+        scores = None
+        if self._needs_scores(documents):
+            scores = self._scores(
+                self.embeddings.embed_query(query),
+                self.embeddings.embed_documents([d.page_content for d in documents]),
+            )
+        return self._split(documents, scores)
+
+    async def _aprefilter(self, documents: Sequence[Document], query: str):
+        scores = None
+        if self._needs_scores(documents):
+            query_vector, doc_vectors = await asyncio.gather(
+                self.embeddings.aembed_query(query),
+                self.embeddings.aembed_documents([d.page_content for d in documents]),
+            )
+            scores = self._scores(query_vector, doc_vectors)
+        return self._split(documents, scores)
+
+    # ---------- Grading (subclasses) ----------
+    @abstractmethod
+    def _grade(self, docs: List[Document], query: str, callbacks: Callbacks) -> List[bool]:
+        """One verdict per ambiguous document, in order."""
+
+    @abstractmethod
+    async def _agrade(self, docs: List[Document], query: str, callbacks: Callbacks) -> List[bool]:
+        """Async ``_grade``."""
+
+    @staticmethod
+    def _merge(keep: List[Tuple[int, Document]], ambiguous: List[Tuple[int, Document]], verdicts: List[bool]):
+        kept = keep + [item for item, ok in zip(ambiguous, verdicts) if ok]
+        return [doc for _, doc in sorted(kept, key=lambda item: item[0])]
+
+    def compress_documents(self, documents: Sequence[Document], query: str, callbacks: Callbacks = None) -> Sequence[Document]:
+        if not documents:
+            return []
+        keep, ambiguous = self._prefilter(documents, query)
+        verdicts = self._grade([d for _, d in ambiguous], query, callbacks) if ambiguous else []
+        return self._merge(keep, ambiguous, verdicts)
+
+    async def acompress_documents(self, documents: Sequence[Document], query: str, callbacks: Callbacks = None) -> Sequence[Document]:
+        if not documents:
+            return []
+        keep, ambiguous = await self._aprefilter(documents, query)
+        verdicts = await self._agrade([d for _, d in ambiguous], query, callbacks) if ambiguous else []
+        return self._merge(keep, ambiguous, verdicts)
+
+
+class BatchedLLMFilter(ScoredLLMFilter):
+    """Grades every ambiguous document in a single LLM call."""
+
+    def _chain(self):
+        prompt = PromptTemplate.from_template(PROMPT_REGISTRY[PromptType.DOC_RELEVANCE_BATCH].template)
+        return prompt | self.llm | StrOutputParser()
+
+    @staticmethod
+    def _format(docs: List[Document]) -> str:
+        return "\n\n".join(f"[{i}] {d.page_content.strip()}" for i, d in enumerate(docs, start=1))
+
+    @staticmethod
+    def _parse(answer: str, n: int) -> List[bool]:
+        # Only the leading index list counts: "1 and 2 are relevant, 3 is not"
+        # or "NONE (doc 2 mentions ...)" must not select stray numbers.
+        # Out-of-range indices are ignored.
+        match = INDEX_LIST_RE.match(answer or "")
+        selected = {int(m) for m in re.findall(r"\d+", match.group(0))} if match else set()
+        return [i in selected for i in range(1, n + 1)]
+
+    def _grade(self, docs, query, callbacks):
+        answer = self._chain().invoke({"question": query, "documents": self._format(docs)}, config={"callbacks": callbacks})
+        return self._parse(answer, len(docs))
+
+    async def _agrade(self, docs, query, callbacks):
+        answer = await self._chain().ainvoke({"question": query, "documents": self._format(docs)}, config={"callbacks": callbacks})
+        return self._parse(answer, len(docs))
+
+
+class ConcurrentLLMFilter(ScoredLLMFilter):
+    """Grades ambiguous documents with one LLM call each, at most ``max_concurrency`` at a time."""
+
+    max_concurrency: int = 4
+
+    def _chain(self):
+        prompt = PromptTemplate.from_template(PROMPT_REGISTRY[PromptType.DOC_RELEVANCE].template)
+        return prompt | self.llm | StrOutputParser()
+
+    @staticmethod
+    def _parse(answer: str) -> bool:
+        return "yes" in (answer or "").lower()
+
+    def _grade(self, docs, query, callbacks):
+        chain = self._chain()
+        inputs = [{"question": query, "context": d.page_content} for d in docs]
+        answers = chain.batch(inputs, config={"callbacks": callbacks, "max_concurrency": self.max_concurrency})
+        return [self._parse(a) for a in answers]
+
+    async def _agrade(self, docs, query, callbacks):
+        chain = self._chain()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def grade(doc: Document) -> bool:
+            async with semaphore:
+                answer = await chain.ainvoke({"question": query, "context": doc.page_content}, config={"callbacks": callbacks})
+            return self._parse(answer)
+
+        return list(await asyncio.gather(*(grade(d) for d in docs)))
@@ -0,0 +1,495 @@
+import json
+import os
+import threading
+import uuid
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.semantic_cache import read_catalog_version
+
+RELEVANCE_SCORE_KEY = "relevance_score"
+
+# Comparison operators understood in metadata filters (same syntax as the AstraDB Data API)
+RANGE_OPS = {
+    "$lt": np.less,
+    "$lte": np.less_equal,
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+}
+
+
+class LocalVectorStore(VectorStore):
+    """
+    In-process vector index backed by a NumPy matrix.
+
+    Vectors are unit-normalised float32 rows, so cosine similarity is a single
+    matrix-vector product. Persistence is append-only: new rows are written
+    to the end of a raw ``vectors.f32`` file (memory-mapped for search) and
+    one ``docstore.jsonl`` line per upsert, so a write costs O(batch) I/O
+    however large the index is. Upserts of an existing id overwrite its row
+    in place; only ``delete`` compacts both files. With ``catalog_version_file``
+    set, a search first checks the catalog version and, when another process
+    has bumped it, replays the docstore lines written since the last read. With
+    ``index="ivf"`` searches only scan the ``nprobe`` closest of ``nlist``
+    k-means clusters (rebuilt lazily after writes); ``flat`` scans everything.
+    Returned documents carry their cosine score in
+    ``metadata["relevance_score"]``.
+
+    Metadata filters take ``{"key": value}`` equality plus
+    ``$lt/$lte/$gt/$gte/$eq/$ne/$in`` conditions and ``$and``; range
+    conditions are evaluated as a mask over a cached float column per key,
+    before any vectors are scored.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    DOCSTORE_FILE = "docstore.jsonl"
+    # Single-file format written before persistence became append-only; converted on load
+    LEGACY_VECTORS_FILE = "vectors.npy"
+    LEGACY_DOCSTORE_FILE = "docstore.json"
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        path: Optional[str] = None,
+        index: str = "flat",
+        nlist: int = 64,
+        nprobe: int = 8,
+        catalog_version_file: Optional[str] = None,
+    ):
+        if index not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported local index type: {index}")
+        self._embedding = embedding
+        self.path = path
+        self.index_type = index
+        self.nlist = nlist
+        self.nprobe = nprobe
+
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._texts: List[str] = []
+        self._metadatas: List[dict] = []
+        self._id_to_row: dict = {}
+        self._vectors: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._buffer: Optional[np.ndarray] = None  # in-memory stores: rows + spare capacity
+        self._dim: Optional[int] = None
+        self._ivf: Optional[Tuple[np.ndarray, List[np.ndarray]]] = None
+        self._numeric_columns: dict = {}
+
+        # Read position in docstore.jsonl and the file it belongs to (changes on compaction)
+        self._docstore_offset = 0
+        self._docstore_inode: Optional[int] = None
+        self.catalog_version_file = catalog_version_file
+        self._catalog_version = read_catalog_version(catalog_version_file) if catalog_version_file else ""
+
+        if path:
+            self._load()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ---------- Persistence ----------
+    def _paths(self) -> Tuple[str, str]:
+        return os.path.join(self.path, self.VECTORS_FILE), os.path.join(self.path, self.DOCSTORE_FILE)
+
+    @property
+    def _row_bytes(self) -> int:
+        return self._dim * np.dtype(np.float32).itemsize
+
+    def _load(self):
+        _, docstore_path = self._paths()
+        if not os.path.exists(docstore_path) and not self._convert_legacy():
+            return
+        self._ids, self._texts, self._metadatas, self._id_to_row = [], [], [], {}
+        self._dim = None
+        self._docstore_offset = 0
+        self._docstore_inode = os.stat(docstore_path).st_ino
+        self._replay()
+        log.info("Local vector index loaded", path=self.path, documents=len(self._ids))
+
+    def _replay(self):
+        """Apply docstore records written since the last read, by this or another process."""
+        _, docstore_path = self._paths()
+        with open(docstore_path, "rb") as f:
+            f.seek(self._docstore_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # record still being written (or torn by a crash): not committed
+                self._docstore_offset += len(line)
+                record = json.loads(line)
+                if "dim" in record:
+                    self._dim = record["dim"]
+                    continue
+                row = record["row"]
+                if row == len(self._ids):
+                    self._id_to_row[record["id"]] = row
+                    self._ids.append(record["id"])
+                    self._texts.append(record["text"])
+                    self._metadatas.append(record["metadata"])
+                else:
+                    self._texts[row] = record["text"]
+                    self._metadatas[row] = record["metadata"]
+        self._map_vectors()
+        self._ivf = None
+        self._numeric_columns = {}
+
+    def _map_vectors(self):
+        # The vectors file may hold rows past the last committed docstore line
+        # (a crash between the two writes); they are ignored and overwritten.
+        vectors_path, _ = self._paths()
+        if not self._ids:
+            self._vectors = np.zeros((0, self._dim or 0), dtype=np.float32)
+            return
+        self._vectors = np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(len(self._ids), self._dim))
+
+    def _write_rows(self, rows: List[int], vectors: np.ndarray, records: List[dict]):
+        """Persist upserted rows: vectors first, then the docstore lines that commit them."""
+        vectors_path, docstore_path = self._paths()
+        os.makedirs(self.path, exist_ok=True)
+        header = b""
+        if not os.path.exists(docstore_path):
+            header = (json.dumps({"dim": self._dim}) + "\n").encode("utf-8")
+            open(vectors_path, "wb").close()
+
+        with open(vectors_path, "r+b") as f:
+            for row, vector in zip(rows, vectors):
+                f.seek(row * self._row_bytes)
+                f.write(np.ascontiguousarray(vector, dtype=np.float32).tobytes())
+        data = header + b"".join((json.dumps(r, ensure_ascii=False) + "\n").encode("utf-8") for r in records)
+        with open(docstore_path, "ab") as f:
+            f.write(data)
+        if header:
+            self._docstore_inode = os.stat(docstore_path).st_ino
+        self._docstore_offset += len(data)
+        self._map_vectors()
+
+    def _rewrite(self, vectors: np.ndarray):
+        """Write a compacted copy of both files and swap it in (delete, legacy conversion)."""
+        vectors_path, docstore_path = self._paths()
+        os.makedirs(self.path, exist_ok=True)
+        tmp_vectors, tmp_docstore = vectors_path + ".tmp", docstore_path + ".tmp"
+        np.ascontiguousarray(vectors, dtype=np.float32).tofile(tmp_vectors)
+        with open(tmp_docstore, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"dim": self._dim}) + "\n")
+            for row, (doc_id, text, metadata) in enumerate(zip(self._ids, self._texts, self._metadatas)):
+                f.write(json.dumps({"row": row, "id": doc_id, "text": text, "metadata": metadata}, ensure_ascii=False) + "\n")
+        # Readers in other processes see the new inode and reload in full
+        os.replace(tmp_vectors, vectors_path)
+        os.replace(tmp_docstore, docstore_path)
+        self._docstore_inode = os.stat(docstore_path).st_ino
+        self._docstore_offset = os.path.getsize(docstore_path)
+        self._map_vectors()
+
+    def _convert_legacy(self) -> bool:
+        vectors_path = os.path.join(self.path, self.LEGACY_VECTORS_FILE)
+        docstore_path = os.path.join(self.path, self.LEGACY_DOCSTORE_FILE)
+        if not (os.path.exists(vectors_path) and os.path.exists(docstore_path)):
+            return False
+        with open(docstore_path, "r", encoding="utf-8") as f:
+            docstore = json.load(f)
+        self._ids, self._texts, self._metadatas = docstore["ids"], docstore["texts"], docstore["metadatas"]
+        vectors = np.load(vectors_path)
+        self._dim = vectors.shape[1] if vectors.ndim == 2 else 0
+        self._rewrite(vectors)
+        log.info("Local vector index converted to append-only files", path=self.path, documents=len(self._ids))
+        return True
+
+    def _maybe_reload(self):
+        """Pick up documents another process ingested once it has bumped the catalog version."""
+        if not (self.path and self.catalog_version_file):
+            return
+        version = read_catalog_version(self.catalog_version_file)
+        if version == self._catalog_version:
+            return
+        self._catalog_version = version
+        _, docstore_path = self._paths()
+        try:
+            inode = os.stat(docstore_path).st_ino
+        except FileNotFoundError:
+            return
+        if inode != self._docstore_inode:
+            self._load()  # first index, or compacted by a delete
+        else:
+            before = len(self._ids)
+            self._replay()
+            log.info("Local vector index refreshed", path=self.path, added=len(self._ids) - before,
+                     documents=len(self._ids))
+
+    # ---------- Writes ----------
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            return vectors / (np.linalg.norm(vectors) + 1e-12)
+        return vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12)
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Embed and upsert texts; existing ids are replaced in place."""
+        texts = list(texts)
+        if not texts:
+            return []
+        metadatas = list(metadatas) if metadatas else [{} for _ in texts]
+        ids = [i or uuid.uuid4().hex for i in ids] if ids else [uuid.uuid4().hex for _ in texts]
+        vectors = self._normalize(self._embedding.embed_documents(texts))
+
+        with self._lock:
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+            rows, records = [], []
+            for doc_id, text, metadata, vector in zip(ids, texts, metadatas, vectors):
+                row = self._id_to_row.get(doc_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._id_to_row[doc_id] = row
+                    self._ids.append(doc_id)
+                    self._texts.append(text)
+                    self._metadatas.append(dict(metadata))
+                else:
+                    self._texts[row] = text
+                    self._metadatas[row] = dict(metadata)
+                rows.append(row)
+                records.append({"row": row, "id": doc_id, "text": text, "metadata": dict(metadata)})
+            if self.path:
+                self._write_rows(rows, vectors, records)
+            else:
+                self._store_rows(rows, vectors)
+            self._ivf = None
+            self._numeric_columns = {}
+        return ids
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        if not ids:
+            return False
+        with self._lock:
+            drop = {self._id_to_row[i] for i in ids if i in self._id_to_row}
+            if not drop:
+                return False
+            keep = [r for r in range(len(self._ids)) if r not in drop]
+            vectors = np.array(self._vectors[keep], dtype=np.float32)
+            self._ids = [self._ids[r] for r in keep]
+            self._texts = [self._texts[r] for r in keep]
+            self._metadatas = [self._metadatas[r] for r in keep]
+            self._id_to_row = {doc_id: i for i, doc_id in enumerate(self._ids)}
+            if self.path:
+                self._rewrite(vectors)
+            else:
+                self._buffer = vectors
+                self._vectors = vectors
+            self._ivf = None
+            self._numeric_columns = {}
+        return True
+
+    def _store_rows(self, rows: List[int], vectors: np.ndarray):
+        """In-memory stores: write rows into a buffer that doubles when full."""
+        needed = max(rows) + 1
+        if self._buffer is None or self._buffer.shape[0] < needed:
+            capacity = max(needed, 2 * (0 if self._buffer is None else self._buffer.shape[0]), 64)
+            buffer = np.zeros((capacity, self._dim), dtype=np.float32)
+            if self._buffer is not None:
+                buffer[: len(self._vectors)] = self._vectors
+            self._buffer = buffer
+        self._buffer[rows] = vectors
+        self._vectors = self._buffer[: len(self._ids)]
+
+    def get_by_ids(self, ids, /) -> List[Document]:
+        with self._lock:
+            self._maybe_reload()
+            return [self._document(self._id_to_row[i]) for i in ids if i in self._id_to_row]
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        *,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        store = cls(embedding, **kwargs)
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
+
+    # ---------- IVF index ----------
+    def _build_ivf(self, iterations: int = 10, seed: int = 0):
+        vectors = np.asarray(self._vectors)
+        nlist = min(self.nlist, len(vectors))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = vectors[assign == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = self._normalize(centroids)
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        lists = [np.flatnonzero(assign == c) for c in range(nlist)]
+        self._ivf = (centroids, lists)
+
+    def _probe_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows to scan for this query, or None for a full scan."""
+        if self.index_type != "ivf" or len(self._ids) < self.nlist * 4:
+            return None
+        if self._ivf is None:
+            self._build_ivf()
+        centroids, lists = self._ivf
+        nearest = np.argsort(-(centroids @ query))[: self.nprobe]
+        return np.concatenate([lists[c] for c in nearest])
+
+    # ---------- Search ----------
+    @staticmethod
+    def _value_matches(value: Any, condition: Any) -> bool:
+        if not isinstance(condition, dict):
+            return value == condition
+        for op, operand in condition.items():
+            if op == "$eq":
+                ok = value == operand
+            elif op == "$ne":
+                ok = value != operand
+            elif op == "$in":
+                ok = value in operand
+            elif op in RANGE_OPS:
+                ok = isinstance(value, (int, float)) and bool(RANGE_OPS[op](value, operand))
+            else:
+                raise ValueError(f"Unsupported metadata filter operator: {op}")
+            if not ok:
+                return False
+        return True
+
+    def _numeric_column(self, key: str) -> np.ndarray:
+        """``key`` across all rows as float64, NaN where missing or non-numeric."""
+        column = self._numeric_columns.get(key)
+        if column is None:
+            column = np.array(
+                [v if isinstance(v, (int, float)) and not isinstance(v, bool) else np.nan
+                 for v in (m.get(key) for m in self._metadatas)],
+                dtype=np.float64,
+            )
+            self._numeric_columns[key] = column
+        return column
+
+    def _filter_mask(self, filter: dict) -> np.ndarray:
+        """Boolean mask over all rows; range conditions are vectorised, the rest checked per row."""
+        mask = np.ones(len(self._ids), dtype=bool)
+        for key, condition in filter.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._filter_mask(clause)
+            elif isinstance(condition, dict) and condition and set(condition) <= set(RANGE_OPS):
+                column = self._numeric_column(key)
+                with np.errstate(invalid="ignore"):
+                    for op, operand in condition.items():
+                        mask &= RANGE_OPS[op](column, operand)  # NaN compares False
+            else:
+                mask &= np.fromiter(
+                    (self._value_matches(m.get(key), condition) for m in self._metadatas), dtype=bool, count=len(self._ids)
+                )
+        return mask
+
+    def _document(self, row: int, score: Optional[float] = None) -> Document:
+        metadata = dict(self._metadatas[row])
+        if score is not None:
+            metadata[RELEVANCE_SCORE_KEY] = round(float(score), 4)
+        return Document(id=self._ids[row], page_content=self._texts[row], metadata=metadata)
+
+    def _candidates(self, query: np.ndarray, fetch_k: int, filter: Optional[dict]):
+        """Top ``fetch_k`` rows by cosine similarity, best first."""
+        if not self._ids:
+            return np.array([], dtype=int), np.array([], dtype=np.float32)
+        rows = self._probe_rows(query)
+        if rows is None:
+            rows = np.arange(len(self._ids))
+        if filter:
+            rows = rows[self._filter_mask(filter)[rows]]
+            if not len(rows):
+                return rows, np.array([], dtype=np.float32)
+        scores = np.asarray(self._vectors[rows]) @ query
+        if fetch_k < len(rows):
+            top = np.argpartition(-scores, fetch_k - 1)[:fetch_k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-scores[top])]
+        return rows[top], scores[top]
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        with self._lock:
+            self._maybe_reload()
+            rows, scores = self._candidates(self._normalize(embedding), k, filter)
+            return [(self._document(r, s), float(s)) for r, s in zip(rows, scores)]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self._embedding.embed_query(query), k, filter)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, filter)]
+
+    def similarity_search(self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are already cosine similarities
+        return lambda score: score
+
+    @staticmethod
+    def _mmr(query_scores: np.ndarray, candidates: np.ndarray, k: int, lambda_mult: float) -> List[int]:
+        """Vectorised maximal marginal relevance over the candidate matrix."""
+        pairwise = candidates @ candidates.T
+        selected = [int(np.argmax(query_scores))]
+        max_sim = pairwise[selected[0]].copy()
+        for _ in range(1, min(k, len(candidates))):
+            mmr = lambda_mult * query_scores - (1 - lambda_mult) * max_sim
+            mmr[selected] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            np.maximum(max_sim, pairwise[best], out=max_sim)
+        return selected
+
+    def max_marginal_relevance_search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        with self._lock:
+            self._maybe_reload()
+            rows, scores = self._candidates(self._normalize(embedding), fetch_k, filter)
+            if not len(rows):
+                return []
+            order = self._mmr(scores, np.asarray(self._vectors[rows]), k, lambda_mult)
+            return [self._document(rows[i], scores[i]) for i in order]
+
+    def max_marginal_relevance_search(
+        self,
+        query: str,
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        return self.max_marginal_relevance_search_by_vector(
+            self._embedding.embed_query(query), k, fetch_k, lambda_mult, filter
+        )
@@ -0,0 +1,142 @@
+import re
+from typing import Any, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStoreRetriever
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+from prod_assistant.utils.normalize import MAX_RATING, parse_number
+
+# Below this a "price" is almost certainly something else ("under 2 years old")
+MIN_PLAUSIBLE_PRICE = 100
+
+_CURRENCY = r"(?:rs\.?|inr|₹|rupees?)"
+_SCALE = r"(?:k|thousand|l|lakhs?|lacs?|cr|crores?)"
+_AMOUNT = rf"((?:{_CURRENCY}\s*)?\d[\d,]*(?:\.\d+)?(?:\s*{_SCALE})?)\b"
+BETWEEN_RE = re.compile(rf"\bbetween\s+{_AMOUNT}\s*(?:and|to|-)\s*{_AMOUNT}", re.IGNORECASE)
+MAX_PRICE_RE = re.compile(
+    rf"(?:\bunder|\bbelow|\bless\s+than|\bwithin|\bup\s*to|\bmax(?:imum)?|\bcheaper\s+than|\bbudget\s+(?:of\s+)?|<=?)\s*{_AMOUNT}",
+    re.IGNORECASE,
+)
+MIN_PRICE_RE = re.compile(
+    rf"(?:\babove|\bover|\bmore\s+than|\bat\s+least|\bstarting\s+(?:from|at)|\bcostlier\s+than|>=?)\s*{_AMOUNT}",
+    re.IGNORECASE,
+)
+# An amount only counts as money with a currency marker or scale suffix on it,
+# or a price word somewhere in the query ("price", "budget", "costs")
+MONEY_RE = re.compile(rf"{_CURRENCY}|\d\s*{_SCALE}\b", re.IGNORECASE)
+TRAILING_CURRENCY_RE = re.compile(r"\s*(?:rs\b|inr\b|rupees?\b|/-)", re.IGNORECASE)
+PRICE_WORD_RE = re.compile(r"\b(?:price[ds]?|pricing|budget|costs?|costing)\b", re.IGNORECASE)
+# A spec, not a price: "256 GB", "up to 300 mAh", "over 200 MP", "above 55\"" / "55 in"
+UNIT_RE = re.compile(
+    r'\s*(?:(?:gb|tb|mb|mp|mah|inch(?:es)?|hz|khz|mhz|ghz|w|watts?|mm|cm|kg|nits)\b|in\b(?!\s+[a-z])|")',
+    re.IGNORECASE,
+)
+# "rated 4+", "rating above 4.2", "at least 4 stars", "4.5★"
+MIN_RATING_RES = [
+    re.compile(
+        r"\brat(?:ing|ed)\s*(?:of\s+)?(?:above|over|at\s+least|more\s+than|>=?|min(?:imum)?)?\s*(\d(?:\.\d)?)\s*\+?",
+        re.IGNORECASE,
+    ),
+    re.compile(r"(?:\bat\s+least\s+|\babove\s+|\bover\s+)?\b(\d(?:\.\d)?)\s*(?:\+\s*)?(?:stars?|★)", re.IGNORECASE),
+]
+
+
+def _amount(match: re.Match, group: int) -> Optional[float]:
+    """The amount in ``group`` of a price match; None when it is a spec (unit after it) or implausibly small."""
+    if UNIT_RE.match(match.string, match.end(group)):
+        return None
+    value = parse_number(match.group(group))
+    return value if value is not None and value >= MIN_PLAUSIBLE_PRICE else None
+
+
+def _is_money(match: re.Match, group: int, price_context: bool) -> bool:
+    return (
+        price_context
+        or MONEY_RE.search(match.group(group)) is not None
+        or TRAILING_CURRENCY_RE.match(match.string, match.end(group)) is not None
+    )
+
+
+def _price(pattern: re.Pattern, text: str, price_context: bool) -> Optional[float]:
+    """First amount matched by ``pattern`` that reads as a price, skipping specs."""
+    for match in pattern.finditer(text):
+        value = _amount(match, 1) if _is_money(match, 1, price_context) else None
+        if value is not None:
+            return value
+    return None
+
+
+def parse_query_filter(query: str) -> Optional[dict]:
+    """
+    Turn budget / rating constraints in a free-text query into a metadata
+    filter over the numeric fields written at ingest time, e.g.
+    "phones under 1,00,000 INR rated 4+" ->
+    ``{"price_value": {"$lte": 100000.0}, "rating_value": {"$gte": 4.0}}``.
+    A bare number is only a price with a currency marker, a k / lakh
+    suffix or a price word in the query, and never when a unit follows it
+    ("up to 512 GB"). Returns None when the query has no such constraint.
+    """
+    text = query or ""
+    filter: dict = {}
+
+    for pattern in MIN_RATING_RES:
+        match = pattern.search(text)
+        if match and 0 < float(match.group(1)) <= MAX_RATING:
+            filter["rating_value"] = {"$gte": float(match.group(1))}
+            # So "rated over 4" is not also read as a minimum price
+            text = text[: match.start()] + " " + text[match.end():]
+            break
+
+    price: dict = {}
+    price_context = PRICE_WORD_RE.search(text) is not None
+    between = BETWEEN_RE.search(text)
+    if between:
+        # "between ₹20,000 and 30,000": one marked end makes both money
+        if price_context or _is_money(between, 1, False) or _is_money(between, 2, False):
+            low, high = _amount(between, 1), _amount(between, 2)
+            if low is not None and high is not None:
+                price = {"$gte": min(low, high), "$lte": max(low, high)}
+    else:
+        high = _price(MAX_PRICE_RE, text, price_context)
+        if high is not None:
+            price["$lte"] = high
+        low = _price(MIN_PRICE_RE, text, price_context)
+        if low is not None:
+            price["$gte"] = low
+    if price:
+        filter["price_value"] = price
+
+    return filter or None
+
+
+class MetadataFilteredRetriever(VectorStoreRetriever):
+    """
+    VectorStoreRetriever that derives a metadata pre-filter (price range,
+    minimum rating) from each query and passes it to the vector store, so
+    the similarity search only ranks products that satisfy the constraint.
+    AstraDB applies the filter server-side; LocalVectorStore masks rows on
+    its numeric metadata columns before scoring.
+    """
+
+    def _search_kwargs(self, query: str, kwargs: dict) -> dict:
+        if "filter" in kwargs or "filter" in self.search_kwargs:
+            return kwargs
+        filter = parse_query_filter(query)
+        if filter is None:
+            return kwargs
+        log.info("Retriever metadata pre-filter", query=query, filter=filter)
+        return {**kwargs, "filter": filter}
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> List[Document]:
+        return super()._get_relevant_documents(query, run_manager=run_manager, **self._search_kwargs(query, kwargs))
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> List[Document]:
+        return await super()._aget_relevant_documents(
+            query, run_manager=run_manager, **self._search_kwargs(query, kwargs)
+        )
@@ -1,10 +1,12 @@
 import os
-from langchain_astradb import AstraDBVectorStore
 from utils.config_loader import load_config
 from utils.model_loader import ModelLoader
+from utils.vector_store_loader import load_vector_store, required_env_vars
 from dotenv import load_dotenv
 from langchain.retrievers.document_compressors import LLMChainFilter
 from langchain.retrievers import ContextualCompressionRetriever
+from retriever.compressors import BatchedLLMFilter, ConcurrentLLMFilter
+from retriever.metadata_filter import MetadataFilteredRetriever
 from evaluation.ragas_eval import evaluate_context_precision, evaluate_response_relevancy
 # Add the project root to the Python path for direct script execution
 # project_root = Path(__file__).resolve().parents[2]
@@ -25,7 +27,7 @@ class Retriever:
         """
         load_dotenv()
          
-        required_vars = ["GOOGLE_API_KEY", "ASTRA_DB_API_ENDPOINT", "ASTRA_DB_APPLICATION_TOKEN", "ASTRA_DB_KEYSPACE"]
+        required_vars = required_env_vars(self.config)
         
         missing_vars = [var for var in required_vars if os.getenv(var) is None]
         
@@ -41,37 +43,69 @@ class Retriever:
         """_summary_
         """
         if not self.vstore:
-            collection_name = self.config["astra_db"]["collection_name"]
-            
-            self.vstore =AstraDBVectorStore(
-                embedding= self.model_loader.load_embeddings(),
-                collection_name=collection_name,
-                api_endpoint=self.db_api_endpoint,
-                token=self.db_application_token,
-                namespace=self.db_keyspace,
-                )
+            self.vstore = load_vector_store(self.config, self.model_loader.load_embeddings())
         if not self.retriever_instance:
             top_k = self.config["retriever"]["top_k"] if "retriever" in self.config else 3
-            
-            mmr_retriever=self.vstore.as_retriever(
-                search_type="mmr",
-                search_kwargs={"k": top_k,
-                                "fetch_k": 20,
-                                "lambda_mult": 0.7,
-                                "score_threshold": 0.6
-                               })
+            search_kwargs = {"k": top_k,
+                             "fetch_k": 20,
+                             "lambda_mult": 0.7,
+                             "score_threshold": 0.6
+                            }
+
+            # Budget / rating constraints in the query become a vector-store metadata pre-filter
+            if self.config.get("retriever", {}).get("metadata_filter", True):
+                mmr_retriever = MetadataFilteredRetriever(
+                    vectorstore=self.vstore, search_type="mmr", search_kwargs=search_kwargs
+                )
+            else:
+                mmr_retriever = self.vstore.as_retriever(search_type="mmr", search_kwargs=search_kwargs)
             print("Retriever loaded successfully.")
             
-            llm = self.model_loader.load_llm()
-            
-            compressor=LLMChainFilter.from_llm(llm)
-            
-            self.retriever_instance = ContextualCompressionRetriever(
-                base_compressor=compressor, 
-                base_retriever=mmr_retriever
-            )
+            compressor = self._load_compressor()
+            if compressor is None:
+                self.retriever_instance = mmr_retriever
+            else:
+                self.retriever_instance = ContextualCompressionRetriever(
+                    base_compressor=compressor, 
+                    base_retriever=mmr_retriever
+                )
             
         return self.retriever_instance
+
+    def _load_compressor(self):
+        """
+        Build the document filter selected by ``retriever.compression.mode``:
+        llm_chain_filter (one sequential LLM call per doc), batched (one call
+        for all docs), concurrent (one call per doc, bounded parallelism) or
+        none. batched/concurrent skip the LLM for docs whose embedding score
+        is a clear hit or a clear miss.
+        """
+        compression = self.config.get("retriever", {}).get("compression", {})
+        mode = compression.get("mode", "llm_chain_filter")
+        if mode == "none":
+            return None
+
+        llm = self.model_loader.load_llm()
+        if mode == "llm_chain_filter":
+            return LLMChainFilter.from_llm(llm)
+
+        prefilter = compression.get("prefilter", {})
+        kwargs = {"llm": llm}
+        if prefilter.get("enabled", True):
+            kwargs.update(
+                embeddings=self.vstore.embeddings,
+                accept_threshold=prefilter.get("accept_threshold", 0.80),
+                reject_threshold=prefilter.get("reject_threshold", 0.45),
+            )
+        else:
+            # Everything is ambiguous -> every doc goes to the LLM
+            kwargs.update(accept_threshold=float("inf"), reject_threshold=float("-inf"))
+
+        if mode == "batched":
+            return BatchedLLMFilter(**kwargs)
+        if mode == "concurrent":
+            return ConcurrentLLMFilter(max_concurrency=compression.get("max_concurrency", 4), **kwargs)
+        raise ValueError(f"Unsupported retriever compression mode: {mode}")
             
     def call_retriever(self,query):
         """_summary_
@@ -1,14 +1,28 @@
 
+import asyncio
+import json
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from langchain_core.messages import HumanMessage
-from workflow.agentic_workflow_with_mcp_websearch import AgenticRAG
+from workflow.engine_pool import EnginePool
 
-app = FastAPI()
+engine_pool = EnginePool()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build and warm the shared engines once per worker process
+    await engine_pool.start()
+    yield
+    await engine_pool.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
@@ -20,14 +34,86 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+async def _cancel_on_disconnect(request: Request, coro, poll_interval: float = 0.5):
+    """
+    Await ``coro`` but cancel it if the client disconnects, so abandoned chats
+    stop consuming LLM calls. Returns None when the request was cancelled.
+    """
+    task = asyncio.create_task(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                return None
+    finally:
+        # Also propagate cancellation of the handler itself (server shutdown)
+        if not task.done():
+            task.cancel()
+
+
 # ---------- FastAPI Endpoints ----------
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     return templates.TemplateResponse("chat.html", {"request": request})
 
 
+@app.get("/health")
+async def health():
+    """Liveness probe: the process is up, engines may still be warming."""
+    return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: embeddings, vector store and MCP tools are loaded."""
+    status = engine_pool.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Semantic and embedding cache counters for this worker."""
+    return engine_pool.metrics()
+
+
 @app.post("/get")
-async def chat(msg: str = Form(...)):
-    rag_agent = AgenticRAG()
-    answer = await rag_agent.run(msg)
+async def chat(request: Request, msg: str = Form(...)):
+    if not engine_pool.ready:
+        return JSONResponse({"error": "Assistant is warming up, please retry shortly."}, status_code=503)
+    answer = await _cancel_on_disconnect(request, engine_pool.run(msg))
+    if answer is None:
+        return Response(status_code=499)  # client closed request
     return answer
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@app.post("/get/stream")
+async def chat_stream(msg: str = Form(...)):
+    """
+    Server-Sent Events variant of /get: node progress and Generator tokens are
+    pushed as they arrive. A client disconnect cancels the generator, which in
+    turn cancels the in-flight graph run.
+    """
+    if not engine_pool.ready:
+        return JSONResponse({"error": "Assistant is warming up, please retry shortly."}, status_code=503)
+
+    async def event_source():
+        try:
+            async for event in engine_pool.stream(msg):
+                yield _sse(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            yield _sse({"type": "error", "message": str(e)})
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,251 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+
+class _Abandoned(Exception):
+    """Set on in-flight futures whose owner was cancelled before computing them."""
+
+
+class EmbeddingStore:
+    """SQLite-backed map of content hash -> float32 vector."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]):
+        if not items:
+            return
+        rows = [(k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in items.items()]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper with a persistent, content-hash-keyed cache.
+
+    - Vectors are stored in SQLite keyed by sha256(model, kind, text), so
+      repeated queries and re-ingested reviews never hit the remote API twice.
+    - Identical texts within a call are embedded once, and concurrent callers
+      asking for a text that is already in flight wait for that result instead
+      of issuing their own request (sync and async callers share the registry).
+      If the owner fails, waiters get its error; if it is cancelled, a waiter
+      computes the text itself.
+    - Misses are sent to the underlying model in batches of ``batch_size``.
+    """
+
+    _shared: Dict[Tuple[str, str], "CachedEmbeddings"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, underlying: Embeddings, model_name: str, path: str, batch_size: int = 100):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.store = EmbeddingStore(path)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.remote_calls = 0
+
+    @classmethod
+    def shared(cls, model_name: str, factory, path: str, batch_size: int = 100) -> "CachedEmbeddings":
+        """Return the process-wide instance for (model, path), creating it via ``factory``."""
+        key = (model_name, os.path.abspath(path))
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(factory(), model_name, path, batch_size)
+                log.info("Embedding cache opened", model=model_name, path=path)
+            return cls._shared[key]
+
+    @classmethod
+    def all_stats(cls) -> List[dict]:
+        return [inst.stats() for inst in cls._shared.values()]
+
+    # ---------- Helpers ----------
+    def _key(self, kind: str, text: str) -> str:
+        # Query and document embeddings differ for retrieval models (task_type)
+        return hashlib.sha256(f"{self.model_name}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, kind: str, texts: List[str]):
+        """Keys of the unique texts and the vectors the store already has (no in-flight side effects)."""
+        unique = list(dict.fromkeys(texts))
+        keys = {t: self._key(kind, t) for t in unique}
+        results = self.store.get_many(list(keys.values()))
+        return keys, {t: results[k] for t, k in keys.items() if k in results}
+
+    def _claim(self, keys: Dict[str, str], resolved: Dict[str, List[float]]):
+        """
+        Split misses into ones this caller must compute (``owned``) and ones
+        another caller is already computing (``waiting``). Never awaits, so an
+        async caller cannot be cancelled between claiming a key and owning it.
+        """
+        owned, waiting = {}, {}
+        with self._inflight_lock:
+            for text, key in keys.items():
+                if text in resolved:
+                    continue
+                if key in self._inflight:
+                    waiting[text] = self._inflight[key]
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    owned[text] = (key, future)
+
+        self.hits += len(resolved)
+        self.misses += len(owned)
+        self.coalesced += len(waiting)
+        return owned, waiting
+
+    def _save(self, owned: Dict[str, tuple], vectors: Dict[str, List[float]]):
+        # A failed cache write only costs a recompute later; callers still get their vectors
+        try:
+            self.store.put_many({owned[t][0]: v for t, v in vectors.items()})
+        except Exception as e:
+            log.warning("Embedding cache write failed", error=str(e), count=len(vectors))
+
+    def _settle(self, owned: Dict[str, tuple], vectors: Dict[str, List[float]], error: Optional[BaseException] = None):
+        """
+        Resolve and release every owned future, whatever happened. Texts with a
+        vector get it; the rest get ``error``, except when the owner was
+        cancelled (or interrupted): then waiters get ``_Abandoned`` and take the
+        computation over instead of failing with someone else's cancellation.
+        """
+        with self._inflight_lock:
+            for text, (key, future) in owned.items():
+                self._inflight.pop(key, None)
+                if text in vectors:
+                    future.set_result(vectors[text])
+                elif isinstance(error, Exception):
+                    future.set_exception(error)
+                else:
+                    future.set_exception(_Abandoned())
+
+    def _batches(self, texts: List[str]):
+        for i in range(0, len(texts), self.batch_size):
+            yield texts[i:i + self.batch_size]
+
+    # ---------- Sync API ----------
+    def _embed(self, kind: str, texts: List[str]) -> List[List[float]]:
+        keys, resolved = self._lookup(kind, texts)
+        owned, waiting = self._claim(keys, resolved)
+        if owned:
+            vectors, error = {}, None
+            try:
+                for batch in self._batches(list(owned)):
+                    self.remote_calls += 1
+                    if kind == "query":
+                        embedded = [self.underlying.embed_query(t) for t in batch]
+                    else:
+                        embedded = self.underlying.embed_documents(batch)
+                    vectors.update(zip(batch, embedded))
+                self._save(owned, vectors)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._settle(owned, vectors, error)
+            resolved.update(vectors)
+        abandoned = []
+        for text, future in waiting.items():
+            try:
+                resolved[text] = future.result()
+            except _Abandoned:
+                abandoned.append(text)
+        if abandoned:
+            resolved.update(zip(abandoned, self._embed(kind, abandoned)))
+        return [resolved[t] for t in texts]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed("document", texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed("query", [text])[0]
+
+    # ---------- Async API ----------
+    async def _aembed(self, kind: str, texts: List[str]) -> List[List[float]]:
+        keys, resolved = await asyncio.to_thread(self._lookup, kind, texts)
+        owned, waiting = self._claim(keys, resolved)
+        if owned:
+            vectors, error = {}, None
+            try:
+                for batch in self._batches(list(owned)):
+                    self.remote_calls += 1
+                    if kind == "query":
+                        embedded = await asyncio.gather(*(self.underlying.aembed_query(t) for t in batch))
+                    else:
+                        embedded = await self.underlying.aembed_documents(batch)
+                    vectors.update(zip(batch, embedded))
+                await asyncio.to_thread(self._save, owned, vectors)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._settle(owned, vectors, error)
+            resolved.update(vectors)
+        abandoned = []
+        for text, future in waiting.items():
+            try:
+                # shield: a waiter's own cancellation must not cancel the shared future
+                resolved[text] = await asyncio.shield(asyncio.wrap_future(future))
+            except _Abandoned:
+                abandoned.append(text)
+        if abandoned:
+            resolved.update(zip(abandoned, await self._aembed(kind, abandoned)))
+        return [resolved[t] for t in texts]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self._aembed("document", texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self._aembed("query", [text]))[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "model": self.model_name,
+            "path": self.store.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "remote_calls": self.remote_calls,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
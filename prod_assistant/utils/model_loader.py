@@ -8,6 +8,7 @@ from langchain_openai import ChatOpenAI
 from langchain_groq import ChatGroq
 from prod_assistant.logger import GLOBAL_LOGGER as log
 from prod_assistant.exception.custom_exception import ProductAssistantException
+from prod_assistant.utils.embedding_cache import CachedEmbeddings
 import asyncio
 
 
@@ -47,6 +48,8 @@ class ModelLoader:
     def load_embeddings(self):
         """
         Load and return embedding model from Google Generative AI.
+        When ``embedding_cache.enabled`` is set, the model is wrapped in the
+        process-wide persistent CachedEmbeddings for that model.
         """
         try:
             model_name = self.config["embedding_model"]["model_name"]
@@ -58,10 +61,21 @@ class ModelLoader:
             except RuntimeError:
                 asyncio.set_event_loop(asyncio.new_event_loop())
 
-            return GoogleGenerativeAIEmbeddings(
-                model=model_name,
-                google_api_key=self.api_key_mgr.get("GOOGLE_API_KEY")  # type: ignore
-            )
+            def build():
+                return GoogleGenerativeAIEmbeddings(
+                    model=model_name,
+                    google_api_key=self.api_key_mgr.get("GOOGLE_API_KEY")  # type: ignore
+                )
+
+            cache_config = self.config.get("embedding_cache", {})
+            if cache_config.get("enabled", False):
+                return CachedEmbeddings.shared(
+                    model_name,
+                    build,
+                    path=cache_config.get("path", "data/embedding_cache.sqlite"),
+                    batch_size=cache_config.get("batch_size", 100),
+                )
+            return build()
         except Exception as e:
             log.error("Error loading embedding model", error=str(e))
             raise ProductAssistantException("Failed to load embedding model", sys)
@@ -0,0 +1,46 @@
+import re
+from typing import Optional
+
+# First number in the text, with Indian (1,90,019) or western (190,019) digit grouping
+NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+# Scale suffixes used in listings and queries: 25k, 1.2L, 1 lakh, 2 crore
+SCALED_NUMBER_RE = re.compile(
+    r"(\d[\d,]*(?:\.\d+)?)\s*(k|thousand|l|lakhs?|lacs?|cr|crores?)?\b", re.IGNORECASE
+)
+SCALE = {"k": 1e3, "thousand": 1e3, "l": 1e5, "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5,
+         "cr": 1e7, "crore": 1e7, "crores": 1e7}
+
+MAX_RATING = 5.0
+
+
+def parse_number(text) -> Optional[float]:
+    """First number in ``text`` with its scale suffix applied ("₹1.2L" -> 120000.0)."""
+    if text is None:
+        return None
+    match = SCALED_NUMBER_RE.search(str(text))
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", ""))
+    suffix = (match.group(2) or "").lower()
+    return value * SCALE.get(suffix, 1.0)
+
+
+def parse_price(text) -> Optional[float]:
+    """"₹69,900" -> 69900.0; None for "N/A" or text without a number."""
+    value = parse_number(text)
+    return value if value is not None and value > 0 else None
+
+
+def parse_count(text) -> Optional[int]:
+    """"1,90,019" -> 190019; "2.3k Reviews" -> 2300."""
+    value = parse_number(text)
+    return int(round(value)) if value is not None else None
+
+
+def parse_rating(text) -> Optional[float]:
+    """"4.6" -> 4.6; None outside the 0-5 star scale."""
+    match = NUMBER_RE.search(str(text)) if text is not None else None
+    if not match:
+        return None
+    value = float(match.group(0).replace(",", ""))
+    return value if 0 <= value <= MAX_RATING else None
@@ -0,0 +1,225 @@
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+import numpy as np
+
+from prod_assistant.retriever.metadata_filter import parse_query_filter
+from prod_assistant.utils.config_loader import load_config
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+DEFAULT_CATALOG_VERSION_FILE = os.path.join("data", ".catalog_version")
+
+# Tokens that name a specific model or number: "15", "s24", "5g", "128gb", "30,000", "4.5"
+NUMERIC_TOKEN_RE = re.compile(r"[a-z0-9]*\d[a-z0-9]*(?:[.,]\d+)*")
+# Variant words that change the product while barely moving the embedding
+VARIANT_WORDS = frozenset({"pro", "max", "plus", "ultra", "mini", "lite", "air", "fe", "neo", "prime"})
+
+
+def _catalog_version_path() -> str:
+    config = load_config().get("semantic_cache", {})
+    return config.get("catalog_version_file", DEFAULT_CATALOG_VERSION_FILE)
+
+
+def read_catalog_version(path: Optional[str] = None) -> str:
+    """Return the current catalog version token ("" if never written)."""
+    path = path or _catalog_version_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def mark_catalog_updated(path: Optional[str] = None) -> str:
+    """
+    Bump the catalog version after the vector store changes.
+
+    Ingestion usually runs in another process (Streamlit scraper UI), so the
+    version lives in a small file that every SemanticCache checks on lookup.
+    """
+    path = path or _catalog_version_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    token = uuid.uuid4().hex
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(token)
+    log.info("Catalog version bumped", version=token)
+    return token
+
+
+@dataclass
+class _CacheEntry:
+    query: str
+    vector: np.ndarray
+    answer: str
+    created_at: float
+    compute_seconds: float
+    signature: Tuple[FrozenSet[str], Optional[dict]]
+
+
+class SemanticCache:
+    """
+    Semantic response cache keyed on query embeddings.
+
+    A lookup first tries the normalised query text, then the nearest cached
+    query by cosine similarity; entries above ``similarity_threshold`` and
+    younger than ``ttl_seconds`` are hits. A similar query only counts when
+    its numbers, model / variant tokens and price / rating constraints match
+    the cached one, so "price of iPhone 15" never answers "price of iPhone
+    16". Capacity is bounded with LRU eviction, and the whole cache is
+    dropped when the catalog version changes.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 3600,
+        max_entries: int = 2000,
+        catalog_version_file: Optional[str] = None,
+    ):
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.catalog_version_file = catalog_version_file or DEFAULT_CATALOG_VERSION_FILE
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: list = []
+        self._catalog_version = read_catalog_version(self.catalog_version_file)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.mismatches = 0
+        self.seconds_saved = 0.0
+
+    @classmethod
+    def from_config(cls, embeddings, config: Optional[dict] = None) -> "SemanticCache":
+        config = (config if config is not None else load_config()).get("semantic_cache", {})
+        return cls(
+            embeddings,
+            similarity_threshold=config.get("similarity_threshold", 0.92),
+            ttl_seconds=config.get("ttl_seconds", 3600),
+            max_entries=config.get("max_entries", 2000),
+            catalog_version_file=config.get("catalog_version_file"),
+        )
+
+    # ---------- Helpers ----------
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return re.sub(r"[^\w\s]", "", query.lower()).strip()
+
+    @staticmethod
+    def _signature(query: str) -> Tuple[FrozenSet[str], Optional[dict]]:
+        """What must match exactly for a similar query to share an answer."""
+        text = query.lower()
+        tokens = {t.replace(",", "") for t in NUMERIC_TOKEN_RE.findall(text)}
+        tokens |= VARIANT_WORDS.intersection(re.findall(r"[a-z]+", text))
+        return frozenset(tokens), parse_query_filter(query)
+
+    @staticmethod
+    def _unit(vector) -> np.ndarray:
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def _check_catalog_version(self):
+        version = read_catalog_version(self.catalog_version_file)
+        if version != self._catalog_version:
+            self._catalog_version = version
+            if self._entries:
+                self.clear()
+                self.invalidations += 1
+                log.info("Semantic cache invalidated by catalog update", version=version)
+
+    def _remove(self, key: str):
+        self._entries.pop(key, None)
+        self._matrix = None
+
+    def _evict_expired(self, now: float):
+        expired = [k for k, e in self._entries.items() if now - e.created_at > self.ttl_seconds]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+
+    def _nearest(self, vector: np.ndarray, signature: Tuple[FrozenSet[str], Optional[dict]]):
+        """Most similar entry above the threshold whose signature matches; (None, best score) otherwise."""
+        if not self._entries:
+            return None, 0.0
+        if self._matrix is None:
+            self._matrix_keys = list(self._entries.keys())
+            self._matrix = np.stack([self._entries[k].vector for k in self._matrix_keys])
+        scores = self._matrix @ vector
+        candidates = np.flatnonzero(scores >= self.similarity_threshold)
+        for idx in candidates[np.argsort(-scores[candidates])]:
+            key = self._matrix_keys[idx]
+            if self._entries[key].signature == signature:
+                return key, float(scores[idx])
+        if len(candidates):
+            self.mismatches += 1
+        return None, float(scores.max())
+
+    def _hit(self, key: str) -> str:
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.seconds_saved += entry.compute_seconds
+        return entry.answer
+
+    # ---------- Public API ----------
+    async def aget(self, query: str) -> Optional[str]:
+        """Return a cached answer for a semantically equivalent query, if any."""
+        self._check_catalog_version()
+        self._evict_expired(time.time())
+
+        key = self._normalize(query)
+        if key in self._entries:
+            return self._hit(key)
+
+        if self._entries:
+            vector = self._unit(await self.embeddings.aembed_query(query))
+            nearest_key, score = self._nearest(vector, self._signature(query))
+            if nearest_key is not None:
+                log.info("Semantic cache hit", query=query, matched=self._entries[nearest_key].query, score=round(score, 4))
+                return self._hit(nearest_key)
+
+        self.misses += 1
+        return None
+
+    async def aput(self, query: str, answer: str, compute_seconds: float = 0.0):
+        """Store an answer; evicts the least recently used entry when full."""
+        key = self._normalize(query)
+        vector = self._unit(await self.embeddings.aembed_query(query))
+        self._entries[key] = _CacheEntry(query, vector, answer, time.time(), compute_seconds, self._signature(query))
+        self._entries.move_to_end(key)
+        self._matrix = None
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._matrix = None
+        self._matrix_keys = []
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "mismatches": self.mismatches,
+            "seconds_saved": round(self.seconds_saved, 3),
+        }
@@ -0,0 +1,56 @@
+import os
+from typing import List
+
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+ASTRA_ENV_VARS = ["ASTRA_DB_API_ENDPOINT", "ASTRA_DB_APPLICATION_TOKEN", "ASTRA_DB_KEYSPACE"]
+
+
+def vector_store_backend(config: dict) -> str:
+    return config.get("vector_store", {}).get("backend", "astra")
+
+
+def required_env_vars(config: dict) -> List[str]:
+    """Environment variables needed for the embedding model plus the configured backend."""
+    required = ["GOOGLE_API_KEY"]
+    if vector_store_backend(config) == "astra":
+        required += ASTRA_ENV_VARS
+    return required
+
+
+def load_vector_store(config: dict, embeddings):
+    """
+    Build the vector store selected by ``vector_store.backend``:
+    ``astra`` (AstraDBVectorStore, remote) or ``local`` (in-process NumPy index).
+    Both expose the LangChain VectorStore interface.
+    """
+    backend = vector_store_backend(config)
+    log.info("Loading vector store", backend=backend)
+
+    if backend == "astra":
+        from langchain_astradb import AstraDBVectorStore
+
+        return AstraDBVectorStore(
+            embedding=embeddings,
+            collection_name=config["astra_db"]["collection_name"],
+            api_endpoint=os.getenv("ASTRA_DB_API_ENDPOINT"),
+            token=os.getenv("ASTRA_DB_APPLICATION_TOKEN"),
+            namespace=os.getenv("ASTRA_DB_KEYSPACE"),
+        )
+
+    if backend == "local":
+        from prod_assistant.retriever.local_vector_store import LocalVectorStore
+        from prod_assistant.utils.semantic_cache import DEFAULT_CATALOG_VERSION_FILE
+
+        local = config.get("vector_store", {}).get("local", {})
+        return LocalVectorStore(
+            embeddings,
+            path=local.get("path", os.path.join("data", "vector_index")),
+            index=local.get("index", "flat"),
+            nlist=local.get("nlist", 64),
+            nprobe=local.get("nprobe", 8),
+            # Ingestion runs in another process; a bumped catalog version makes searches pick it up
+            catalog_version_file=config.get("semantic_cache", {}).get("catalog_version_file", DEFAULT_CATALOG_VERSION_FILE),
+        )
+
+    raise ValueError(f"Unsupported vector store backend: {backend}")
@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence, TypedDict, Literal
+from typing import Annotated, Optional, Sequence, TypedDict, Literal
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -7,11 +7,13 @@ from langgraph.graph.message import add_messages
 
 from prompt_library.prompts import PROMPT_REGISTRY, PromptType
 from retriever.retrieval import Retriever
+from workflow.relevance import RelevanceGrader
+from workflow.budget import RequestBudget, best_effort_answer, current_budget
+from workflow.intent_router import ANSWER, RETRIEVE, TOOL_MARKERS, IntentRouter, latest_query
 from utils.model_loader import ModelLoader
 from langgraph.checkpoint.memory import MemorySaver
-import asyncio
 from evaluation.ragas_eval import evaluate_context_precision, evaluate_response_relevancy
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from mcp_servers.session_manager import MCPSessionManager
 
 
 class AgenticRAG:
@@ -24,20 +26,14 @@ class AgenticRAG:
         self.retriever_obj = Retriever()
         self.model_loader = ModelLoader()
         self.llm = self.model_loader.load_llm()
+        self.intent_router = IntentRouter.from_config(llm=self.llm)
+        self.relevance_grader = RelevanceGrader.from_config()
         self.checkpointer = MemorySaver()
         
-        # MCP Client Init
-        self.mcp_client = MultiServerMCPClient({
-            "product_retriever": {
-                "command": "python",
-                "args": ["prod_assistant/mcp_servers/product_search_server.py"],  # absolute path recommended
-                "transport": "stdio"
-            }
-        })
-        # Load MCP tools (async ko sync wrapper me call karna hoga)
-        self.mcp_tools = asyncio.run(self.mcp_client.get_tools())
+        # Persistent MCP session shared by every AgenticRAG in the process
+        self.mcp_sessions = MCPSessionManager.shared()
+        self.mcp_tools = self.mcp_sessions.get_tools("product_retriever")
 
-        
         self.workflow = self._build_workflow()
         self.app = self.workflow.compile(checkpointer=self.checkpointer)
 
@@ -52,7 +48,8 @@ class AgenticRAG:
                 f"Title: {meta.get('product_title', 'N/A')}\n"
                 f"Price: {meta.get('price', 'N/A')}\n"
                 f"Rating: {meta.get('rating', 'N/A')}\n"
-                f"Reviews:\n{d.page_content.strip()}"
+                + (f"Relevance: {meta['relevance_score']}\n" if meta.get("relevance_score") is not None else "")
+                + f"Reviews:\n{d.page_content.strip()}"
             )
             formatted_chunks.append(formatted)
         return "\n\n---\n\n".join(formatted_chunks)
@@ -63,8 +60,17 @@ class AgenticRAG:
         messages = state["messages"]
         last_message = messages[-1].content
 
-        if any(word in last_message.lower() for word in ["price", "review", "product"]):
-            return {"messages": [HumanMessage(content="TOOL: retriever")]}
+        # Back from the Rewriter with the LLM budget spent: answer from what was retrieved
+        budget = current_budget()
+        reason = budget.llm_exhausted()
+        if reason:
+            budget.log_degraded("Assistant", reason)
+            return {"messages": [HumanMessage(content=best_effort_answer(budget.best_context))]}
+
+        # No web-search node in this graph, so web_search intents go to the retriever too
+        decision = self.intent_router.route(last_message)
+        if decision.intent != ANSWER:
+            return {"messages": [HumanMessage(content=TOOL_MARKERS[RETRIEVE])]}
         else:
             prompt = ChatPromptTemplate.from_template(
                 "You are a helpful assistant. Answer the user directly.\n\nQuestion: {question}\nAnswer:"
@@ -75,12 +81,14 @@ class AgenticRAG:
 
     def _vector_retriever(self, state: AgentState):
         print("--- RETRIEVER (MCP) ---")
-        query = state["messages"][-1].content
+        query = latest_query(state["messages"])
         # Find the tool by name
         tool = next(t for t in self.mcp_tools if t.name == "get_product_info")
-        # Call the tool (sync wrapper)
-        result = asyncio.run(tool.ainvoke({"query": query}))
+        # Blocking call over the shared session (no per-call event loop)
+        result = tool.invoke({"query": query})
         context = result if result else "No data"
+        if "Title:" in context:
+            current_budget().best_context = context
         return {"messages": [HumanMessage(content=context)]}
 
     def _grade_documents(self, state: AgentState) -> Literal["generator", "rewriter"]:
@@ -88,19 +96,38 @@ class AgenticRAG:
         question = state["messages"][0].content
         docs = state["messages"][-1].content
 
+        # Out of rewrites / LLM budget: stop looping and generate from these docs
+        budget = current_budget()
+        reason = budget.exhausted()
+        if reason:
+            budget.log_degraded("Grader", reason)
+            return "generator"
+
         prompt = PromptTemplate(
             template="""You are a grader. Question: {question}\nDocs: {docs}\n
             Are docs relevant to the question? Answer yes or no.""",
             input_variables=["question", "docs"],
         )
         chain = prompt | self.llm | StrOutputParser()
-        score = chain.invoke({"question": question, "docs": docs})
-        return "generator" if "yes" in score.lower() else "rewriter"
+
+        def llm_grade() -> str:
+            score = chain.invoke({"question": question, "docs": docs})
+            return "generator" if "yes" in score.lower() else "rewriter"
+
+        # Clear hits / misses are decided locally; only the ambiguous band reaches the LLM
+        return self.relevance_grader.grade(question, docs, llm_grade)
 
     def _generate(self, state: AgentState):
         print("--- GENERATE ---")
         question = state["messages"][0].content
         docs = state["messages"][-1].content
+
+        budget = current_budget()
+        reason = budget.llm_exhausted()
+        if reason:
+            budget.log_degraded("Generator", reason)
+            return {"messages": [HumanMessage(content=best_effort_answer(docs))]}
+
         prompt = ChatPromptTemplate.from_template(
             PROMPT_REGISTRY[PromptType.PRODUCT_BOT].template
         )
@@ -111,6 +138,15 @@ class AgenticRAG:
     def _rewrite(self, state: AgentState):
         print("--- REWRITE ---")
         question = state["messages"][0].content
+
+        budget = current_budget()
+        budget.record_rewrite()
+        reason = budget.llm_exhausted()
+        if reason:
+            # No LLM call left; the Assistant turns this into a best-effort answer
+            budget.log_degraded("Rewriter", reason)
+            return {"messages": [HumanMessage(content=question)]}
+
         prompt = ChatPromptTemplate.from_template(
             "Rewrite this user query to make it more clear and specific for a search engine. "
             "Do NOT answer the query. Only rewrite it.\n\nQuery: {question}\nRewritten Query:"
@@ -143,10 +179,20 @@ class AgenticRAG:
         return workflow
 
     # ---------- Public Run ----------
-    def run(self, query: str,thread_id: str = "default_thread") -> str:
-        """Run the workflow for a given query and return the final answer."""
-        result = self.app.invoke({"messages": [HumanMessage(content=query)]},
-                                 config={"configurable": {"thread_id": thread_id}})
+    def run(self, query: str,thread_id: str = "default_thread", budget: Optional[RequestBudget] = None) -> str:
+        """
+        Run the workflow for a given query and return the final answer.
+
+        ``budget`` (default: config ``request_budget``) caps rewrites, LLM
+        calls, tokens and wall-clock time for this request; once it is spent
+        the graph stops looping and answers from the docs it has. LLM calls
+        made by the MCP server while serving ``get_product_info`` (its
+        compressor) are not counted against it.
+        """
+        budget = budget or RequestBudget.from_config()
+        with budget.activate():
+            result = self.app.invoke({"messages": [HumanMessage(content=query)]},
+                                     config={"configurable": {"thread_id": thread_id}, "callbacks": [budget.callback]})
         return result["messages"][-1].content
     
 if __name__ == "__main__":
@@ -1,80 +1,188 @@
-from typing import Annotated, Sequence, TypedDict, Literal
+from dataclasses import dataclass
+from typing import Annotated, Dict, Optional, Sequence, TypedDict, Literal
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
 
 from prompt_library.prompts import PROMPT_REGISTRY, PromptType
 from retriever.retrieval import Retriever
+from workflow.relevance import EMPTY_CONTEXTS, RelevanceGrader
+from workflow.intent_router import ANSWER, INTENT_ROUTER_TAG, TOOL_MARKERS, WEB_SEARCH, IntentRouter, latest_query
+from utils.config_loader import load_config
 from utils.model_loader import ModelLoader
 from evaluation.ragas_eval import evaluate_context_precision, evaluate_response_relevancy
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from mcp_servers.session_manager import MCPSessionManager
+from prod_assistant.logger import GLOBAL_LOGGER as log
 import asyncio
+import time
+
+
+@dataclass
+class _Speculation:
+    """Web search started alongside retrieval for one thread."""
+    task: asyncio.Task
+    deadline: float
+
 
 class AgenticRAG:
     """Agentic RAG pipeline using LangGraph + MCP (Retriever + WebSearch)."""
 
     class AgentState(TypedDict):
         messages: Annotated[Sequence[BaseMessage], add_messages]
+        # True only for a real answer: Generator over usable docs, or a direct Assistant reply
+        cacheable: bool
+
+    # Nodes reported as progress events / whose LLM tokens are user-facing
+    STREAM_PROGRESS_NODES = ("Assistant", "Retriever", "Rewriter", "WebSearch", "Generator")
+    STREAM_TOKEN_NODES = ("Assistant", "Generator")
 
     # ---------- Initialization ----------
-    def __init__(self):
-        self.retriever_obj = Retriever()
+    def __init__(
+        self,
+        load_tools: bool = True,
+        llm=None,
+        retriever_obj=None,
+        mcp_tools=None,
+        speculative_search: Optional[bool] = None,
+        latency_budget: Optional[float] = None,
+    ):
+        """
+        Build the LLM, retriever and compiled graph.
+
+        Callers already running inside an event loop (e.g. the FastAPI
+        lifespan) must pass ``load_tools=False`` and ``await async_init()``
+        instead, since ``asyncio.run`` cannot be nested. ``llm``,
+        ``retriever_obj`` and ``mcp_tools`` can be injected (benchmarks, stubs).
+
+        With ``speculative_search`` (default: config ``speculative_search``)
+        the Retriever node also starts the web search. If the grader accepts
+        the product docs, the search is cancelled. If it rejects them, the
+        graph skips the Rewriter and WebSearch uses the result that is
+        already in flight. ``latency_budget`` is measured from the start of
+        retrieval and caps the wait for that result; web results that
+        arrive later are dropped.
+        """
+        self.retriever_obj = retriever_obj or Retriever()
         self.model_loader = ModelLoader()
-        self.llm = self.model_loader.load_llm()
+        self.llm = llm or self.model_loader.load_llm()
+        self.intent_router = IntentRouter.from_config(llm=self.llm)
+        self.relevance_grader = RelevanceGrader.from_config()
         self.checkpointer = MemorySaver()
 
-        # Initialize MCP client
-        self.mcp_client = MultiServerMCPClient(
-            {
-                "hybrid_search": {
-                    "transport": "streamable_http",
-                    "url": "http://localhost:8000/mcp"
-                }
-            }
+        speculative_config = load_config().get("speculative_search", {})
+        self.speculative_search = (
+            speculative_config.get("enabled", False) if speculative_search is None else speculative_search
+        )
+        self.latency_budget = (
+            speculative_config.get("latency_budget_seconds", 8.0) if latency_budget is None else latency_budget
         )
+        self._speculations: Dict[str, _Speculation] = {}
+        # cancelled: stopped in flight; unused: had already finished when it was no longer needed
+        self.speculation_stats = {"launched": 0, "used": 0, "cancelled": 0, "unused": 0, "over_budget": 0, "failed": 0}
+
+        # Persistent MCP session shared by every engine in the process
+        self.mcp_sessions = MCPSessionManager.shared()
+
+        self.mcp_tools = mcp_tools or []
 
         # Build workflow
         self.workflow = self._build_workflow()
         self.app = self.workflow.compile(checkpointer=self.checkpointer)
 
         # Load MCP tools asynchronously
-        asyncio.run(self._safe_async_init())
+        if load_tools and mcp_tools is None:
+            asyncio.run(self._safe_async_init())
 
     async def async_init(self):
-        """Load MCP tools asynchronously."""
-        self.mcp_tools = await self.mcp_client.get_tools()
+        """Warm up embeddings, the vector store and MCP tools."""
+        await asyncio.to_thread(self.retriever_obj.load_retriever)
+        await self._safe_async_init()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the vector store and MCP tools are loaded."""
+        return self.retriever_obj.vstore is not None and bool(self.mcp_tools)
 
     async def _safe_async_init(self):
         """Safe async init wrapper (prevents event loop crash)."""
         try:
-            self.mcp_tools = await self.mcp_client.get_tools()
+            self.mcp_tools = await self.mcp_sessions.aget_tools("hybrid_search")
             print("MCP tools loaded successfully.")
         except Exception as e:
             print(f"Warning: Failed to load MCP tools — {e}")
             self.mcp_tools = []
 
+    # ---------- Speculative web search ----------
+    @staticmethod
+    def _thread_id(config: RunnableConfig) -> str:
+        return config.get("configurable", {}).get("thread_id", "default_thread")
+
+    def _start_speculation(self, thread_id: str, query: str):
+        tool = next((t for t in self.mcp_tools if t.name == "web_search"), None)
+        if tool is None:
+            return
+        self._cancel_speculation(thread_id)
+        task = asyncio.create_task(tool.ainvoke({"query": query}))
+        self._speculations[thread_id] = _Speculation(task, time.monotonic() + self.latency_budget)
+        self.speculation_stats["launched"] += 1
+
+    def _cancel_speculation(self, thread_id: str):
+        speculation = self._speculations.pop(thread_id, None)
+        if speculation is None:
+            return
+        if speculation.task.done():
+            if not speculation.task.cancelled():
+                speculation.task.exception()  # mark retrieved; the result is simply unused
+            self.speculation_stats["unused"] += 1
+        else:
+            speculation.task.cancel()
+            self.speculation_stats["cancelled"] += 1
+
+    async def _speculative_result(self, speculation: _Speculation) -> Optional[str]:
+        try:
+            result = await asyncio.wait_for(speculation.task, max(speculation.deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self.speculation_stats["over_budget"] += 1
+            return None
+        except Exception as e:
+            # A failed web search must not fail the run; WebSearch answers "No data from web"
+            self.speculation_stats["failed"] += 1
+            log.warning("Speculative web search failed", error=str(e), error_type=type(e).__name__)
+            return None
+        self.speculation_stats["used"] += 1
+        return result
+
     # ---------- Nodes ----------
-    def _ai_assistant(self, state: AgentState):
+    # Every node and router is a coroutine using ainvoke, so an LLM round-trip
+    # never blocks the event loop. CancelledError is deliberately not caught:
+    # cancelling run() aborts whichever LLM/tool call is in flight.
+    async def _ai_assistant(self, state: AgentState):
         print("--- CALL ASSISTANT ---")
         messages = state["messages"]
         last_message = messages[-1].content
 
-        if any(word in last_message.lower() for word in ["price", "review", "product"]):
-            return {"messages": [HumanMessage(content="TOOL: retriever")]}
+        decision = await self.intent_router.aroute(last_message)
+        if decision.intent != ANSWER:
+            return {"messages": [HumanMessage(content=TOOL_MARKERS[decision.intent])], "cacheable": False}
         else:
             prompt = ChatPromptTemplate.from_template(
                 "You are a helpful assistant. Answer the user directly.\n\nQuestion: {question}\nAnswer:"
             )
             chain = prompt | self.llm | StrOutputParser()
-            response = chain.invoke({"question": last_message}) or "I'm not sure about that."
-            return {"messages": [HumanMessage(content=response)]}
+            response = await chain.ainvoke({"question": last_message})
+            if not response:
+                return {"messages": [HumanMessage(content="I'm not sure about that.")], "cacheable": False}
+            return {"messages": [HumanMessage(content=response)], "cacheable": True}
 
-    async def _vector_retriever(self, state: AgentState):
+    async def _vector_retriever(self, state: AgentState, config: RunnableConfig):
         print("--- RETRIEVER (MCP) ---")
-        query = state["messages"][-1].content
+        query = latest_query(state["messages"])
+        if self.speculative_search:
+            self._start_speculation(self._thread_id(config), query)
 
         tool = next((t for t in self.mcp_tools if t.name == "get_product_info"), None)
         if not tool:
@@ -88,16 +196,24 @@ class AgenticRAG:
 
         return {"messages": [HumanMessage(content=context)]}
 
-    async def _web_search(self, state: AgentState):
+    async def _web_search(self, state: AgentState, config: RunnableConfig):
+        speculation = self._speculations.pop(self._thread_id(config), None)
+        if speculation is not None:
+            print("--- WEB SEARCH (speculative) ---")
+            result = await self._speculative_result(speculation)
+            return {"messages": [HumanMessage(content=result or "No data from web")]}
+
         print("--- WEB SEARCH (MCP) ---")
-        query = state["messages"][-1].content
+        query = latest_query(state["messages"])
         tool = next(t for t in self.mcp_tools if t.name == "web_search")
         result = await tool.ainvoke({"query": query})  # ✅
         context = result if result else "No data from web"
         return {"messages": [HumanMessage(content=context)]}
 
 
-    def _grade_documents(self, state: AgentState) -> Literal["generator", "rewriter"]:
+    async def _grade_documents(
+        self, state: AgentState, config: RunnableConfig
+    ) -> Literal["generator", "rewriter", "websearch"]:
         print("--- GRADER ---")
         question = state["messages"][0].content
         docs = state["messages"][-1].content
@@ -108,10 +224,22 @@ class AgenticRAG:
             input_variables=["question", "docs"],
         )
         chain = prompt | self.llm | StrOutputParser()
-        score = chain.invoke({"question": question, "docs": docs}) or ""
-        return "generator" if "yes" in score.lower() else "rewriter"
 
-    def _generate(self, state: AgentState):
+        async def llm_grade() -> str:
+            score = await chain.ainvoke({"question": question, "docs": docs}) or ""
+            return "generator" if "yes" in score.lower() else "rewriter"
+
+        # Clear hits / misses are decided locally; only the ambiguous band reaches the LLM
+        verdict = await self.relevance_grader.agrade(question, docs, llm_grade)
+
+        thread_id = self._thread_id(config)
+        if verdict == "generator":
+            self._cancel_speculation(thread_id)
+            return "generator"
+        # A web search already in flight replaces Rewriter -> WebSearch
+        return "websearch" if thread_id in self._speculations else "rewriter"
+
+    async def _generate(self, state: AgentState):
         print("--- GENERATE ---")
         question = state["messages"][0].content
         docs = state["messages"][-1].content
@@ -121,14 +249,24 @@ class AgenticRAG:
         )
         chain = prompt | self.llm | StrOutputParser()
 
+        # An answer written around an empty or failed lookup must not be reused
+        cacheable = not self._degraded_context(docs)
         try:
-            response = chain.invoke({"context": docs, "question": question}) or "No response generated."
+            response = await chain.ainvoke({"context": docs, "question": question})
         except Exception as e:
             response = f"Error generating response: {e}"
+            cacheable = False
+        if not response:
+            response, cacheable = "No response generated.", False
+
+        return {"messages": [HumanMessage(content=response)], "cacheable": cacheable}
 
-        return {"messages": [HumanMessage(content=response)]}
+    @staticmethod
+    def _degraded_context(docs: str) -> bool:
+        docs = docs.strip()
+        return not docs or docs.startswith(EMPTY_CONTEXTS) or docs.startswith("Error")
 
-    def _rewrite(self, state: AgentState):
+    async def _rewrite(self, state: AgentState):
         print("--- REWRITE ---")
         question = state["messages"][0].content
 
@@ -139,12 +277,18 @@ class AgenticRAG:
         chain = prompt | self.llm | StrOutputParser()
 
         try:
-            new_q = chain.invoke({"question": question}).strip()
+            new_q = (await chain.ainvoke({"question": question})).strip()
         except Exception as e:
             new_q = f"Error rewriting query: {e}"
 
         return {"messages": [HumanMessage(content=new_q)]}
 
+    async def _route_assistant(self, state: AgentState) -> Literal["Retriever", "WebSearch", "__end__"]:
+        content = state["messages"][-1].content
+        if content == TOOL_MARKERS[WEB_SEARCH]:
+            return "WebSearch"
+        return "Retriever" if "TOOL" in content else END
+
     # ---------- Build Workflow ----------
     def _build_workflow(self):
         workflow = StateGraph(self.AgentState)
@@ -158,13 +302,13 @@ class AgenticRAG:
         workflow.add_edge(START, "Assistant")
         workflow.add_conditional_edges(
             "Assistant",
-            lambda state: "Retriever" if "TOOL" in state["messages"][-1].content else END,
-            {"Retriever": "Retriever", END: END},
+            self._route_assistant,
+            {"Retriever": "Retriever", "WebSearch": "WebSearch", END: END},
         )
         workflow.add_conditional_edges(
             "Retriever",
             self._grade_documents,
-            {"generator": "Generator", "rewriter": "Rewriter"},
+            {"generator": "Generator", "rewriter": "Rewriter", "websearch": "WebSearch"},
         )
         workflow.add_edge("Generator", END)
         workflow.add_edge("Rewriter", "WebSearch")
@@ -175,14 +319,68 @@ class AgenticRAG:
     # ---------- Public Run ----------
     async def run(self, query: str, thread_id: str = "default_thread") -> str:
         """Run the workflow for a given query and return the final answer."""
-        result = await self.app.ainvoke(
-            {"messages": [HumanMessage(content=query)]},
-            config={"configurable": {"thread_id": thread_id}}
-        )
+        try:
+            result = await self.app.ainvoke(
+                {"messages": [HumanMessage(content=query)]},
+                config={"configurable": {"thread_id": thread_id}}
+            )
+        finally:
+            # A failed or cancelled run must not leave its web search running
+            self._cancel_speculation(thread_id)
         return result["messages"][-1].content
 
+    async def answer_cacheable(self, thread_id: str) -> bool:
+        """Whether the thread's last answer may be stored in the semantic cache."""
+        snapshot = await self.app.aget_state({"configurable": {"thread_id": thread_id}})
+        return bool(snapshot.values.get("cacheable"))
+
+    async def astream(self, query: str, thread_id: str = "default_thread"):
+        """
+        Stream the workflow as events via ``astream_events``.
+
+        Yields dicts of the form ``{"type": "node", "node": ...}`` when a graph
+        node starts, ``{"type": "token", "content": ...}`` for answer tokens
+        (Generator, or Assistant when it answers directly) and a final
+        ``{"type": "done", "answer": ..., "cacheable": ...}``.
+        """
+        answer = ""
+        cacheable = False
+        try:
+            async for event in self.app.astream_events(
+                {"messages": [HumanMessage(content=query)]},
+                config={"configurable": {"thread_id": thread_id}},
+                version="v2",
+            ):
+                kind = event["event"]
+                node = event.get("metadata", {}).get("langgraph_node")
+
+                if kind == "on_chain_start" and event["name"] in self.STREAM_PROGRESS_NODES and event["name"] == node:
+                    yield {"type": "node", "node": node}
+                elif (
+                    kind == "on_chat_model_stream"
+                    and node in self.STREAM_TOKEN_NODES
+                    # The router's LLM fallback runs inside Assistant; its label is not answer text
+                    and INTENT_ROUTER_TAG not in event.get("tags", [])
+                ):
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield {"type": "token", "content": content}
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    output = event["data"]["output"]
+                    answer = output["messages"][-1].content
+                    cacheable = bool(output.get("cacheable"))
+        finally:
+            self._cancel_speculation(thread_id)
+
+        yield {"type": "done", "answer": answer, "cacheable": cacheable}
+
+    async def release_thread(self, thread_id: str):
+        """Drop checkpointed state for a finished thread (long-lived engines)."""
+        self._cancel_speculation(thread_id)
+        await self.checkpointer.adelete_thread(thread_id)
+
 # ---------- Standalone Test ----------
 if __name__ == "__main__":
     rag_agent = AgenticRAG()
-    answer = rag_agent.run("What is the price of iPhone 16?")
+    answer = asyncio.run(rag_agent.run("What is the price of iPhone 16?"))
     print("\nFinal Answer:\n", answer)
@@ -0,0 +1,171 @@
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from utils.config_loader import load_config
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+FIELD_RE = re.compile(r"^(Title|Price|Rating):\s*(.*)$", re.MULTILINE)
+NO_ANSWER = "Sorry, I couldn't find a confident answer to that in time. Please try rephrasing your question."
+PARTIAL_ANSWER = "I couldn't finish a full answer in time, but these are the closest products I found:\n"
+# Every best_effort_answer starts with one of these
+BEST_EFFORT_PREFIXES = (NO_ANSWER, PARTIAL_ANSWER)
+
+
+@dataclass
+class RequestBudget:
+    """
+    Per-request limits for the agentic loop: rewrites, LLM calls, tokens
+    and a wall-clock deadline. ``None`` disables a limit. The budget is
+    bound to the running request through a context variable
+    (``activate``). Its ``callback`` counts every LLM call and its token
+    usage made in this process while the graph runs, including the intent
+    router's fallback and, in agentic_rag_workflow, the retriever's
+    compressor. LLM calls inside an MCP tool server (the compressor behind
+    ``get_product_info`` in agentic_workflow_with_mcp) happen in another
+    process and are not counted.
+    """
+
+    max_rewrites: Optional[int] = 2
+    max_llm_calls: Optional[int] = 8
+    max_tokens: Optional[int] = 16000
+    deadline_seconds: Optional[float] = 45.0
+
+    rewrites: int = 0
+    llm_calls: int = 0
+    tokens: int = 0
+    started: float = field(default_factory=time.monotonic)
+    best_context: Optional[str] = None  # latest retrieved docs, for a best-effort answer
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_config(cls) -> "RequestBudget":
+        config = load_config().get("request_budget", {})
+        return cls(
+            max_rewrites=config.get("max_rewrites", 2),
+            max_llm_calls=config.get("max_llm_calls", 8),
+            max_tokens=config.get("max_tokens", 16000),
+            deadline_seconds=config.get("deadline_seconds", 45.0),
+        )
+
+    # ---------- Accounting ----------
+    def record_llm_call(self):
+        with self._lock:
+            self.llm_calls += 1
+
+    def record_tokens(self, tokens: int):
+        with self._lock:
+            self.tokens += tokens
+
+    def record_rewrite(self):
+        with self._lock:
+            self.rewrites += 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    # ---------- Checks ----------
+    def llm_exhausted(self) -> Optional[str]:
+        """Reason another LLM call is not affordable, or None."""
+        if self.max_llm_calls is not None and self.llm_calls >= self.max_llm_calls:
+            return "llm_calls"
+        if self.max_tokens is not None and self.tokens >= self.max_tokens:
+            return "tokens"
+        if self.deadline_seconds is not None and self.elapsed >= self.deadline_seconds:
+            return "deadline"
+        return None
+
+    def exhausted(self) -> Optional[str]:
+        """Reason the request must stop looping (no more rewrites), or None."""
+        if self.max_rewrites is not None and self.rewrites >= self.max_rewrites:
+            return "rewrites"
+        return self.llm_exhausted()
+
+    def usage(self) -> Dict[str, Any]:
+        return {
+            "rewrites": self.rewrites,
+            "llm_calls": self.llm_calls,
+            "tokens": self.tokens,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+        }
+
+    def log_degraded(self, node: str, reason: str):
+        log.warning("Request budget exhausted, degrading", node=node, reason=reason, **self.usage())
+
+    # ---------- Binding ----------
+    @property
+    def callback(self) -> "BudgetCallbackHandler":
+        return BudgetCallbackHandler(self)
+
+    @contextmanager
+    def activate(self):
+        token = CURRENT_BUDGET.set(self)
+        try:
+            yield self
+        finally:
+            CURRENT_BUDGET.reset(token)
+
+
+CURRENT_BUDGET: ContextVar[Optional[RequestBudget]] = ContextVar("request_budget", default=None)
+
+
+def current_budget() -> RequestBudget:
+    """Budget of the running request; an unlimited one outside ``activate``."""
+    budget = CURRENT_BUDGET.get()
+    if budget is None:
+        return RequestBudget(max_rewrites=None, max_llm_calls=None, max_tokens=None, deadline_seconds=None)
+    return budget
+
+
+class BudgetCallbackHandler(BaseCallbackHandler):
+    """Counts LLM calls and tokens into a RequestBudget."""
+
+    def __init__(self, budget: RequestBudget):
+        self.budget = budget
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self.budget.record_llm_call()
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.budget.record_llm_call()
+
+    def on_llm_end(self, response: LLMResult, **kwargs):
+        self.budget.record_tokens(self._tokens(response))
+
+    @staticmethod
+    def _tokens(response: LLMResult) -> int:
+        total = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    total += usage.get("total_tokens", 0)
+        if total:
+            return total
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        if token_usage.get("total_tokens"):
+            return token_usage["total_tokens"]
+        # Provider reported nothing: estimate ~4 characters per token of output
+        return sum(len(g.text) for generations in response.generations for g in generations) // 4
+
+
+def best_effort_answer(context: Optional[str]) -> str:
+    """Answer without an LLM call from the products retrieved so far."""
+    products = []
+    for chunk in (context or "").split("\n\n---\n\n"):
+        fields = dict(FIELD_RE.findall(chunk))
+        if fields.get("Title"):
+            products.append(
+                f"- {fields['Title']} | Price: {fields.get('Price', 'N/A')} | Rating: {fields.get('Rating', 'N/A')}"
+            )
+    if not products:
+        return NO_ANSWER
+    return PARTIAL_ANSWER + "\n".join(products)
@@ -0,0 +1,189 @@
+import asyncio
+import itertools
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from utils.config_loader import load_config
+from utils.semantic_cache import SemanticCache
+from workflow.budget import BEST_EFFORT_PREFIXES
+from workflow.relevance import EMPTY_CONTEXTS
+# Same module path as ModelLoader so the shared-instance registry is the same
+from prod_assistant.utils.embedding_cache import CachedEmbeddings
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+
+class EnginePool:
+    """
+    Process-wide pool of pre-warmed AgenticRAG engines shared across requests.
+
+    Engines are built once during application startup (LLM client, retriever,
+    MCP tool discovery, graph compilation) and handed out round-robin, so no
+    request pays the construction cost. Each run uses its own thread id, which
+    keeps concurrent conversations isolated on a shared engine. When enabled,
+    a semantic response cache is consulted before any engine runs.
+    """
+
+    def __init__(self, engine_factory: Optional[Callable] = None, size: Optional[int] = None):
+        full_config = load_config()
+        config = full_config.get("engine_pool", {})
+        self.cache_enabled = full_config.get("semantic_cache", {}).get("enabled", False)
+        self.semantic_cache: Optional[SemanticCache] = None
+        self.size = size or config.get("size", 1)
+        self.warmup_retry_seconds = config.get("warmup_retry_seconds", 5)
+        self.warmup_max_attempts = config.get("warmup_max_attempts", 0)  # 0 = retry forever
+        self._engine_factory = engine_factory
+        self.engines: List = []
+        self._cycle = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.ready = False
+        self.last_error: Optional[str] = None
+
+    def _default_factory(self):
+        from workflow.agentic_workflow_with_mcp_websearch import AgenticRAG
+        return AgenticRAG(load_tools=False)
+
+    # ---------- Lifecycle ----------
+    async def start(self):
+        """Kick off warm-up in the background so liveness probes answer immediately."""
+        self._warmup_task = asyncio.create_task(self._warmup())
+
+    async def _warmup(self):
+        factory = self._engine_factory or self._default_factory
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if not self.engines:
+                    for _ in range(self.size):
+                        # Construction is blocking (env checks, client setup)
+                        self.engines.append(await asyncio.to_thread(factory))
+                for engine in self.engines:
+                    if not engine.is_ready:
+                        await engine.async_init()
+                if all(engine.is_ready for engine in self.engines):
+                    if self.cache_enabled and self.semantic_cache is None:
+                        embeddings = self.engines[0].model_loader.load_embeddings()
+                        self.semantic_cache = SemanticCache.from_config(embeddings)
+                    self._cycle = itertools.cycle(self.engines)
+                    self.ready = True
+                    self.last_error = None
+                    log.info("Engine pool ready", size=len(self.engines), attempts=attempt)
+                    return
+                self.last_error = "MCP tools or vector store not loaded"
+            except Exception as e:
+                self.last_error = str(e)
+                log.error("Engine pool warm-up failed", attempt=attempt, error=str(e))
+
+            if self.warmup_max_attempts and attempt >= self.warmup_max_attempts:
+                log.error("Engine pool warm-up gave up", attempts=attempt)
+                return
+            await asyncio.sleep(self.warmup_retry_seconds)
+
+    async def stop(self):
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        self.ready = False
+        self.engines = []
+        self._cycle = None
+
+    # ---------- Usage ----------
+    def get(self):
+        """Return the next warm engine (round-robin)."""
+        if not self.ready:
+            raise RuntimeError("Engine pool is not ready yet")
+        return next(self._cycle)
+
+    async def _cache_lookup(self, query: str) -> Optional[str]:
+        if not self.semantic_cache:
+            return None
+        try:
+            return await self.semantic_cache.aget(query)
+        except Exception as e:
+            log.error("Semantic cache lookup failed", error=str(e))
+            return None
+
+    @staticmethod
+    def _degraded(answer: str) -> bool:
+        """Error strings, empty-lookup placeholders and best-effort budget replies."""
+        return not answer or answer.startswith(("Error",) + EMPTY_CONTEXTS + BEST_EFFORT_PREFIXES)
+
+    async def _answer_cacheable(self, engine, thread_id: str, answer: str) -> bool:
+        # Engines that track it report whether the answer came from a real
+        # Generator / direct-answer step; the text check is the fallback
+        if self._degraded(answer):
+            return False
+        if hasattr(engine, "answer_cacheable"):
+            try:
+                return await engine.answer_cacheable(thread_id)
+            except Exception as e:
+                log.error("Cacheability check failed", error=str(e))
+                return False
+        return True
+
+    async def _cache_store(self, query: str, answer: str, started: float, cacheable: bool):
+        if not self.semantic_cache or not cacheable:
+            return
+        try:
+            await self.semantic_cache.aput(query, answer, compute_seconds=time.perf_counter() - started)
+        except Exception as e:
+            log.error("Semantic cache store failed", error=str(e))
+
+    async def run(self, query: str) -> str:
+        """Run a query on a pooled engine with a request-scoped thread id."""
+        cached = await self._cache_lookup(query)
+        if cached is not None:
+            return cached
+
+        engine = self.get()
+        thread_id = uuid.uuid4().hex
+        started = time.perf_counter()
+        try:
+            answer = await engine.run(query, thread_id=thread_id)
+            cacheable = self.semantic_cache is not None and await self._answer_cacheable(engine, thread_id, answer)
+        finally:
+            await engine.release_thread(thread_id)
+        await self._cache_store(query, answer, started, cacheable)
+        return answer
+
+    async def stream(self, query: str):
+        """Stream node/token events for a query on a pooled engine."""
+        cached = await self._cache_lookup(query)
+        if cached is not None:
+            yield {"type": "token", "content": cached}
+            yield {"type": "done", "answer": cached, "cached": True}
+            return
+
+        engine = self.get()
+        thread_id = uuid.uuid4().hex
+        started = time.perf_counter()
+        answer = ""
+        cacheable = False
+        try:
+            async for event in engine.astream(query, thread_id=thread_id):
+                if event["type"] == "done":
+                    answer = event["answer"]
+                    cacheable = event.get("cacheable", True) and not self._degraded(answer)
+                yield event
+        finally:
+            await engine.release_thread(thread_id)
+        await self._cache_store(query, answer, started, cacheable)
+
+    def metrics(self) -> dict:
+        return {
+            "semantic_cache": self.semantic_cache.stats() if self.semantic_cache else None,
+            "embedding_cache": CachedEmbeddings.all_stats(),
+        }
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "size": self.size,
+            "engines_built": len(self.engines),
+            "engines_ready": sum(1 for e in self.engines if e.is_ready),
+            "last_error": self.last_error,
+        }
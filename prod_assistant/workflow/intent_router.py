@@ -0,0 +1,270 @@
+import re
+import time
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+from prompt_library.prompts import PROMPT_REGISTRY, PromptType
+from utils.config_loader import load_config
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+RETRIEVE = "retrieve"
+ANSWER = "answer"
+WEB_SEARCH = "web_search"
+INTENTS = (RETRIEVE, ANSWER, WEB_SEARCH)
+
+# Marker messages the Assistant node emits to hand off to a tool node
+TOOL_MARKERS = {RETRIEVE: "TOOL: retriever", WEB_SEARCH: "TOOL: web_search"}
+
+# Run tag on the LLM fallback, so streaming callers can drop its label tokens
+INTENT_ROUTER_TAG = "intent_router"
+
+# Labelled seed queries the classifier is trained on (extend via intent_router.examples)
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    RETRIEVE: [
+        "what is the price of iphone 15",
+        "price of samsung galaxy s24",
+        "compare iphone 16 vs 15",
+        "iphone 16 vs iphone 16 plus which is better",
+        "difference between pixel 8 and pixel 8a",
+        "best phone under 30000",
+        "suggest a good budget smartphone",
+        "recommend wireless earbuds under 2000",
+        "which laptop has the best rating",
+        "reviews of oneplus 12",
+        "what do customers say about the boat airdopes",
+        "is the battery life of redmi note 13 good",
+        "how is the camera on the iphone 16",
+        "is the galaxy s23 worth buying",
+        "cheapest 5g phone with good reviews",
+        "show me noise cancelling headphones",
+        "alternatives to the macbook air",
+        "top rated smartwatch for fitness",
+        "does this phone heat up while gaming",
+        "which tv should i buy for my living room",
+    ],
+    WEB_SEARCH: [
+        "latest news about the apple launch event",
+        "when will the iphone 17 be released",
+        "release date of the galaxy s26",
+        "iphone launch date",
+        "when does the oneplus 13 come out in india",
+        "upcoming phones launching next month",
+        "current flipkart big billion days offers",
+        "today's deals on amazon",
+        "what is apple's stock price today",
+        "any news on the pixel 10 leaks",
+        "is there a sale going on right now",
+        "latest software update for samsung phones this week",
+        "who won the match yesterday",
+        "what is the weather today",
+        "recent recall of an electronics product",
+        "what is trending in tech news now",
+    ],
+    ANSWER: [
+        "hi",
+        "hello there",
+        "good morning",
+        "good night",
+        "thanks a lot",
+        "thank you",
+        "bye",
+        "how are you",
+        "who are you",
+        "what can you do",
+        "help",
+        "tell me a joke",
+        "what does mah mean",
+        "explain what refresh rate means",
+        "what is 5g",
+        "what is wifi 6",
+        "what is the difference between amoled and lcd in general",
+        "how do i take care of a laptop battery",
+    ],
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9₹]+")
+NUMBER_RE = re.compile(r"^[₹]?\d[\d,.]*[kl]?$")
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def latest_query(messages: Sequence) -> str:
+    """Most recent message that is a query rather than an Assistant tool hand-off marker."""
+    for message in reversed(messages):
+        if not message.content.startswith("TOOL:"):
+            return message.content
+    return messages[-1].content
+
+
+@dataclass
+class IntentDecision:
+    intent: str
+    confidence: float
+    source: str = "classifier"  # classifier | llm
+    scores: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+class IntentRouter:
+    """
+    Local query-intent classifier for the Assistant node.
+
+    Queries are featurised as signed hashed word unigrams, bigrams and
+    character trigrams (numbers collapse to one token, so "under 30000"
+    generalises) and scored by a multinomial logistic regression over the
+    intents (retrieve / answer / web_search), trained on the labelled
+    examples when the router is built. A decision takes microseconds.
+    ``confidence`` is the predicted probability of the winning intent;
+    below ``confidence_threshold`` the LLM classifies the query instead,
+    when one is configured.
+    """
+
+    def __init__(
+        self,
+        examples: Optional[Dict[str, Iterable[str]]] = None,
+        dim: int = 1 << 12,
+        confidence_threshold: float = 0.55,
+        epochs: int = 300,
+        learning_rate: float = 2.0,
+        l2: float = 1e-3,
+        llm=None,
+    ):
+        self.dim = dim
+        self.confidence_threshold = confidence_threshold
+        self.llm = llm
+        self.intents: Tuple[str, ...] = INTENTS
+
+        labelled = {intent: list(SEED_EXAMPLES.get(intent, [])) for intent in self.intents}
+        for intent, texts in (examples or {}).items():
+            if intent not in labelled:
+                raise ValueError(f"Unknown intent: {intent}")
+            labelled[intent].extend(texts)
+
+        texts = [(text, i) for i, intent in enumerate(self.intents) for text in labelled[intent]]
+        X = np.zeros((len(texts), dim), dtype=np.float32)
+        for row, (text, _) in enumerate(texts):
+            indices, values = self.features(text)
+            X[row, indices] = values
+        Y = np.eye(len(self.intents), dtype=np.float32)[[label for _, label in texts]]
+        self.weights, self.bias = self._fit(X, Y, epochs, learning_rate, l2)
+
+        self.decisions = {"classifier": 0, "llm": 0}
+
+    @classmethod
+    def from_config(cls, llm=None) -> "IntentRouter":
+        config = load_config().get("intent_router", {})
+        return cls(
+            examples=config.get("examples"),
+            confidence_threshold=config.get("confidence_threshold", 0.55),
+            llm=llm if config.get("llm_fallback", True) else None,
+        )
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def _fit(self, X: np.ndarray, Y: np.ndarray, epochs: int, learning_rate: float, l2: float):
+        """Full-batch gradient descent on the L2-regularised cross-entropy."""
+        weights = np.zeros((X.shape[1], Y.shape[1]), dtype=np.float32)
+        bias = np.zeros(Y.shape[1], dtype=np.float32)
+        for _ in range(epochs):
+            error = self._softmax(X @ weights + bias) - Y
+            weights -= learning_rate * (X.T @ error / len(X) + l2 * weights)
+            bias -= learning_rate * error.mean(axis=0)
+        return weights, bias
+
+    # ---------- Features ----------
+    def _hash(self, token: str) -> Tuple[int, float]:
+        h = _token_hash(token)
+        return h % self.dim, (1.0 if (h >> 31) & 1 else -1.0)
+
+    def features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Sparse L2-normalised feature vector as (indices, values)."""
+        words = ["<num>" if NUMBER_RE.match(w) else w for w in TOKEN_RE.findall(text.lower())]
+        weights: Dict[int, float] = {}
+
+        def add(token: str, weight: float):
+            index, sign = self._hash(token)
+            weights[index] = weights.get(index, 0.0) + sign * weight
+
+        for i, word in enumerate(words):
+            add("w:" + word, 1.0)
+            if i:
+                add("b:" + words[i - 1] + " " + word, 1.0)
+            padded = f"#{word}#"
+            for j in range(len(padded) - 2):
+                add("c:" + padded[j:j + 3], 0.3)
+
+        if not weights:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        indices = np.fromiter(weights.keys(), dtype=np.int64, count=len(weights))
+        values = np.fromiter(weights.values(), dtype=np.float32, count=len(weights))
+        return indices, values / (np.linalg.norm(values) + 1e-12)
+
+    # ---------- Classification ----------
+    def classify(self, query: str) -> IntentDecision:
+        start = time.perf_counter()
+        indices, values = self.features(query)
+        probabilities = self._softmax(values @ self.weights[indices] + self.bias)
+        best = int(np.argmax(probabilities))
+        return IntentDecision(
+            intent=self.intents[best],
+            confidence=float(probabilities[best]),
+            scores={intent: round(float(p), 4) for intent, p in zip(self.intents, probabilities)},
+            seconds=time.perf_counter() - start,
+        )
+
+    def _llm_chain(self):
+        prompt = ChatPromptTemplate.from_template(PROMPT_REGISTRY[PromptType.QUERY_INTENT].template)
+        return (prompt | self.llm | StrOutputParser()).with_config(tags=[INTENT_ROUTER_TAG])
+
+    def _parse_label(self, output: str, fallback: IntentDecision) -> IntentDecision:
+        label = (output or "").strip().lower()
+        for intent in sorted(self.intents, key=len, reverse=True):
+            if intent in label or intent.replace("_", " ") in label:
+                return IntentDecision(intent, 1.0, "llm", fallback.scores, fallback.seconds)
+        log.warning("Unparseable intent label from LLM, keeping classifier decision", output=output)
+        return fallback
+
+    def _needs_llm(self, decision: IntentDecision) -> bool:
+        return self.llm is not None and decision.confidence < self.confidence_threshold
+
+    def _record(self, query: str, decision: IntentDecision) -> IntentDecision:
+        self.decisions[decision.source] += 1
+        log.info(
+            "Query intent",
+            query=query,
+            intent=decision.intent,
+            confidence=round(decision.confidence, 3),
+            source=decision.source,
+            micros=round(decision.seconds * 1e6, 1),
+        )
+        return decision
+
+    def route(self, query: str) -> IntentDecision:
+        decision = self.classify(query)
+        if self._needs_llm(decision):
+            try:
+                decision = self._parse_label(self._llm_chain().invoke({"question": query}), decision)
+            except Exception as e:
+                log.warning("LLM intent fallback failed, keeping classifier decision", error=str(e))
+        return self._record(query, decision)
+
+    async def aroute(self, query: str) -> IntentDecision:
+        decision = self.classify(query)
+        if self._needs_llm(decision):
+            try:
+                decision = self._parse_label(await self._llm_chain().ainvoke({"question": query}), decision)
+            except Exception as e:
+                log.warning("LLM intent fallback failed, keeping classifier decision", error=str(e))
+        return self._record(query, decision)
@@ -0,0 +1,160 @@
+import re
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from utils.config_loader import load_config
+from prod_assistant.logger import GLOBAL_LOGGER as log
+
+GENERATOR = "generator"
+REWRITER = "rewriter"
+
+# Written by the doc formatters from metadata["relevance_score"]
+RELEVANCE_LINE_RE = re.compile(r"^Relevance:\s*([0-9.]+)\s*$", re.MULTILINE)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Budget amounts ("1,00,000", "30000") are handled by the metadata pre-filter, not the text
+PRICE_TOKEN_RE = re.compile(r"^\d{4,}$")
+# Contexts the retriever / MCP tools return when they found nothing
+EMPTY_CONTEXTS = (
+    "No relevant documents found.", "No relevant product data found.", "No local results found.", "No data",
+    "Retriever tool not found",
+)
+
+STOPWORDS = frozenset("""
+a an the is are was were be of for to in on at and or with without from by about as it its this that these those
+what which who how when where why me my i you your we can could would should please tell show give find suggest
+recommend want need any some best good top price prices rs inr under below above over between than less more
+title rating reviews review relevance
+""".split())
+
+
+def _tokens(text: str) -> List[str]:
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS or PRICE_TOKEN_RE.match(token):
+            continue
+        tokens.append(token[:-1] if len(token) > 3 and token.endswith("s") else token)
+    return tokens
+
+
+@dataclass
+class GradeDecision:
+    route: Optional[str]  # generator | rewriter | None (ambiguous: ask the LLM)
+    score: float
+    similarity: Optional[float]
+    lexical: float
+
+
+class RelevanceGrader:
+    """
+    Local fast path for the workflows' document grader.
+
+    Combines the best vector-store similarity in the context (the
+    ``Relevance:`` lines the doc formatters write from
+    ``metadata["relevance_score"]``) with lexical coverage: the share of
+    the query's content words that appear in the context. Scores at or
+    above ``accept_threshold`` route to Generator and scores at or below
+    ``reject_threshold`` route to Rewriter, both without an LLM call. Only
+    the band in between goes to the LLM grader. Every decision is logged
+    with its score and the latency it saved, estimated from a running
+    average of LLM grader calls, so the thresholds can be tuned from logs.
+    """
+
+    def __init__(
+        self,
+        accept_threshold: float = 0.70,
+        reject_threshold: float = 0.30,
+        similarity_weight: float = 0.6,
+        enabled: bool = True,
+    ):
+        self.accept_threshold = accept_threshold
+        self.reject_threshold = reject_threshold
+        self.similarity_weight = similarity_weight
+        self.enabled = enabled
+
+        self.llm_seconds: Optional[float] = None  # moving average of LLM grader latency
+        self.counters = {GENERATOR: 0, REWRITER: 0, "llm": 0}
+        self.saved_seconds = 0.0
+
+    @classmethod
+    def from_config(cls) -> "RelevanceGrader":
+        config = load_config().get("relevance_grader", {})
+        return cls(
+            accept_threshold=config.get("accept_threshold", 0.70),
+            reject_threshold=config.get("reject_threshold", 0.30),
+            similarity_weight=config.get("similarity_weight", 0.6),
+            enabled=config.get("enabled", True),
+        )
+
+    # ---------- Scoring ----------
+    def score(self, question: str, context: str) -> GradeDecision:
+        context = context or ""
+        if not context.strip() or context.strip().startswith(EMPTY_CONTEXTS) or context.startswith("Error"):
+            return GradeDecision(REWRITER, 0.0, None, 0.0)
+
+        query_tokens = set(_tokens(question))
+        lexical = len(query_tokens & set(_tokens(context))) / len(query_tokens) if query_tokens else 0.0
+
+        similarities = [float(s) for s in RELEVANCE_LINE_RE.findall(context)]
+        similarity = max(similarities) if similarities else None
+        if similarity is None:
+            score = lexical
+        else:
+            score = self.similarity_weight * similarity + (1 - self.similarity_weight) * lexical
+
+        if score >= self.accept_threshold:
+            route = GENERATOR
+        elif score <= self.reject_threshold:
+            route = REWRITER
+        else:
+            route = None
+        return GradeDecision(route, round(score, 4), similarity, round(lexical, 4))
+
+    # ---------- Routing ----------
+    def _fast_path(self, question: str, context: str) -> GradeDecision:
+        decision = self.score(question, context)
+        if not self.enabled:
+            decision.route = None
+        return decision
+
+    def _record(self, question: str, decision: GradeDecision, route: str, source: str, seconds: float) -> str:
+        saved = 0.0
+        if source == "scorer":
+            self.counters[route] += 1
+            saved = self.llm_seconds or 0.0
+            self.saved_seconds += saved
+        else:
+            self.counters["llm"] += 1
+            self.llm_seconds = seconds if self.llm_seconds is None else 0.8 * self.llm_seconds + 0.2 * seconds
+        log.info(
+            "Document grade",
+            query=question,
+            route=route,
+            source=source,
+            score=decision.score,
+            similarity=decision.similarity,
+            lexical=decision.lexical,
+            grade_ms=round(seconds * 1000, 2),
+            saved_ms=round(saved * 1000, 1),
+        )
+        return route
+
+    def grade(self, question: str, context: str, llm_grade: Callable[[], str]) -> str:
+        """Route to generator / rewriter, calling ``llm_grade()`` only in the ambiguous band."""
+        start = time.perf_counter()
+        decision = self._fast_path(question, context)
+        if decision.route is not None:
+            return self._record(question, decision, decision.route, "scorer", time.perf_counter() - start)
+        route = llm_grade()
+        return self._record(question, decision, route, "llm", time.perf_counter() - start)
+
+    async def agrade(self, question: str, context: str, llm_grade: Callable[[], Awaitable[str]]) -> str:
+        start = time.perf_counter()
+        decision = self._fast_path(question, context)
+        if decision.route is not None:
+            return self._record(question, decision, decision.route, "scorer", time.perf_counter() - start)
+        route = await llm_grade()
+        return self._record(question, decision, route, "llm", time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        return {**self.counters, "saved_seconds": round(self.saved_seconds, 3)}
@@ -2,6 +2,8 @@
 import streamlit as st
 from prod_assistant.etl.data_scrapper import FlipkartScraper
 from prod_assistant.etl.data_ingestion import DataIngestion
+from prod_assistant.etl.streaming_pipeline import StreamingIngestion
+from prod_assistant.etl.catalog_store import CatalogStore
 import os
 
 flipkart_scraper = FlipkartScraper()
@@ -28,6 +30,25 @@ st.button("➕ Add Another Product", on_click=add_product_input)
 
 max_products = st.number_input("How many products per search?", min_value=1, max_value=10, value=1)
 review_count = st.number_input("How many reviews per product?", min_value=1, max_value=10, value=2)
+changed_only = st.checkbox(
+    "🔁 Only re-scrape products whose page changed since the last scrape",
+    value=flipkart_scraper.changed_only,
+    disabled=flipkart_scraper.page_cache is None,
+    help="Unchanged products keep their existing rows in the CSV.",
+)
+flipkart_scraper.changed_only = changed_only
+stream_to_store = st.checkbox(
+    "⚡ Stream products into the vector store as they are scraped",
+    help="Products become searchable within seconds instead of after the whole scrape.",
+)
+storage = st.radio(
+    "💾 Save scraped products to",
+    ["CSV", "Parquet catalog"],
+    horizontal=True,
+    help="The catalog appends a partition per run instead of rewriting the CSV.",
+)
+use_catalog = storage == "Parquet catalog"
+save_csv = st.checkbox("💾 Also save scraped products", value=True, disabled=not stream_to_store)
 
 if st.button("🚀 Start Scraping"):
     product_inputs = [p.strip() for p in st.session_state.product_inputs if p.strip()]
@@ -40,8 +61,32 @@ if st.button("🚀 Start Scraping"):
         final_data = []
         for query in product_inputs:
             st.write(f"🔍 Searching for: {query}")
-            results = flipkart_scraper.scrape_flipkart_products(query, max_products=max_products, review_count=review_count)
-            final_data.extend(results)
+        if stream_to_store:
+            try:
+                pipeline = StreamingIngestion(
+                    scraper=flipkart_scraper,
+                    csv_path=output_path if save_csv else None,
+                    merge_csv=changed_only,
+                    catalog=CatalogStore.from_config() if save_csv and use_catalog else None,
+                )
+                stats = pipeline.run(
+                    product_inputs,
+                    max_products=max_products,
+                    review_count=review_count,
+                    on_row=lambda row: (st.write(f"✅ {row[1]}"), final_data.append(row)),
+                    on_written=lambda docs: st.write(f"🧠 {len(docs)} product(s) now searchable"),
+                )
+                st.success(f"✅ Streamed into the vector store: {stats.as_dict()}")
+            except Exception as e:
+                st.error("❌ Streaming ingestion failed!")
+                st.exception(e)
+        else:
+            # Queries and review pages are fetched concurrently; rows arrive in query order
+            for query, row in flipkart_scraper.scrape_many(product_inputs, max_products=max_products, review_count=review_count):
+                st.write(f"✅ {row[1]}")
+                final_data.append(row)
+        with st.expander("⏱️ Scrape timing by phase"):
+            st.text(flipkart_scraper.timing_report())
 
         unique_products = {}
         for row in final_data:
@@ -50,15 +95,22 @@ if st.button("🚀 Start Scraping"):
 
         final_data = list(unique_products.values())
         st.session_state["scraped_data"] = final_data  # store in session
-        flipkart_scraper.save_to_csv(final_data, output_path)
-        st.success("✅ Data saved to `data/product_reviews.csv`")
-        st.download_button("📥 Download CSV", data=open(output_path, "rb"), file_name="product_reviews.csv")
+        if not stream_to_store:
+            if use_catalog:
+                flipkart_scraper.save_to_catalog(final_data)
+            else:
+                flipkart_scraper.save_to_csv(final_data, output_path, merge=changed_only)
+        if use_catalog and (not stream_to_store or save_csv):
+            st.success(f"✅ Data appended to the catalog ({CatalogStore.from_config().count()} rows across all runs)")
+        elif not stream_to_store or save_csv:
+            st.success("✅ Data saved to `data/product_reviews.csv`")
+            st.download_button("📥 Download CSV", data=open(output_path, "rb"), file_name="product_reviews.csv")
 
 # This stays OUTSIDE "if st.button('Start Scraping')"
 if "scraped_data" in st.session_state and st.button("🧠 Store in Vector DB (AstraDB)"):
     with st.spinner("📡 Initializing ingestion pipeline..."):
         try:
-            ingestion = DataIngestion()
+            ingestion = DataIngestion(source="catalog" if use_catalog else "csv")
             st.info("🚀 Running ingestion pipeline...")
             ingestion.run_pipeline()
             st.success("✅ Data successfully ingested to AstraDB!")
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Workflow modules import unprefixed (``from utils...``), like the app and benchmarks
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "prod_assistant"))
@@ -0,0 +1,212 @@
+import uuid
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult, Generation, LLMResult
+
+from workflow.agentic_rag_workflow import AgenticRAG
+from workflow.budget import (
+    NO_ANSWER,
+    PARTIAL_ANSWER,
+    BudgetCallbackHandler,
+    RequestBudget,
+    best_effort_answer,
+    current_budget,
+)
+
+QUERY = "What is the price of iPhone 16?"
+ANSWER = "The iPhone 16 costs about ₹79,900."
+CONTEXT = (
+    "Title: Apple iPhone 16 (Black, 128 GB)\nPrice: ₹79,900\nRating: 4.6\nReviews:\nGood phone."
+    "\n\n---\n\n"
+    "Title: Apple iPhone 16 Plus\nPrice: ₹89,900\nReviews:\nBig battery."
+)
+
+
+def unlimited(**limits) -> RequestBudget:
+    return RequestBudget(**{"max_rewrites": None, "max_llm_calls": None, "max_tokens": None,
+                            "deadline_seconds": None, **limits})
+
+
+class StubChatModel(BaseChatModel):
+    """Grades "no" (the docs never look relevant), rewrites the query, answers everything else."""
+
+    tokens_per_call: int = 400
+    prompts: list = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        text = messages[-1].content
+        self.prompts.append(text)
+        if "You are a grader" in text:
+            answer = "no"
+        elif "Rewrite" in text:
+            answer = "price of the apple iphone 16 128gb"
+        else:
+            answer = ANSWER
+        usage = {"input_tokens": self.tokens_per_call - 20, "output_tokens": 20, "total_tokens": self.tokens_per_call}
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer, usage_metadata=usage))])
+
+    def calls(self, marker: str) -> int:
+        return sum(marker in p for p in self.prompts)
+
+
+class StubRetriever:
+    vstore = object()
+
+    def __init__(self):
+        self.queries = []
+
+    def load_retriever(self):
+        return self
+
+    def invoke(self, query: str):
+        self.queries.append(query)
+        return [Document(
+            page_content="Good phone, battery could be better.",
+            metadata={"product_title": "Apple iPhone 16 (Black, 128 GB)", "price": "₹79,900", "rating": "4.6"},
+        )]
+
+
+@pytest.fixture
+def engine():
+    engine = AgenticRAG(llm=StubChatModel(prompts=[]), retriever_obj=StubRetriever())
+    # Every grade must reach the stub LLM
+    engine.relevance_grader.enabled = False
+    return engine
+
+
+def run(engine: AgenticRAG, budget: RequestBudget) -> str:
+    return engine.run(QUERY, thread_id=uuid.uuid4().hex, budget=budget)
+
+
+# ---------- Limits ----------
+def test_none_disables_every_limit():
+    budget = unlimited(llm_calls=10_000, tokens=10_000_000, rewrites=100)
+    assert budget.exhausted() is None
+
+
+@pytest.mark.parametrize(
+    "budget, reason",
+    [
+        (unlimited(max_rewrites=2, rewrites=2), "rewrites"),
+        (unlimited(max_llm_calls=3, llm_calls=3), "llm_calls"),
+        (unlimited(max_tokens=1000, tokens=1000), "tokens"),
+        (unlimited(deadline_seconds=0), "deadline"),
+    ],
+)
+def test_exhausted_reasons(budget, reason):
+    assert budget.exhausted() == reason
+    assert budget.llm_exhausted() == (None if reason == "rewrites" else reason)
+
+
+def test_current_budget_is_unlimited_outside_activate():
+    assert current_budget().exhausted() is None
+    budget = unlimited(max_rewrites=1)
+    with budget.activate():
+        assert current_budget() is budget
+    assert current_budget() is not budget
+
+
+# ---------- Token accounting ----------
+def test_tokens_from_usage_metadata():
+    message = AIMessage(content="yes", usage_metadata={"input_tokens": 90, "output_tokens": 10, "total_tokens": 100})
+    assert BudgetCallbackHandler._tokens(LLMResult(generations=[[ChatGeneration(message=message)]])) == 100
+
+
+def test_tokens_from_provider_llm_output():
+    response = LLMResult(generations=[[Generation(text="yes")]], llm_output={"token_usage": {"total_tokens": 42}})
+    assert BudgetCallbackHandler._tokens(response) == 42
+
+
+def test_tokens_estimated_when_provider_reports_nothing():
+    assert BudgetCallbackHandler._tokens(LLMResult(generations=[[Generation(text="x" * 40)]])) == 10
+
+
+# ---------- Best-effort answer ----------
+def test_best_effort_answer_lists_retrieved_products():
+    answer = best_effort_answer(CONTEXT)
+    assert answer.startswith(PARTIAL_ANSWER)
+    assert "- Apple iPhone 16 (Black, 128 GB) | Price: ₹79,900 | Rating: 4.6" in answer
+    assert "- Apple iPhone 16 Plus | Price: ₹89,900 | Rating: N/A" in answer
+
+
+@pytest.mark.parametrize("context", [None, "", "No relevant documents found."])
+def test_best_effort_answer_without_products(context):
+    assert best_effort_answer(context) == NO_ANSWER
+
+
+# ---------- Graph ----------
+def test_always_irrelevant_docs_stop_after_max_rewrites(engine):
+    budget = unlimited(max_rewrites=2)
+
+    assert run(engine, budget) == ANSWER
+    assert budget.rewrites == 2
+    assert len(engine.retriever_obj.queries) == 3
+    # The third grade is skipped: out of rewrites, generate from the docs found
+    assert engine.llm.calls("You are a grader") == 2
+    assert budget.llm_calls == 5  # 2 grades + 2 rewrites + 1 answer
+
+
+def test_llm_call_limit_ends_with_a_best_effort_answer(engine):
+    budget = unlimited(max_llm_calls=2)
+
+    answer = run(engine, budget)
+
+    # grade -> rewrite -> Assistant finds the budget spent and answers from the retrieved docs
+    assert answer.startswith(PARTIAL_ANSWER)
+    assert "Apple iPhone 16 (Black, 128 GB)" in answer
+    assert budget.llm_calls == 2
+    assert engine.llm.calls("You are a grader") == 1
+
+
+def test_token_limit_counts_provider_usage(engine):
+    budget = unlimited(max_tokens=500)
+
+    assert run(engine, budget).startswith(PARTIAL_ANSWER)
+    assert budget.tokens == 800  # grade + rewrite, 400 each
+    assert budget.llm_calls == 2
+
+
+def test_spent_deadline_answers_without_any_llm_call(engine):
+    budget = unlimited(deadline_seconds=0)
+
+    assert run(engine, budget) == NO_ANSWER
+    assert budget.llm_calls == 0
+    assert engine.retriever_obj.queries == []
+
+
+# ---------- Nodes ----------
+def spent() -> RequestBudget:
+    return unlimited(max_llm_calls=1, llm_calls=1)
+
+
+def test_assistant_node_degrades_to_best_effort(engine):
+    budget = spent()
+    budget.best_context = CONTEXT
+    with budget.activate():
+        result = engine._ai_assistant({"messages": [HumanMessage(content=QUERY)]})
+    assert result["messages"][0].content == best_effort_answer(CONTEXT)
+    assert engine.llm.prompts == []
+
+
+def test_generator_node_degrades_to_best_effort(engine):
+    with spent().activate():
+        result = engine._generate({"messages": [HumanMessage(content=QUERY), HumanMessage(content=CONTEXT)]})
+    assert result["messages"][0].content == best_effort_answer(CONTEXT)
+    assert engine.llm.prompts == []
+
+
+def test_rewriter_node_hands_back_to_the_assistant(engine):
+    budget = spent()
+    with budget.activate():
+        result = engine._rewrite({"messages": [HumanMessage(content=QUERY), HumanMessage(content=CONTEXT)]})
+    # No rewrite call: the original question goes back and the Assistant gives the best-effort answer
+    assert result["messages"][0].content == QUERY
+    assert budget.rewrites == 1
+    assert engine.llm.prompts == []
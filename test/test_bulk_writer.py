@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.etl.bulk_writer import PipelinedWriter
+from prod_assistant.exception.custom_exception import ProductAssistantException
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+
+
+class HashEmbeddings(Embeddings):
+    def _vector(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:16]]
+
+    def embed_documents(self, texts):
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+class StandInStore(LocalVectorStore):
+    """LocalVectorStore that records calls, simulates latency and fails selected batches."""
+
+    def __init__(self, latency: float = 0.0, failures: dict = None, **kwargs):
+        super().__init__(HashEmbeddings(), **kwargs)
+        self.latency = latency
+        self.failures = dict(failures or {})  # first id of a batch -> failures left
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._counter_lock = threading.Lock()
+
+    def add_texts(self, texts, metadatas=None, *, ids=None, **kwargs):
+        with self._counter_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.calls.append(list(ids or []))
+        try:
+            time.sleep(self.latency)
+            first = ids[0] if ids else None
+            if self.failures.get(first, 0) > 0:
+                self.failures[first] -= 1
+                raise ConnectionError(f"simulated store error on {first}")
+            return super().add_texts(texts, metadatas, ids=ids)
+        finally:
+            with self._counter_lock:
+                self.in_flight -= 1
+
+
+def make_batches(docs: int, batch_size: int):
+    batches = []
+    for start in range(0, docs, batch_size):
+        ids = [f"p{i}" for i in range(start, min(start + batch_size, docs))]
+        batches.append(([Document(page_content=f"review for {i}", metadata={"product_id": i}) for i in ids], ids))
+    return batches
+
+
+def test_every_batch_is_written_once_with_its_ids(tmp_path):
+    store = StandInStore()
+    checkpoint = tmp_path / "ingest.checkpoint.json"
+    writer = PipelinedWriter(store, concurrency=2, checkpoint_path=str(checkpoint))
+
+    written = writer.write(make_batches(95, 10))
+
+    assert len(store) == len(written) == 95
+    assert sorted(map(tuple, store.calls)) == sorted(tuple(ids) for _, ids in make_batches(95, 10))
+    assert writer.batches_written == 10
+    assert not checkpoint.exists()  # removed after a complete run
+
+
+def test_failing_batch_is_retried_with_exponential_backoff(monkeypatch):
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    monkeypatch.setattr("prod_assistant.etl.bulk_writer.random.random", lambda: 0.0)
+    store = StandInStore(failures={"p10": 2})
+    writer = PipelinedWriter(store, concurrency=1, max_retries=3, retry_backoff_seconds=0.5)
+
+    writer.write(make_batches(30, 10))
+
+    assert len(store) == 30
+    assert writer.retries == 2
+    assert delays == [0.5, 1.0]
+    assert [ids[0] for ids in store.calls] == ["p0", "p10", "p10", "p10", "p20"]
+
+
+def test_run_resumes_from_checkpoint_after_a_failed_batch(tmp_path):
+    checkpoint = str(tmp_path / "ingest.checkpoint.json")
+    batches = make_batches(40, 10)
+    index = str(tmp_path / "index")
+
+    store = StandInStore(failures={"p20": 99}, path=index)
+    writer = PipelinedWriter(store, concurrency=2, max_retries=1, retry_backoff_seconds=0.0, checkpoint_path=checkpoint)
+    with pytest.raises(ProductAssistantException):
+        writer.write(batches)
+    assert writer.failed_batches == [PipelinedWriter.batch_key(*batches[2])]
+    assert len(store) == 30
+
+    store = StandInStore(path=index)
+    writer = PipelinedWriter(store, concurrency=2, checkpoint_path=checkpoint)
+    writer.write(batches)
+    assert writer.batches_skipped == 3
+    assert store.calls == [[f"p{i}" for i in range(20, 30)]]
+    assert len(store) == 40
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_writes_in_flight_are_bounded_by_concurrency(concurrency):
+    store = StandInStore(latency=0.02)
+    writer = PipelinedWriter(store, concurrency=concurrency)
+
+    writer.write(make_batches(120, 10))
+
+    assert len(store) == 120
+    assert store.max_in_flight == concurrency
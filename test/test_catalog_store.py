@@ -0,0 +1,48 @@
+import random
+
+import pandas as pd
+
+from prod_assistant.etl.catalog_store import CATALOG_COLUMNS, CatalogStore
+
+
+def row(product_id, title, price):
+    return [product_id, title, "4.5", "10", price, f"reviews of {title}"]
+
+
+def test_latest_keeps_the_newest_version_per_product(tmp_path):
+    catalog = CatalogStore(str(tmp_path))
+    catalog.append([row("p1", "Phone", "₹100"), row("p2", "Laptop", "₹900"), row("N/A", "Loose item", "₹5")],
+                   scraped_at="2025-10-01T10:00:00")
+    catalog.append([row("p1", "Phone (new)", "₹90"), row(" N/A ", "Loose item", "₹4")], scraped_at="2025-10-03T10:00:00")
+    catalog.append([row("p2", "Laptop (older)", "₹950")], scraped_at="2025-09-30T10:00:00")
+
+    latest = catalog.latest().set_index("product_title")
+    assert sorted(latest.index) == ["Laptop", "Loose item", "Phone (new)"]
+    assert latest.loc["Loose item", "price"] == "₹4"
+    assert list(catalog.latest().columns) == CATALOG_COLUMNS
+
+    since = catalog.latest(since="2025-10-02")
+    assert sorted(since["product_title"]) == ["Loose item", "Phone (new)"]
+
+
+def test_latest_frames_are_bounded_and_match_a_full_dedupe(tmp_path):
+    catalog = CatalogStore(str(tmp_path))
+    rng = random.Random(0)
+    for day in range(1, 6):
+        ids = rng.sample(range(500), 300)
+        catalog.append([row(f"p{i}", f"item {i} day {day}", f"₹{rng.randrange(100, 999)}") for i in ids],
+                       scraped_at=f"2025-10-0{day}T10:00:00")
+
+    frames = list(catalog.iter_latest_frames(chunksize=64))
+    assert all(len(frame) <= 64 for frame in frames)
+    streamed = pd.concat(frames).sort_values("product_id").reset_index(drop=True)
+
+    full = catalog.read().to_pandas().sort_values("scraped_at", kind="stable")
+    expected = full.drop_duplicates("product_id", keep="last")[CATALOG_COLUMNS]
+    assert streamed.equals(expected.sort_values("product_id").reset_index(drop=True))
+
+
+def test_empty_catalog_yields_nothing(tmp_path):
+    catalog = CatalogStore(str(tmp_path))
+    assert list(catalog.iter_latest_frames()) == []
+    assert list(catalog.latest().columns) == CATALOG_COLUMNS
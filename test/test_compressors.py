@@ -0,0 +1,38 @@
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from retriever.compressors import RELEVANCE_SCORE_KEY, BatchedLLMFilter, ScoredLLMFilter
+
+
+@pytest.mark.parametrize(
+    "answer, expected",
+    [
+        ("1, 3", [True, False, True]),
+        ("[2], [3]", [False, True, True]),
+        ("  2", [False, True, False]),
+        ("NONE", [False, False, False]),
+        ("none, although doc 2 mentions the brand", [False, False, False]),
+        ("Documents 1 and 2 are relevant, 3 is not", [False, False, False]),
+        ("1, 2\n\n3 is about a different phone", [True, True, False]),
+        ("1, 7, 0", [True, False, False]),
+        ("", [False, False, False]),
+    ],
+)
+def test_batched_parse_reads_only_the_leading_index_list(answer, expected):
+    assert BatchedLLMFilter._parse(answer, 3) == expected
+
+
+def test_scored_filter_is_abstract():
+    with pytest.raises(TypeError):
+        ScoredLLMFilter(llm=None)
+
+
+def test_batched_filter_grades_only_the_ambiguous_band():
+    docs = [
+        Document(page_content=f"doc {i}", metadata={RELEVANCE_SCORE_KEY: score})
+        for i, score in enumerate([0.9, 0.6, 0.3, 0.7])
+    ]
+    llm = FakeListChatModel(responses=["2, 5"])  # ambiguous docs 1 and 3, numbered 1..2 in the prompt
+    kept = BatchedLLMFilter(llm=llm).compress_documents(docs, "phone")
+    assert [d.page_content for d in kept] == ["doc 0", "doc 3"]
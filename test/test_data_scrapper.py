@@ -0,0 +1,219 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+
+from prod_assistant.etl import page_cache as page_cache_module
+from prod_assistant.etl.data_scrapper import NO_REVIEWS, UNCHANGED, FlipkartScraper, rendered_key
+from prod_assistant.etl.http_fetcher import HttpFetcher
+from prod_assistant.etl.page_cache import PageCache
+
+FIXTURE = (Path(__file__).resolve().parents[1] / "flipkart_product_page.html").read_text(encoding="utf-8")
+PRODUCT_URL = "https://www.flipkart.com/apple-iphone-16-pink-128-gb/p/itmc2e910b4d0b1c"
+CHALLENGE_PAGE = "<html><body><p>Please verify you are a human</p></body></html>"
+
+
+class FakeDriver:
+    """Just enough WebDriver for _scrape_reviews: every wait resolves at once."""
+
+    def __init__(self, page_source: str):
+        self.page_source = page_source
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            return "complete"
+        if "querySelectorAll" in script:
+            return 10  # enough rendered reviews: no scrolling
+        return True
+
+    def execute_async_script(self, script, *args):
+        return True
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def find_elements(self, by, value):
+        return []
+
+
+class FakeDriverPool:
+    def __init__(self, page_source: str = FIXTURE):
+        self.driver = FakeDriver(page_source)
+        self.leases = 0
+
+    @contextmanager
+    def lease(self):
+        self.leases += 1
+        yield self.driver
+
+
+class Server:
+    """MockTransport handler serving one response per URL and recording requests."""
+
+    def __init__(self, body: str = FIXTURE, status: int = 200, headers: dict = None):
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.headers.get("etag") and request.headers.get("if-none-match") == self.headers["etag"]:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(self.status, text=self.body, headers=self.headers)
+
+
+@pytest.fixture
+def make_scraper(tmp_path):
+    fetchers = []
+
+    def make(server: Server, **kwargs):
+        fetcher = HttpFetcher(transport=httpx.MockTransport(server))
+        fetchers.append(fetcher)
+        kwargs.setdefault("driver_pool", FakeDriverPool())
+        kwargs.setdefault("page_cache", PageCache(str(tmp_path / f"pages-{len(fetchers)}.sqlite")))
+        return FlipkartScraper(
+            output_dir=str(tmp_path),
+            requests_per_second=0,
+            fetch_mode="http_first",
+            http_fetcher=fetcher,
+            **kwargs,
+        )
+
+    yield make
+    for fetcher in fetchers:
+        fetcher.close()
+
+
+def test_server_rendered_page_needs_no_chrome(make_scraper):
+    server = Server()
+    scraper = make_scraper(server)
+
+    reviews = scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    assert reviews != "No reviews found"
+    assert len(reviews.split(" || ")) == 2
+    assert scraper.driver_pool.leases == 0
+    assert (scraper.http_pages, scraper.browser_fallbacks) == (1, 0)
+    assert len(server.requests) == 1
+
+
+def test_counters_are_exact_under_concurrent_workers(make_scraper):
+    # Switch threads as often as possible so an unguarded "+= 1" would lose updates
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        scraper = make_scraper(Server())
+        urls = [f"{PRODUCT_URL}?page={i}" for i in range(64)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(scraper.get_top_reviews, urls))
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert (scraper.http_pages, scraper.browser_fallbacks) == (64, 0)
+
+
+@pytest.mark.parametrize("server", [Server(body=CHALLENGE_PAGE), Server(status=403, body="Forbidden")])
+def test_missing_content_falls_back_to_chrome(make_scraper, server):
+    scraper = make_scraper(server)
+
+    reviews = scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    assert len(reviews.split(" || ")) == 2
+    assert scraper.driver_pool.leases == 1
+    assert scraper.driver_pool.driver.visited == [PRODUCT_URL]
+
+
+def test_stale_page_is_revalidated_with_its_validators(make_scraper, monkeypatch):
+    server = Server(headers={"etag": '"v1"', "last-modified": "Wed, 01 Oct 2025 10:00:00 GMT"})
+    scraper = make_scraper(server)
+    first = scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    # A day and a bit later the entry is stale, but it still carries its validators
+    now = page_cache_module.time.time()
+    monkeypatch.setattr(page_cache_module.time, "time", lambda: now + scraper.page_cache.ttl_seconds + 60)
+    second = scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    assert second == first
+    assert len(server.requests) == 2
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    assert server.requests[1].headers["if-modified-since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+    assert scraper.page_cache.revalidated == 1
+    assert scraper.page_cache.get_fresh(PRODUCT_URL) is not None  # 304 made it fresh again
+    assert scraper.driver_pool.leases == 0
+
+
+def test_page_cache_serves_within_ttl_and_refetches_after(make_scraper, monkeypatch):
+    server = Server()
+    scraper = make_scraper(server)
+    cache = scraper.page_cache
+    search_url = "https://www.flipkart.com/search?q=iphone"
+    assert cache.ttl_for(search_url) == cache.search_ttl_seconds < cache.ttl_for(PRODUCT_URL) == cache.ttl_seconds
+
+    scraper.get_top_reviews(PRODUCT_URL, count=2)
+    scraper.get_top_reviews(PRODUCT_URL, count=2)
+    assert len(server.requests) == 1
+    assert cache.hits == 1
+
+    now = page_cache_module.time.time()
+    monkeypatch.setattr(page_cache_module.time, "time", lambda: now + cache.ttl_seconds + 1)
+    scraper.get_top_reviews(PRODUCT_URL, count=2)
+    assert len(server.requests) == 2
+
+
+# ---------- Chrome renders and changed-only mode ----------
+CHALLENGE_HEADERS = {"etag": '"c1"', "last-modified": "Wed, 01 Oct 2025 10:00:00 GMT"}
+
+
+def test_chrome_render_does_not_replace_the_http_entry(make_scraper):
+    scraper = make_scraper(Server(body=CHALLENGE_PAGE, headers=CHALLENGE_HEADERS))
+    scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    http_entry = scraper.page_cache.get(PRODUCT_URL)
+    assert http_entry.html == CHALLENGE_PAGE
+    assert (http_entry.etag, http_entry.last_modified) == ('"c1"', "Wed, 01 Oct 2025 10:00:00 GMT")
+    assert scraper.page_cache.get(rendered_key(PRODUCT_URL)).html == FIXTURE
+
+
+def test_cached_chrome_render_is_reused_within_ttl(make_scraper):
+    scraper = make_scraper(Server(body=CHALLENGE_PAGE))
+    first = scraper.get_top_reviews(PRODUCT_URL, count=2)
+    second = scraper.get_top_reviews(PRODUCT_URL, count=2)
+
+    assert second == first != NO_REVIEWS
+    assert scraper.driver_pool.leases == 1
+
+
+def test_changed_only_skips_unchanged_products_that_needed_chrome(make_scraper, tmp_path, monkeypatch):
+    cache = PageCache(str(tmp_path / "shared.sqlite"))
+    server = Server(body=CHALLENGE_PAGE, headers=CHALLENGE_HEADERS)
+    first = make_scraper(server, page_cache=cache, changed_only=True)
+    assert first._review_for(PRODUCT_URL, 2) not in (UNCHANGED, NO_REVIEWS)
+    assert first.driver_pool.leases == 1
+
+    # Next run, after every cached page has gone stale: the HTTP entry revalidates with a 304
+    now = page_cache_module.time.time()
+    monkeypatch.setattr(page_cache_module.time, "time", lambda: now + cache.ttl_seconds + 60)
+    second = make_scraper(server, page_cache=cache, changed_only=True)
+    assert second._review_for(PRODUCT_URL, 2) is UNCHANGED
+    assert second.driver_pool.leases == 0
+    assert second.unchanged_skipped == 1
+
+
+def test_page_without_reviews_is_not_marked_scraped(make_scraper, tmp_path):
+    cache = PageCache(str(tmp_path / "shared.sqlite"))
+    server = Server(body=CHALLENGE_PAGE)
+    first = make_scraper(server, page_cache=cache, changed_only=True, driver_pool=FakeDriverPool(CHALLENGE_PAGE))
+    assert first._review_for(PRODUCT_URL, 2) == NO_REVIEWS
+    assert cache.get(PRODUCT_URL).scraped_hash is None
+
+    second = make_scraper(server, page_cache=cache, changed_only=True)
+    assert second._review_for(PRODUCT_URL, 2) not in (UNCHANGED, NO_REVIEWS)
+    assert second.driver_pool.leases == 1
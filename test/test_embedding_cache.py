@@ -0,0 +1,202 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import List
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.utils.embedding_cache import CachedEmbeddings
+
+
+def vector(text: str) -> List[float]:
+    return [float(len(text)), float(sum(map(ord, text)) % 97)]
+
+
+class StubEmbeddings(Embeddings):
+    """Deterministic vectors; ``gate`` holds the first call until it is set, ``error`` makes calls fail."""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+        self.error = None
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        self.started.set()
+        self.gate.wait(5)
+        if self.error:
+            raise self.error
+        return [vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        self.started.set()
+        while not self.gate.is_set():
+            await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return [vector(t) for t in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CachedEmbeddings(StubEmbeddings(), "stub-model", str(tmp_path / "embeddings.sqlite"), batch_size=2)
+
+
+def run_in_thread(fn, *args):
+    """Start ``fn`` on a thread; returns (thread, outcome) where outcome gets "result" or "error"."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = fn(*args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, outcome
+
+
+def start_owner(cache, texts):
+    """Start an owner call that blocks inside the remote embedding call."""
+    cache.underlying.gate.clear()
+    owner = run_in_thread(cache.embed_documents, texts)
+    assert cache.underlying.started.wait(5)
+    return owner
+
+
+def wait_for_waiters(cache, count: int):
+    deadline = time.monotonic() + 5
+    while cache.coalesced < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert cache.coalesced == count
+
+
+def test_hits_misses_and_batching(cache, tmp_path):
+    assert cache.embed_documents(["a", "bb", "a", "ccc"]) == [vector("a"), vector("bb"), vector("a"), vector("ccc")]
+    assert cache.underlying.calls == [["a", "bb"], ["ccc"]]
+    assert cache.embed_documents(["bb"]) == [vector("bb")]
+    assert cache.stats()["hits"] == 1
+
+    # Persistent: a new instance on the same file needs no remote call
+    reopened = CachedEmbeddings(StubEmbeddings(), "stub-model", str(tmp_path / "embeddings.sqlite"))
+    assert reopened.embed_documents(["ccc"]) == [vector("ccc")]
+    assert reopened.underlying.calls == []
+
+
+def test_query_and_document_vectors_are_cached_apart(cache):
+    cache.embed_documents(["a"])
+    cache.embed_query("a")
+    assert cache.underlying.calls == [["a"], ["a"]]
+
+
+def test_concurrent_callers_share_one_remote_call(cache):
+    (owner, owner_out) = start_owner(cache, ["a"])
+    waiter, waiter_out = run_in_thread(cache.embed_documents, ["a"])
+    wait_for_waiters(cache, 1)
+    cache.underlying.gate.set()
+    owner.join(5), waiter.join(5)
+    assert owner_out["result"] == waiter_out["result"] == [vector("a")]
+    assert cache.underlying.calls == [["a"]]
+    assert cache._inflight == {}
+
+
+def test_remote_error_reaches_waiters_and_releases_the_key(cache):
+    cache.underlying.error = RuntimeError("quota exceeded")
+    (owner, owner_out) = start_owner(cache, ["a"])
+    waiter, waiter_out = run_in_thread(cache.embed_documents, ["a"])
+    wait_for_waiters(cache, 1)
+    cache.underlying.gate.set()
+    owner.join(5), waiter.join(5)
+    assert isinstance(owner_out["error"], RuntimeError)
+    assert isinstance(waiter_out["error"], RuntimeError)
+    assert cache._inflight == {}
+
+    cache.underlying.error = None
+    assert cache.embed_documents(["a"]) == [vector("a")]
+
+
+def test_store_write_failure_still_resolves_everyone(cache, monkeypatch):
+    def locked(items):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache.store, "put_many", locked)
+    (owner, owner_out) = start_owner(cache, ["a"])
+    waiter, waiter_out = run_in_thread(cache.embed_documents, ["a"])
+    wait_for_waiters(cache, 1)
+    cache.underlying.gate.set()
+    owner.join(5), waiter.join(5)
+    assert not waiter.is_alive()
+    assert owner_out["result"] == waiter_out["result"] == [vector("a")]
+    assert cache._inflight == {}
+
+
+def test_cancel_during_lookup_leaks_no_inflight_key(cache, monkeypatch):
+    get_many = cache.store.get_many
+
+    def slow_get_many(keys):
+        time.sleep(0.2)
+        return get_many(keys)
+
+    monkeypatch.setattr(cache.store, "get_many", slow_get_many)
+
+    async def scenario():
+        task = asyncio.create_task(cache.aembed_documents(["x"]))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.3)  # let the lookup thread finish
+        assert cache._inflight == {}
+        return await asyncio.wait_for(cache.aembed_documents(["x"]), timeout=2)
+
+    assert asyncio.run(scenario()) == [vector("x")]
+
+
+def test_cancelled_owner_hands_the_text_to_a_waiter(cache):
+    async def scenario():
+        cache.underlying.gate.clear()
+        owner = asyncio.create_task(cache.aembed_documents(["a"]))
+        while not cache.underlying.started.is_set():
+            await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.aembed_documents(["a"]))
+        while cache.coalesced < 1:
+            await asyncio.sleep(0.01)
+
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        cache.underlying.gate.set()
+        return await asyncio.wait_for(waiter, timeout=2)
+
+    assert asyncio.run(scenario()) == [vector("a")]
+    assert cache.underlying.calls == [["a"], ["a"]]
+    assert cache._inflight == {}
+
+
+def test_cancelled_waiter_does_not_cancel_the_owner(cache):
+    async def scenario():
+        cache.underlying.gate.clear()
+        owner = asyncio.create_task(cache.aembed_documents(["a"]))
+        while not cache.underlying.started.is_set():
+            await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.aembed_documents(["a"]))
+        while cache.coalesced < 1:
+            await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        cache.underlying.gate.set()
+        return await asyncio.wait_for(owner, timeout=2)
+
+    assert asyncio.run(scenario()) == [vector("a")]
+    assert cache._inflight == {}
@@ -0,0 +1,82 @@
+import asyncio
+import itertools
+
+from workflow.budget import best_effort_answer
+from workflow.engine_pool import EnginePool
+
+
+class FakeCache:
+    def __init__(self):
+        self.entries = {}
+
+    async def aget(self, query):
+        return self.entries.get(query)
+
+    async def aput(self, query, answer, compute_seconds=0.0):
+        self.entries[query] = answer
+
+
+class FakeEngine:
+    def __init__(self, answer, cacheable=True):
+        self.answer = answer
+        self.cacheable = cacheable
+
+    async def run(self, query, thread_id):
+        return self.answer
+
+    async def astream(self, query, thread_id):
+        yield {"type": "token", "content": self.answer}
+        yield {"type": "done", "answer": self.answer, "cacheable": self.cacheable}
+
+    async def answer_cacheable(self, thread_id):
+        return self.cacheable
+
+    async def release_thread(self, thread_id):
+        pass
+
+
+def make_pool(engine) -> EnginePool:
+    pool = EnginePool(engine_factory=lambda: engine, size=1)
+    pool.semantic_cache = FakeCache()
+    pool.engines = [engine]
+    pool._cycle = itertools.cycle(pool.engines)
+    pool.ready = True
+    return pool
+
+
+def test_generated_answer_is_cached():
+    pool = make_pool(FakeEngine("The iPhone 16 costs ₹79,900."))
+    asyncio.run(pool.run("iphone 16 price"))
+    assert pool.semantic_cache.entries == {"iphone 16 price": "The iPhone 16 costs ₹79,900."}
+
+
+def test_answer_flagged_not_cacheable_is_skipped():
+    pool = make_pool(FakeEngine("Sorry, nothing matched that.", cacheable=False))
+    asyncio.run(pool.run("iphone 16 price"))
+    assert pool.semantic_cache.entries == {}
+
+
+def test_degraded_answers_are_skipped_even_if_flagged_cacheable():
+    for answer in (
+        "Error generating response: boom",
+        "Retriever tool not found in MCP client.",
+        "No relevant documents found.",
+        best_effort_answer(None),
+        best_effort_answer("Title: Apple iPhone 16\nPrice: ₹79,900\nRating: 4.6\nReviews:\nok"),
+    ):
+        pool = make_pool(FakeEngine(answer))
+        asyncio.run(pool.run("iphone 16 price"))
+        assert pool.semantic_cache.entries == {}, answer
+
+
+def test_stream_uses_done_event_flag():
+    async def drain(pool):
+        return [event async for event in pool.stream("iphone 16 price")]
+
+    pool = make_pool(FakeEngine("The iPhone 16 costs ₹79,900.", cacheable=False))
+    asyncio.run(drain(pool))
+    assert pool.semantic_cache.entries == {}
+
+    pool = make_pool(FakeEngine("The iPhone 16 costs ₹79,900."))
+    asyncio.run(drain(pool))
+    assert "iphone 16 price" in pool.semantic_cache.entries
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel, GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from workflow.intent_router import ANSWER, INTENT_ROUTER_TAG, INTENTS, RETRIEVE, SEED_EXAMPLES, WEB_SEARCH, IntentRouter
+
+
+class CountingChatModel(FakeListChatModel):
+    """FakeListChatModel that records how often it is asked."""
+
+    calls: int = 0
+
+    def _call(self, *args, **kwargs):
+        self.calls += 1
+        return super()._call(*args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter()
+
+
+@pytest.mark.parametrize("intent", INTENTS)
+def test_seed_examples_route_to_their_intent(router, intent):
+    for query in SEED_EXAMPLES[intent]:
+        assert router.classify(query).intent == intent, query
+
+
+def test_decision_scores_are_probabilities(router):
+    decision = router.classify("what is the price of the pixel 9")
+    assert decision.source == "classifier"
+    assert set(decision.scores) == set(INTENTS)
+    assert sum(decision.scores.values()) == pytest.approx(1.0, abs=1e-3)
+    assert decision.confidence == pytest.approx(max(decision.scores.values()), abs=1e-3)
+
+
+def test_extra_examples_must_name_a_known_intent():
+    with pytest.raises(ValueError):
+        IntentRouter(examples={"shopping": ["buy a phone"]})
+
+
+def test_confident_decision_skips_the_llm():
+    llm = CountingChatModel(responses=[WEB_SEARCH])
+    router = IntentRouter(confidence_threshold=0.0, llm=llm)
+    decision = router.route("hello there")
+    assert (decision.intent, decision.source) == (ANSWER, "classifier")
+    assert llm.calls == 0
+    assert router.decisions == {"classifier": 1, "llm": 0}
+
+
+def test_low_confidence_falls_back_to_the_llm():
+    llm = CountingChatModel(responses=[WEB_SEARCH])
+    router = IntentRouter(confidence_threshold=1.01, llm=llm)
+    decision = router.route("hello there")
+    assert (decision.intent, decision.source, decision.confidence) == (WEB_SEARCH, "llm", 1.0)
+    assert llm.calls == 1
+    assert router.decisions == {"classifier": 0, "llm": 1}
+
+
+def test_async_low_confidence_falls_back_to_the_llm():
+    llm = CountingChatModel(responses=[RETRIEVE])
+    router = IntentRouter(confidence_threshold=1.01, llm=llm)
+    decision = asyncio.run(router.aroute("hello there"))
+    assert (decision.intent, decision.source) == (RETRIEVE, "llm")
+    assert llm.calls == 1
+
+
+def test_without_llm_low_confidence_keeps_the_classifier():
+    router = IntentRouter(confidence_threshold=1.01)
+    assert router.route("hello there").source == "classifier"
+
+
+def test_llm_failure_keeps_the_classifier():
+    class FailingChatModel(FakeListChatModel):
+        def _call(self, *args, **kwargs):
+            raise RuntimeError("provider down")
+
+    router = IntentRouter(confidence_threshold=1.01, llm=FailingChatModel(responses=[""]))
+    decision = router.route("hello there")
+    assert (decision.intent, decision.source) == (ANSWER, "classifier")
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ("retrieve", RETRIEVE),
+        ("  Web_Search\n", WEB_SEARCH),
+        ("web search", WEB_SEARCH),
+        ("Label: answer", ANSWER),
+        ("ANSWER.", ANSWER),
+    ],
+)
+def test_parse_label(router, output, expected):
+    fallback = router.classify("hello there")
+    decision = router._parse_label(output, fallback)
+    assert (decision.intent, decision.source) == (expected, "llm")
+    assert decision.scores == fallback.scores
+
+
+@pytest.mark.parametrize("output", ["", None, "I am not sure", "shopping"])
+def test_unparseable_label_keeps_the_classifier_decision(router, output):
+    fallback = router.classify("hello there")
+    assert router._parse_label(output, fallback) is fallback
+
+
+def test_llm_fallback_stream_events_carry_the_router_tag():
+    # AgenticRAG.astream (web-search workflow) drops chat model tokens tagged this way
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content="web_search")]))
+    router = IntentRouter(confidence_threshold=1.01, llm=llm)
+    node = RunnableLambda(router.aroute)
+
+    async def collect():
+        return [event async for event in node.astream_events("hello there", version="v2")]
+
+    streamed = [e for e in asyncio.run(collect()) if e["event"] == "on_chat_model_stream"]
+    assert streamed
+    assert all(INTENT_ROUTER_TAG in e["tags"] for e in streamed)
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from prod_assistant.retriever.local_vector_store import LocalVectorStore
+from prod_assistant.utils.semantic_cache import mark_catalog_updated
+
+
+class HashEmbeddings(Embeddings):
+    def _vector(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:16]]
+
+    def embed_documents(self, texts):
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def top(store, text):
+    return store.similarity_search(text, k=1)[0].page_content
+
+
+def test_writes_append_and_reopen(tmp_path):
+    store = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    store.add_texts(["a", "b"], [{"n": 1}, {"n": 2}], ids=["1", "2"])
+    docstore_size = os.path.getsize(tmp_path / LocalVectorStore.DOCSTORE_FILE)
+    store.add_texts(["c"], ids=["3"])
+    store.add_texts(["a2"], [{"n": 9}], ids=["1"])  # upsert rewrites row 0 in place
+
+    # Earlier lines are never rewritten, and the vectors file holds one row per id
+    with open(tmp_path / LocalVectorStore.DOCSTORE_FILE, "rb") as f:
+        assert len(f.read(docstore_size).splitlines()) == 3
+    assert os.path.getsize(tmp_path / LocalVectorStore.VECTORS_FILE) == 3 * 16 * 4
+
+    reopened = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    assert reopened._ids == ["1", "2", "3"]
+    assert reopened.get_by_ids(["1"])[0].page_content == "a2"
+    assert reopened.get_by_ids(["1"])[0].metadata == {"n": 9}
+    assert top(reopened, "a2") == "a2"
+    np.testing.assert_allclose(np.asarray(reopened._vectors), np.asarray(store._vectors))
+
+
+def test_delete_compacts(tmp_path):
+    store = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    store.add_texts(["a", "b", "c"], ids=["1", "2", "3"])
+    store.delete(["2"])
+    store.add_texts(["d"], ids=["4"])
+
+    reopened = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    assert reopened._ids == ["1", "3", "4"]
+    assert top(reopened, "c") == "c"
+    assert top(reopened, "d") == "d"
+
+
+def test_uncommitted_tail_is_ignored(tmp_path):
+    store = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    store.add_texts(["a", "b"], ids=["1", "2"])
+    with open(tmp_path / LocalVectorStore.DOCSTORE_FILE, "ab") as f:
+        f.write(b'{"row": 2, "id": "3", "te')  # crash mid-write
+
+    reopened = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    assert reopened._ids == ["1", "2"]
+
+
+def test_reader_reloads_when_catalog_version_changes(tmp_path):
+    version_file = str(tmp_path / ".catalog_version")
+    index = str(tmp_path / "index")
+    writer = LocalVectorStore(HashEmbeddings(), path=index)
+    writer.add_texts(["a"], ids=["1"])
+    reader = LocalVectorStore(HashEmbeddings(), path=index, catalog_version_file=version_file)
+
+    writer.add_texts(["b"], ids=["2"])
+    assert len(reader.similarity_search("b", k=5)) == 1  # not visible until the version is bumped
+
+    mark_catalog_updated(version_file)
+    assert top(reader, "b") == "b"
+
+    writer.delete(["1"])
+    mark_catalog_updated(version_file)
+    assert [d.page_content for d in reader.similarity_search("a", k=5)] == ["b"]
+
+
+def test_legacy_files_are_converted(tmp_path):
+    vectors = np.asarray(HashEmbeddings().embed_documents(["a", "b"]), dtype=np.float32)
+    np.save(tmp_path / "vectors.npy", vectors / np.linalg.norm(vectors, axis=1, keepdims=True))
+    with open(tmp_path / "docstore.json", "w", encoding="utf-8") as f:
+        json.dump({"ids": ["1", "2"], "texts": ["a", "b"], "metadatas": [{}, {}]}, f)
+
+    store = LocalVectorStore(HashEmbeddings(), path=str(tmp_path))
+    assert store._ids == ["1", "2"]
+    assert top(store, "b") == "b"
+    assert (tmp_path / LocalVectorStore.DOCSTORE_FILE).exists()
+
+
+def test_in_memory_store_grows_and_deletes():
+    store = LocalVectorStore(HashEmbeddings())
+    for i in range(100):
+        store.add_texts([f"t{i}"], ids=[str(i)])
+    store.delete(["7"])
+    assert len(store) == 99
+    assert store._vectors.shape == (99, 16)
+    assert top(store, "t42") == "t42"
@@ -0,0 +1,51 @@
+import pytest
+
+from retriever.metadata_filter import parse_query_filter
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("Can you suggest a good budget phone under 30,000 INR?", {"price_value": {"$lte": 30000.0}}),
+        ("headphones under 5000 rs", {"price_value": {"$lte": 5000.0}}),
+        ("laptop below ₹55,000", {"price_value": {"$lte": 55000.0}}),
+        ("phones under 50k", {"price_value": {"$lte": 50000.0}}),
+        ("tv above 1.2 lakh", {"price_value": {"$gte": 120000.0}}),
+        ("phone price under 20000", {"price_value": {"$lte": 20000.0}}),
+        ("earbuds that cost more than 1500", {"price_value": {"$gte": 1500.0}}),
+        ("best phone between 20k and 40k", {"price_value": {"$gte": 20000.0, "$lte": 40000.0}}),
+        ("phones between ₹20,000 and 30,000", {"price_value": {"$gte": 20000.0, "$lte": 30000.0}}),
+        ("phones under 1,00,000 INR rated 4+",
+         {"price_value": {"$lte": 100000.0}, "rating_value": {"$gte": 4.0}}),
+        ("laptop below ₹55,000 with rating above 4",
+         {"price_value": {"$lte": 55000.0}, "rating_value": {"$gte": 4.0}}),
+        ("phones with up to 512 GB storage under 30k", {"price_value": {"$lte": 30000.0}}),
+    ],
+)
+def test_price_constraints(query, expected):
+    assert parse_query_filter(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "iphone 15 pro max 256 gb price",
+        "phones with up to 512 GB storage",
+        "buds with up to 300 mAh battery",
+        "laptop over 200 MP camera",
+        "tv above 100 inches",
+        "tv price above 55 in",
+        'monitor price over 27"',
+        "gaming monitor above 144 Hz",
+        "phones between 6 and 8 gb ram",
+        "phones under 30000",
+        "warranty under 2 years",
+        "what do reviews say about the samsung galaxy s24",
+    ],
+)
+def test_specs_and_bare_numbers_are_not_prices(query):
+    assert parse_query_filter(query) is None
+
+
+def test_spec_does_not_hide_the_rating():
+    assert parse_query_filter("phone with 5000 mAh battery rated 4.5+") == {"rating_value": {"$gte": 4.5}}
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from workflow.relevance import EMPTY_CONTEXTS, GENERATOR, REWRITER, RelevanceGrader
+
+
+def context(*docs) -> str:
+    """Formatted like the workflows' _format_docs: (title, reviews, relevance or None) per doc."""
+    chunks = []
+    for title, reviews, relevance in docs:
+        chunks.append(
+            f"Title: {title}\nPrice: ₹24,999\nRating: 4.3\n"
+            + (f"Relevance: {relevance}\n" if relevance is not None else "")
+            + f"Reviews:\n{reviews}"
+        )
+    return "\n\n---\n\n".join(chunks)
+
+
+PHONE = ("Samsung Galaxy S24", "great camera, decent battery", None)
+
+
+class LLMGrade:
+    """Stand-in LLM grader that records whether it was asked."""
+
+    def __init__(self, route: str = GENERATOR):
+        self.route = route
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.route
+
+    async def acall(self) -> str:
+        return self()
+
+
+@pytest.fixture
+def grader():
+    return RelevanceGrader(accept_threshold=0.70, reject_threshold=0.30, similarity_weight=0.6)
+
+
+@pytest.mark.parametrize(
+    "question, relevance, route, score",
+    [
+        # 0.6 * similarity + 0.4 * lexical coverage
+        ("samsung galaxy camera", 0.9, GENERATOR, 0.94),
+        ("front load washing machine", 0.2, REWRITER, 0.12),
+        ("samsung washing machine", 0.5, None, 0.4333),
+        ("samsung galaxy battery", 0.4, None, 0.64),
+    ],
+)
+def test_similarity_and_lexical_bands(grader, question, relevance, route, score):
+    decision = grader.score(question, context(PHONE[:2] + (relevance,)))
+    assert (decision.route, decision.score, decision.similarity) == (route, score, relevance)
+
+
+@pytest.mark.parametrize(
+    "question, route, lexical",
+    [
+        ("samsung galaxy camera", GENERATOR, 1.0),
+        ("samsung washing machine", None, 0.3333),
+        ("galaxy tablet", None, 0.5),
+        ("front load washing machine", REWRITER, 0.0),
+    ],
+)
+def test_lexical_only_when_docs_carry_no_relevance(grader, question, route, lexical):
+    decision = grader.score(question, context(PHONE))
+    assert decision.similarity is None
+    assert (decision.route, decision.score, decision.lexical) == (route, lexical, lexical)
+
+
+def test_best_similarity_in_the_context_counts(grader):
+    docs = context(("Redmi Note 13", "ok", 0.31), ("Samsung Galaxy S24", "great camera", 0.88))
+    assert grader.score("anything else", docs).similarity == 0.88
+
+
+def test_stopwords_budget_amounts_and_plurals_are_ignored(grader):
+    # "best", "under", "30000" are not content words; "phones" matches "phone"
+    docs = context(("Samsung Galaxy phone", "good", None))
+    assert grader.score("best samsung phones under 30000", docs).lexical == 1.0
+
+
+@pytest.mark.parametrize("relevance, route", [(0.70, GENERATOR), (0.30, REWRITER), (0.69, None), (0.31, None)])
+def test_thresholds_are_inclusive(relevance, route):
+    grader = RelevanceGrader(accept_threshold=0.70, reject_threshold=0.30, similarity_weight=1.0)
+    assert grader.score("samsung", context(PHONE[:2] + (relevance,))).route == route
+
+
+@pytest.mark.parametrize("docs", list(EMPTY_CONTEXTS) + ["", "   ", "Error invoking retriever: timeout", None])
+def test_empty_context_short_circuits_to_rewriter(grader, docs):
+    decision = grader.score("samsung galaxy camera", docs)
+    assert (decision.route, decision.score, decision.similarity) == (REWRITER, 0.0, None)
+
+
+@pytest.mark.parametrize(
+    "question, relevance, expected, llm_calls",
+    [
+        ("samsung galaxy camera", 0.9, GENERATOR, 0),
+        ("front load washing machine", 0.2, REWRITER, 0),
+        ("samsung washing machine", 0.5, REWRITER, 1),  # ambiguous: the LLM decides
+    ],
+)
+def test_llm_is_called_only_in_the_ambiguous_band(grader, question, relevance, expected, llm_calls):
+    llm = LLMGrade(REWRITER)
+    docs = context(PHONE[:2] + (relevance,))
+
+    assert grader.grade(question, docs, llm) == expected
+    assert llm.calls == llm_calls
+    assert asyncio.run(grader.agrade(question, docs, llm.acall)) == expected
+    assert llm.calls == 2 * llm_calls
+
+
+def test_disabled_grader_always_asks_the_llm():
+    grader = RelevanceGrader(enabled=False)
+    llm = LLMGrade(REWRITER)
+    assert grader.grade("samsung galaxy camera", context(PHONE[:2] + (0.95,)), llm) == REWRITER
+    assert llm.calls == 1
+    assert grader.stats()["llm"] == 1
+
+
+def test_stats_count_routes_and_saved_llm_time(grader):
+    llm = LLMGrade(GENERATOR)
+    grader.grade("samsung washing machine", context(PHONE[:2] + (0.5,)), llm)
+    assert grader.llm_seconds is not None
+
+    grader.grade("samsung galaxy camera", context(PHONE[:2] + (0.9,)), llm)
+    grader.grade("front load washing machine", context(PHONE[:2] + (0.2,)), llm)
+
+    stats = grader.stats()
+    assert (stats[GENERATOR], stats[REWRITER], stats["llm"]) == (1, 1, 1)
+    assert stats["saved_seconds"] == round(2 * grader.llm_seconds, 3)
@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import re
+from typing import List
+
+import numpy as np
+import pytest
+
+from prod_assistant.utils import semantic_cache
+from prod_assistant.utils.semantic_cache import SemanticCache, mark_catalog_updated
+
+STOP_WORDS = {"the", "of", "a", "what", "is", "whats", "s", "me", "show"}
+
+
+class WordEmbeddings:
+    """
+    Hashed bag of words over the alphabetic tokens only, so queries that
+    differ in a number ("iphone 15" / "iphone 16") embed identically: the
+    worst case for a cosine-only cache.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.calls = 0
+
+    async def aembed_query(self, text: str) -> List[float]:
+        self.calls += 1
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in re.findall(r"[a-z]+", text.lower()):
+            if word not in STOP_WORDS:
+                vector[int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % self.dim] += 1.0
+        return vector.tolist()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(semantic_cache, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def version_file(tmp_path):
+    return str(tmp_path / ".catalog_version")
+
+
+@pytest.fixture
+def cache(clock, version_file):
+    return SemanticCache(WordEmbeddings(), similarity_threshold=0.92, ttl_seconds=60, max_entries=3,
+                         catalog_version_file=version_file)
+
+
+def put(cache, query, answer):
+    asyncio.run(cache.aput(query, answer))
+
+
+def get(cache, query):
+    return asyncio.run(cache.aget(query))
+
+
+def test_exact_and_paraphrased_queries_hit(cache):
+    put(cache, "price of iPhone 15", "iphone 15 answer")
+    assert get(cache, "Price of iPhone 15?") == "iphone 15 answer"
+    assert get(cache, "what's the price of the iphone 15") == "iphone 15 answer"
+    assert cache.stats()["hits"] == 2
+
+
+def test_unrelated_query_misses(cache):
+    put(cache, "price of iPhone 15", "iphone 15 answer")
+    assert get(cache, "best noise cancelling headphones") is None
+    assert cache.stats()["mismatches"] == 0
+
+
+@pytest.mark.parametrize(
+    "cached, asked",
+    [
+        ("price of iPhone 15", "price of iPhone 16"),
+        ("price of iPhone 15", "price of iPhone 15 Pro"),
+        ("price of iPhone 15 Pro", "price of iPhone 15 Pro Max"),
+        ("samsung galaxy s23 reviews", "samsung galaxy s24 reviews"),
+        ("phones under 30k", "phones under 50k"),
+        ("phones under 30k", "phones above 30k"),
+        ("laptops rated 4+", "laptops rated 3+"),
+        ("headphones under ₹5,000", "headphones under ₹2,000"),
+    ],
+)
+def test_numeric_and_model_near_misses_do_not_hit(cache, cached, asked):
+    # Low threshold, so every pair is a cosine candidate and only the signature check decides
+    cache.similarity_threshold = 0.4
+    put(cache, cached, "cached answer")
+    assert get(cache, asked) is None
+    assert cache.stats()["mismatches"] == 1
+
+
+def test_best_matching_signature_wins(cache):
+    put(cache, "price of iPhone 15", "iphone 15 answer")
+    put(cache, "price of iPhone 16", "iphone 16 answer")
+    assert get(cache, "price of the iPhone 16") == "iphone 16 answer"
+    assert get(cache, "price of the iPhone 15") == "iphone 15 answer"
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    put(cache, "price of iPhone 15", "iphone 15 answer")
+    clock.now += 59
+    assert get(cache, "price of iPhone 15") == "iphone 15 answer"
+    clock.now += 2
+    assert get(cache, "price of iPhone 15") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    put(cache, "phones with good battery", "battery")
+    put(cache, "phones with good camera", "camera")
+    put(cache, "phones with good display", "display")
+    assert get(cache, "phones with good battery") == "battery"  # now most recently used
+
+    put(cache, "phones with good speakers", "speakers")
+    assert cache.stats()["evictions"] == 1
+    assert get(cache, "phones with good camera") is None
+    assert get(cache, "phones with good battery") == "battery"
+    assert get(cache, "phones with good speakers") == "speakers"
+
+
+def test_catalog_update_invalidates_everything(cache, version_file):
+    put(cache, "price of iPhone 15", "old price")
+    assert get(cache, "price of iPhone 15") == "old price"
+
+    mark_catalog_updated(version_file)
+    assert get(cache, "price of iPhone 15") is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["entries"] == 0
+
+    put(cache, "price of iPhone 15", "new price")
+    assert get(cache, "price of iPhone 15") == "new price"
+
+
+def test_signature_covers_numbers_variants_and_constraints():
+    tokens, constraint = SemanticCache._signature("iPhone 15 Pro 256GB under ₹1,20,000")
+    assert tokens == frozenset({"15", "pro", "256gb", "120000"})
+    assert constraint == {"price_value": {"$lte": 120000.0}}
+    assert SemanticCache._signature("good phone for photos") == (frozenset(), None)
@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from workflow.agentic_workflow_with_mcp_websearch import AgenticRAG
+
+QUERY = "what is the price of the samsung galaxy s24"
+PRODUCT = "Title: Samsung Galaxy S24\nPrice: ₹74,999\nRating: 4.5\nReviews:\ngreat camera"
+
+
+class StubChatModel(BaseChatModel):
+    """Grades with ``grade``, echoes the context it answers from."""
+
+    grade: str = "no"
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        text = messages[-1].content
+        answer = self.grade if "You are a grader" in text else f"answer from: {text[-200:]}"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer))])
+
+
+class StubTool:
+    def __init__(self, name: str, result: str = "", delay: float = 0.0, error: Exception = None):
+        self.name = name
+        self.result = result
+        self.delay = delay
+        self.error = error
+
+    async def ainvoke(self, payload: dict) -> str:
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class StubRetriever:
+    vstore = object()
+
+    def load_retriever(self):
+        return None
+
+
+def make_engine(web_search: StubTool, grade: str = "no") -> AgenticRAG:
+    engine = AgenticRAG(
+        llm=StubChatModel(grade=grade),
+        retriever_obj=StubRetriever(),
+        mcp_tools=[StubTool("get_product_info", PRODUCT, delay=0.05), web_search],
+        speculative_search=True,
+        latency_budget=2.0,
+    )
+    # Every grade must reach the stub LLM
+    engine.relevance_grader.enabled = False
+    return engine
+
+
+def run(engine: AgenticRAG) -> str:
+    return asyncio.run(engine.run(QUERY, thread_id=uuid.uuid4().hex))
+
+
+def test_speculative_result_is_used_when_docs_are_rejected():
+    engine = make_engine(StubTool("web_search", "web: s24 price dropped"))
+    assert "web: s24 price dropped" in run(engine)
+    assert engine.speculation_stats["used"] == 1
+
+
+@pytest.mark.parametrize("error", [ConnectionError("MCP session closed"), RuntimeError("ddgs rate limited")])
+def test_failed_speculative_search_falls_back_instead_of_failing_the_run(error):
+    engine = make_engine(StubTool("web_search", error=error))
+    assert "No data from web" in run(engine)
+    assert engine.speculation_stats["failed"] == 1
+    assert engine.speculation_stats["used"] == 0
+
+
+def test_accepted_docs_cancel_an_in_flight_search():
+    engine = make_engine(StubTool("web_search", "late", delay=5), grade="yes")
+    assert "Samsung Galaxy S24" in run(engine)
+    assert (engine.speculation_stats["cancelled"], engine.speculation_stats["unused"]) == (1, 0)
+
+
+def test_finished_but_unneeded_search_is_not_counted_as_cancelled():
+    engine = make_engine(StubTool("web_search", "early"), grade="yes")
+    assert "Samsung Galaxy S24" in run(engine)
+    assert (engine.speculation_stats["cancelled"], engine.speculation_stats["unused"]) == (0, 1)
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+import types
+
+import pytest
+
+from prod_assistant.mcp_servers import tool_executor
+from prod_assistant.mcp_servers.tool_executor import ToolExecutor
+
+
+@pytest.fixture(params=["asyncio.timeout", "py310 fallback"])
+def acquire_path(request, monkeypatch):
+    """Run each test through both _acquire implementations."""
+    if request.param == "py310 fallback":
+        monkeypatch.setattr(tool_executor, "sys", types.SimpleNamespace(version_info=(3, 10)))
+    return request.param
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(max_workers=8, limits={"slow": {"max_concurrency": 2, "timeout_seconds": 0.3}})
+    yield executor
+    executor.shutdown()
+
+
+class Work:
+    """Blocking tool body that records its peak concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, seconds: float) -> float:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(seconds)
+        with self.lock:
+            self.active -= 1
+        return seconds
+
+
+def permits(executor, tool: str) -> int:
+    return executor._semaphores[tool]._value
+
+
+def test_concurrency_limit_bounds_running_bodies(executor, acquire_path):
+    work = Work()
+
+    async def scenario():
+        return await asyncio.gather(*(executor.run("slow", work, 0.02) for _ in range(8)))
+
+    assert asyncio.run(scenario()) == [0.02] * 8
+    assert work.peak == 2
+    assert permits(executor, "slow") == 2
+    assert executor.stats()["slow"] == {"calls": 8, "timeouts": 0, "errors": 0}
+
+
+def test_waiting_for_a_slot_times_out_without_losing_permits(executor, acquire_path):
+    work = Work()
+
+    async def scenario():
+        holders = [asyncio.create_task(executor.run("slow", work, 0.5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(asyncio.TimeoutError, match="waiting for a free slot"):
+            await executor.run("slow", work, 0.01)
+        await asyncio.gather(*holders, return_exceptions=True)
+        # Let the worker threads finish and hand their slots back
+        while work.active:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        return permits(executor, "slow")
+
+    assert asyncio.run(scenario()) == 2
+    assert executor.stats()["slow"]["timeouts"] >= 1
+
+
+def test_running_body_times_out_but_keeps_its_slot_until_done(executor, acquire_path):
+    work = Work()
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError, match=r"slow timed out after 0.3s$"):
+            await executor.run("slow", work, 0.6)
+        held = permits(executor, "slow")  # the thread is still running
+        while work.active:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        return held, permits(executor, "slow")
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_errors_are_counted_and_raised(executor, acquire_path):
+    def broken():
+        raise ValueError("bad query")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await executor.run("other", broken)
+        return permits(executor, "other")
+
+    assert asyncio.run(scenario()) == executor.default_concurrency
+    assert executor.stats()["other"] == {"calls": 1, "timeouts": 0, "errors": 1}
+
+
+def test_permit_released_as_the_timeout_fires_is_not_lost(acquire_path):
+    async def scenario():
+        semaphore = asyncio.Semaphore(1)
+        loop = asyncio.get_running_loop()
+        for _ in range(200):
+            await semaphore.acquire()
+            # Release right around the waiter's deadline
+            loop.call_later(0.002, semaphore.release)
+            if await ToolExecutor._acquire(semaphore, 0.002):
+                semaphore.release()
+            await asyncio.sleep(0.003)
+        return semaphore._value
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_cancelled_waiter_returns_a_permit_won_in_the_same_tick(acquire_path):
+    async def scenario():
+        semaphore = asyncio.Semaphore(1)
+        await semaphore.acquire()
+        waiter = asyncio.create_task(ToolExecutor._acquire(semaphore, 5))
+        await asyncio.sleep(0.01)
+        semaphore.release()
+        waiter.cancel()
+        try:
+            if await waiter:
+                semaphore.release()
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(0.01)
+        return semaphore._value
+
+    assert asyncio.run(scenario()) == 1